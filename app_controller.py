@@ -1,14 +1,12 @@
 import sys
 import threading
-import json
 import os
 import shutil
-import markdown
 import re
 import webbrowser
-import requests
 from bs4 import BeautifulSoup
 import hashlib
+import uuid
 from PyQt5.QtWidgets import QApplication, QMessageBox, QMenu, QDesktopWidget, QInputDialog
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer, Qt, QUrl, QByteArray
 from PyQt5.QtGui import QDesktopServices, QFont, QIcon
@@ -18,18 +16,31 @@ from pystray import Icon as pystray_icon, Menu as pystray_menu, MenuItem as pyst
 from PIL import Image
 from core import google_api_handler, config_manager
 from core.config_manager import load_series_cache, save_series_cache
+from core.save_queue import SaveQueue
+from core.memo_store import MemoStore
+from core.memo_index import MemoIndex
+from core.sync_engine import SyncEngine
+from core.task_index import TaskIndex
+from core.deadline_scheduler import DeadlineScheduler, task_id_of
+from core.preview_engine import PreviewEngine
+from core.image_downloader import ImageDownloader, PLACEHOLDER_SRC
+from core.search_index import SearchIndex
+from core.link_index import LinkIndex
+from core.graph_layout import GraphLayout
+from core.launcher_matcher import LauncherMatcher
+from core.series_index import SeriesIndex
+from core import html_renderer, content_cache
 from core.utils import resource_path
 from app_windows import (MarkdownEditorWindow, MemoListWindow, SettingsWindow, RichMemoViewWindow,
                         QuickLauncherWindow, TodoDashboardWindow, TodoItemWidget, CustomNotificationWindow,
                         ToastNotificationWindow,KnowledgeGraphWindow)
-import qtawesome as qta
 from datetime import datetime, time
 from pyvis.network import Network
-import networkx as nx
 import http.server
 import socketserver
 import threading
 import functools
+import concurrent.futures
 
 import colorsys
 
@@ -41,8 +52,12 @@ class SignalEmitter(QObject):
     show_quick_launcher = pyqtSignal()
     show_edit_memo = pyqtSignal(str, str, str, str)
     show_rich_view = pyqtSignal(str, str, str, dict)
-    list_data_loaded = pyqtSignal(list, bool, dict)
-    nav_tree_updated = pyqtSignal(set, list)
+    list_data_loaded = pyqtSignal(list, bool, object)
+    search_fallback_ready = pyqtSignal(int, str, list) # 검색 세대, 검색어, Drive 검색으로 보충한 행
+    memo_row_changed = pyqtSignal(str) # 목록에 보이는 메모 한 건의 제목/태그/날짜가 바뀜
+    nav_tree_updated = pyqtSignal(dict, int)
+    memo_changes_applied = pyqtSignal(list)
+    image_localized = pyqtSignal(str, str, str)  # doc_id, 원격 URL, 로컬 file:// URL (실패 시 빈 문자열)
     status_update = pyqtSignal(str, int)
     persistent_notification = pyqtSignal(str, str, str)  # For persistent notifications like deadlines
     toast_notification = pyqtSignal(str, str)  # For temporary notifications like save/update
@@ -50,11 +65,22 @@ class SignalEmitter(QObject):
     auto_save_status_update = pyqtSignal(str)
     todo_list_updated = pyqtSignal(list)
     sync_finished_update_list = pyqtSignal()
-    tasks_data_loaded = pyqtSignal(dict)
+    tasks_data_loaded = pyqtSignal(list)
     toggle_todo_dashboard_signal = pyqtSignal()
     graph_data_generated = pyqtSignal(dict)
+    save_queue_stats_updated = pyqtSignal(int, float)
+    launcher_matcher_built = pyqtSignal(object, object) # (인덱스 버전, 즐겨찾기) 키, LauncherMatcher
 
 class AppController:
+    @property
+    def local_cache(self):
+        return self.memo_index.rows
+
+    @local_cache.setter
+    def local_cache(self, rows):
+        # 목록을 통째로 바꾸면 인덱스도 다시 만듦
+        self.memo_index.reset(rows)
+
     def __init__(self, app):
         self.app = app
         self.emitter = SignalEmitter()
@@ -86,54 +112,91 @@ class AppController:
         self.notification_queue = []
         self.is_notification_active = False
 
-        self.local_cache = []
+        self.cache_lock = threading.RLock()
+        self.memo_index = MemoIndex(self.cache_lock) # local_cache 행과 doc_id/제목/태그 인덱스
+        self.memo_list.table_model.row_lookup = self.memo_index.get
+        self.memo_store = MemoStore()
+        self.cache_ready = threading.Event() # 저장소의 전체 목록이 메모리에 올라왔는지 여부
+        self.sync_engine = SyncEngine()
+        self.sync_lock = threading.Lock() # 동기화는 한 번에 하나만 (변경 토큰 공유)
+        self.series_lock = threading.Lock() # 시리즈 캐시 변경은 한 번에 하나만
         self.all_tags = set()
         
         self.tag_colors = {}
         self.current_viewing_doc_id = None
         self.current_editing_doc_id = None
-        self.current_page_token = None
-        self.next_page_token = None
-        self.prev_page_tokens = []
+        self.search_results = [] # 본문 검색 결과 행 (순위순)
+        self.search_query = None
+        self.search_generation = 0 # 검색을 새로 하거나 본문 검색을 벗어날 때마다 증가 (늦게 온 Drive 결과 무시용)
         
-        # 로컬 캐시 페이징 관련 변수들
+        # 시작할 때 먼저 읽어 보여 줄 행 수 (나머지는 백그라운드에서 채움)
         try:
             self.local_page_size = int(config_manager.get_setting('Display', 'local_page_size'))
         except (ValueError, TypeError):
             self.local_page_size = 20  # 기본값
-        self.current_local_page = 1
-        self.total_local_pages = 1
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
-        self.search_timer.timeout.connect(self.perform_search)
+        self.search_timer.timeout.connect(self.perform_fallback_search)
         self.icon = None
         self.launcher_mode = 'memos'
         self.is_loading_tasks = False
-        self.cache_lock = threading.Lock()
-        self.series_cache = {}
+        self.series_cache = SeriesIndex()
+
+        # 콘텐츠 캐시(.txt/.html/메타/이미지)는 모두 이 관리자를 거쳐 읽고 씀 (크기 예산 + LRU 정리)
+        self.content_cache = content_cache.get_content_cache()
+
+        # 본문 검색: .txt 캐시로 만든 로컬 역색인. 캐시가 바뀔 때마다 해당 문서만 다시 색인
+        self.search_index = SearchIndex()
+        # 위키 링크 색인 (지식 그래프와 역링크 패널). 같은 .txt 변경 알림으로 바뀐 문서만 다시 파싱
+        self.link_index = LinkIndex()
+        self.graph_layout = GraphLayout() # 그래프 노드 좌표 캐시 (바뀐 노드 주변만 다시 배치)
+        self.content_cache.add_listener(self._on_content_text_changed)
+        threading.Thread(target=self.build_search_index_thread, daemon=True).start()
+
+        # 본문 이미지 다운로드 (연결 재사용, 동시 다운로드 수 제한, 같은 URL은 한 번만)
+        self.image_downloader = ImageDownloader(self.content_cache)
+
+        # 편집기 미리보기: 바뀐 블록만 다시 그려 DOM을 패치
+        self.preview_engine = PreviewEngine(self.memo_index.id_for_title)
+        self.preview_page_loading = False
+
+        # 빠른 실행 창 제목 검색기. 메모 목록이나 즐겨찾기가 바뀐 뒤 처음 검색할 때 다시 만듦
+        self.launcher_matcher = LauncherMatcher()
+        self.launcher_matcher_key = None
+        self.launcher_matcher_pending_key = None # 백그라운드에서 만들고 있는 검색기의 키
 
         self.all_tasks = []
+        self.task_index = TaskIndex() # doc_id -> 추출된 할 일 (본문 해시 기준으로만 다시 파싱)
         self.show_completed_tasks = False
         self.notified_tasks = config_manager.load_notified_tasks()
+        # 다음 마감 알림 시각에 한 번만 울리는 타이머 (분 단위 전체 검사 대신)
+        self.deadline_scheduler = DeadlineScheduler(self.notified_tasks)
         self.notification_timer = QTimer()
+        self.notification_timer.setSingleShot(True)
 
         self.auto_save_timer = QTimer()
         self.auto_save_timer.setSingleShot(True)
         self.auto_save_interval_ms = 3000
+        # 문서별 쓰기 지연 저장 큐 (문서당 동시에 하나의 저장만 실행)
+        self.save_queue = SaveQueue(self._run_save_job, on_stats_changed=self._on_save_queue_stats)
+        self.new_memo_key = "new"
+        self.last_saved_meta = {} # doc_id -> (제목, 태그): 마지막으로 저장/로드한 메타데이터
 
         self.connect_signals_and_slots()
         self.load_cache_only(initial_load=True)
         self.setup_hotkeys()
         self.setup_tray_icon()
 
-        self.notification_timer.start(60000) 
+        # 지난번에 색인한 할 일로 알림 대기열을 미리 채움 (대시보드를 열지 않아도 알림)
+        self.deadline_scheduler.set_tasks(self.task_index.all_tasks())
+        self.arm_deadline_timer()
         QTimer.singleShot(2000, self.start_initial_sync)
 
         self.favorites = []
         self.load_favorites()
 
-        self.series_cache = load_series_cache()
-        QTimer.singleShot(3000, self.rebuild_series_cache_if_needed) # 3초 후 실행
+        self.series_cache = SeriesIndex(load_series_cache())
+        QTimer.singleShot(3000, self.update_series_cache_async) # 3초 후 실행 (바뀐 MOC만 다시 파싱)
 
     def connect_signals_and_slots(self):
         self.emitter.show_new_memo.connect(self.show_new_memo_window, Qt.QueuedConnection)
@@ -141,40 +204,45 @@ class AppController:
         self.emitter.show_settings.connect(self.show_settings_window, Qt.QueuedConnection)
         self.emitter.show_quick_launcher.connect(self.toggle_quick_launcher, Qt.QueuedConnection)
         self.emitter.list_data_loaded.connect(self.memo_list.populate_table, Qt.QueuedConnection)
+        self.emitter.search_fallback_ready.connect(self.on_search_fallback_ready, Qt.QueuedConnection)
+        self.emitter.launcher_matcher_built.connect(self.on_launcher_matcher_built, Qt.QueuedConnection)
+        self.emitter.memo_row_changed.connect(self.on_memo_row_changed, Qt.QueuedConnection)
         self.emitter.nav_tree_updated.connect(self.memo_list.update_nav_tree, Qt.QueuedConnection)
         self.emitter.show_edit_memo.connect(self.memo_editor.open_document, Qt.QueuedConnection)
         self.emitter.show_edit_memo.connect(self.open_editor_with_content, Qt.QueuedConnection)
         self.emitter.show_rich_view.connect(self.rich_viewer.set_content, Qt.QueuedConnection)
+        self.emitter.show_rich_view.connect(self.on_rich_view_shown, Qt.QueuedConnection)
+        self.emitter.image_localized.connect(self.rich_viewer.swap_image, Qt.QueuedConnection)
         self.emitter.status_update.connect(self.memo_list.show_status_message, Qt.QueuedConnection)
         self.emitter.persistent_notification.connect(self.show_persistent_notification)
         self.emitter.toast_notification.connect(self.show_toast_notification)
         self.notification_window.view_memo_requested.connect(self.view_memo_from_notification)
         self.notification_window.notification_closed.connect(self.on_notification_closed)
         self.emitter.sync_finished_update_list.connect(self.on_sync_finished_update_list, Qt.QueuedConnection)
+        self.emitter.memo_changes_applied.connect(self.on_memo_changes_applied, Qt.QueuedConnection)
         self.emitter.todo_list_updated.connect(self.todo_dashboard.update_tasks, Qt.QueuedConnection)
         self.emitter.tasks_data_loaded.connect(self.process_loaded_tasks, Qt.QueuedConnection)
         self.emitter.toggle_todo_dashboard_signal.connect(self.toggle_todo_dashboard, Qt.QueuedConnection)
 
         self.todo_dashboard.completion_filter_changed.connect(self.on_completion_filter_changed)
         self.notification_timer.timeout.connect(self.check_task_deadlines)
-        self.search_timer.timeout.connect(self.perform_search)
         self.todo_dashboard.task_toggled.connect(self.on_task_toggled)
         self.todo_dashboard.item_clicked.connect(self.view_memo_by_id)
         self.todo_dashboard.refresh_requested.connect(self.refresh_todo_dashboard)
 
         self.memo_list.search_bar.textChanged.connect(self.on_search_text_changed)
         self.memo_list.full_text_search_check.stateChanged.connect(self.search_mode_changed)
-        self.memo_list.table.itemDoubleClicked.connect(self.view_memo_from_item)
         self.memo_list.memo_selected.connect(self.view_memo_by_id)
         self.memo_list.table.customContextMenuRequested.connect(self.show_context_menu)
-        self.memo_list.prev_button.clicked.connect(self.go_to_prev_page)
-        self.memo_list.next_button.clicked.connect(self.go_to_next_page)
         self.memo_list.refresh_button.clicked.connect(self.start_initial_sync)
         self.memo_list.navigation_selected.connect(self.on_navigation_selected)
         
         self.memo_editor.save_button.clicked.connect(lambda: self.save_memo(is_auto_save=False))
         self.memo_editor.preview_timer.timeout.connect(self.update_editor_preview)
-        self.memo_editor.editor.textChanged.connect(lambda: self.memo_editor.preview_timer.start(500))
+        self.memo_editor.editor.textChanged.connect(self.schedule_editor_preview)
+        self.memo_editor.tag_input.textChanged.connect(self.schedule_editor_preview)
+        self.memo_editor.viewer.loadFinished.connect(self.on_editor_preview_loaded)
+        self.memo_editor.preview_cleared.connect(self.reset_editor_preview)
         
         self.settings.save_button.clicked.connect(self.save_settings)
         self.settings.startup_checkbox.stateChanged.connect(config_manager.set_startup)
@@ -199,6 +267,7 @@ class AppController:
         self.memo_editor.tag_input.textChanged.connect(self.on_editor_text_changed)
         self.auto_save_timer.timeout.connect(lambda: self.save_memo(is_auto_save=True))
         self.emitter.auto_save_status_update.connect(self.memo_editor.update_auto_save_status, Qt.QueuedConnection)
+        self.emitter.save_queue_stats_updated.connect(self.memo_editor.update_save_queue_stats, Qt.QueuedConnection)
         
         # 편집 모드에서 보기 모드로 전환
         self.memo_editor.view_requested.connect(self.view_memo_by_id)
@@ -254,6 +323,13 @@ class AppController:
 
     def exit_app(self):
         self.wakeup_timer.stop()
+        self.image_downloader.shutdown()
+        self.content_cache.save()
+        self.search_index.save()
+        self.link_index.save()
+        stats = self.content_cache.stats()
+        print(f"콘텐츠 캐시: 적중 {stats['hits']} / 실패 {stats['misses']} (적중률 {stats['hit_rate']:.0%}), "
+              f"정리 {stats['evictions']}건, {stats['total_bytes'] / 1024 / 1024:.1f} MB")
         keyboard.unhook_all()
         if self.icon:
             self.icon.stop()
@@ -274,7 +350,10 @@ class AppController:
             self.quick_launcher.show()
             self.quick_launcher.activateWindow()
             self.quick_launcher.search_box.setFocus()
-            self.quick_launcher.search_box.clear()
+            if self.quick_launcher.search_box.text():
+                self.quick_launcher.search_box.clear()
+            else:
+                self.search_for_launcher("")
 
     def search_for_launcher(self, query):
         if query.startswith('#'):
@@ -287,12 +366,43 @@ class AppController:
         else:
             self.launcher_mode = 'memos'
             self.quick_launcher.search_box.setPlaceholderText("메모 검색...")
-            if query:
-                filtered = [row[:3] for row in self.local_cache if query.lower() in row[0].lower()]
-                self.quick_launcher.update_results(filtered)
-            else:
-                results = [row[:3] for row in self.local_cache]
-                self.quick_launcher.update_results(results)
+            self.ensure_launcher_matcher()
+            self.quick_launcher.update_results(self.launcher_matcher.search(query))
+
+    def ensure_launcher_matcher(self):
+        # 제목 2만 개 기준 구성에 수백 ms가 걸리므로, 처음 한 번만 바로 만들고 이후에는 백그라운드에서 다시 만듦.
+        # 새 검색기가 준비될 때까지는 이전 검색기로 검색하고, 준비되면 on_launcher_matcher_built가 결과를 갱신함.
+        key = (self.memo_index.version, frozenset(self.favorites))
+        if key == self.launcher_matcher_key or key == self.launcher_matcher_pending_key:
+            return
+        with self.cache_lock:
+            rows = list(self.local_cache)
+        if self.launcher_matcher_key is None:
+            self.launcher_matcher.build(rows, key[1])
+            self.launcher_matcher_key = key
+            return
+        self.launcher_matcher_pending_key = key
+        threading.Thread(target=self._build_launcher_matcher, args=(key, rows), daemon=True).start()
+
+    def _build_launcher_matcher(self, key, rows):
+        try:
+            matcher = LauncherMatcher(rows, key[1])
+        except Exception as e:
+            print(f"빠른 실행 검색기 구성 실패: {e}")
+            matcher = None
+        self.emitter.launcher_matcher_built.emit(key, matcher)
+
+    def on_launcher_matcher_built(self, key, matcher):
+        # 그 사이 더 새로운 구성이 시작되었으면 그 결과를 기다림
+        if key != self.launcher_matcher_pending_key:
+            return
+        self.launcher_matcher_pending_key = None
+        if matcher is None:
+            return
+        self.launcher_matcher = matcher
+        self.launcher_matcher_key = key
+        if self.quick_launcher.isVisible() and self.launcher_mode == 'memos':
+            self.quick_launcher.update_results(self.launcher_matcher.search(self.quick_launcher.search_box.text()))
 
     def on_sync_finished_update_list(self):
         print("DEBUG: on_sync_finished_update_list 호출됨")
@@ -320,107 +430,219 @@ class AppController:
         threading.Thread(target=self.sync_cache_thread, daemon=True).start()
 
     def sync_cache_thread(self):
-        sheet_data = google_api_handler.load_memo_list()
-        if sheet_data is None:
+        result = self.run_list_sync()
+        if result is None:
             self.emitter.status_update.emit("목록 동기화 실패 (시트 로드 오류)", "error")
             return
+        if result['events']:
+            self.emitter.status_update.emit("동기화 완료.", "success")
+        else:
+            print("DEBUG: sync_cache_thread - local_cache 변경 없음")
+            self.emitter.status_update.emit("이미 최신 상태입니다.", "info")
 
-        # 데이터베이스 유효성 검사: 시트에 있는 ID가 실제 Drive에 존재하는지 확인
-        validated_data = []
-        for row in sheet_data:
-            if len(row) > 2 and row[2]: # ID가 있는지 확인
-                if google_api_handler.check_doc_exists(row[2]):
-                    validated_data.append(row)
-                else:
-                    print(f"[Sync] 구글 시트의 문서 ID({row[2]})가 실제 구글 드라이브에 존재하지 않아 목록에서 제외합니다: {row[0]}")
-            else:
-                 print(f"[Sync] 구글 시트의 행에 문서 ID가 없어 제외합니다: {row}")
+    def run_list_sync(self):
+        """Drive 변경 목록 기반 증분 동기화를 실행하고 바뀐 행만 로컬 목록/저장소에 반영."""
+        self.cache_ready.wait() # 시작 시 나머지 목록 로딩이 끝난 뒤에 비교
+        with self.sync_lock:
+            return self._run_list_sync_locked()
 
+    def _run_list_sync_locked(self):
         with self.cache_lock:
-            if validated_data != self.local_cache:
-                print(f"DEBUG: sync_cache_thread - local_cache 변경됨: {len(self.local_cache)} -> {len(validated_data)}")
-                
-                # 새로 추가된 항목들을 보존하기 위해 기존 local_cache의 ID들을 확인
-                existing_ids = {row[2] for row in self.local_cache if len(row) > 2}
-                validated_ids = {row[2] for row in validated_data if len(row) > 2}
-                
-                # 기존에 있던 항목들 중에서 validated_data에 없는 항목들 (새로 추가된 항목들)
-                new_items = [row for row in self.local_cache if len(row) > 2 and row[2] not in validated_ids]
-                
-                if new_items:
-                    print(f"DEBUG: 새로 추가된 항목 {len(new_items)}개 보존: {[row[0] for row in new_items]}")
-                    # 새로 추가된 항목들을 validated_data 앞에 추가
-                    self.local_cache = new_items + validated_data
-                else:
-                    self.local_cache = validated_data
-                
+            known_rows = {row[2]: list(row) for row in self.local_cache if len(row) > 2}
+        result = self.sync_engine.sync(known_rows)
+        if result is None:
+            return None
+
+        events = result['events']
+        list_events = [event for event in events if event[0] != 'content_changed']
+        with self.cache_lock:
+            if result['full']:
+                # 전체 동기화: 동기화 도중 새로 저장된 메모는 보존하고 시트 순서로 교체
+                validated_ids = {row[2] for row in result['rows']}
+                new_items = [row for row in self.local_cache if len(row) > 2 and row[2] not in known_rows and row[2] not in validated_ids]
+                if list_events or new_items:
+                    self.local_cache = new_items + result['rows']
+                    self.memo_store.replace_all(self.local_cache)
+            else:
+                for event in list_events:
+                    if event[0] == 'added':
+                        if self.memo_index.insert(event[1], at_top=True):
+                            self.memo_store.upsert(event[1], at_top=True)
+                    elif event[0] == 'updated':
+                        row = event[1]
+                        updated_row = self.memo_index.update(row[2], title=row[0], date=row[1], tags=row[3])
+                        if updated_row:
+                            self.memo_store.upsert(updated_row)
+                    elif event[0] == 'deleted':
+                        self.memo_index.remove(event[1])
+                        self.memo_store.delete(event[1])
+            if list_events:
                 self.update_tags_from_cache()
-                try:
-                    with open(config_manager.CACHE_FILE, 'w', encoding='utf-8') as f:
-                        json.dump(self.local_cache, f, ensure_ascii=False, indent=4)
-                except IOError:
-                    pass
-                
-                self.emitter.nav_tree_updated.emit(self.all_tags, self.local_cache)
-                self.emitter.sync_finished_update_list.emit()
-                self.emitter.status_update.emit("동기화 완료.", "success")
-                self.rebuild_series_cache_if_needed() # 시리즈 캐시 업데이트
+
+        for event in events:
+            if event[0] == 'deleted':
+                self._invalidate_content_cache(event[1])
+            elif event[0] == 'content_changed' and not self._is_own_write(event[1], event[2]):
+                self._invalidate_content_cache(event[1])
+
+        if events:
+            self.emitter.memo_changes_applied.emit(events)
+        if events:
+            # 본문/제목/태그가 바뀌거나 추가·삭제된 문서만 넘겨 시리즈 캐시를 증분 갱신
+            self.update_series_cache_async([event[1][2] if event[0] in ('added', 'updated') else event[1] for event in events])
+        return result
+
+    def _is_own_write(self, doc_id, modified_time):
+        # 이 앱이 저장한 직후의 변경이면 로컬 캐시가 이미 최신이므로 무효화하지 않음
+        synced_at = google_api_handler.load_doc_meta(doc_id).get('synced_at')
+        if not synced_at or not modified_time:
+            return False
+        try:
+            modified_at = datetime.fromisoformat(modified_time.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            return False
+        return modified_at <= synced_at
+
+    def _invalidate_content_cache(self, doc_id):
+        self.task_index.invalidate(doc_id)
+        self.content_cache.remove(doc_id, ('txt', 'html'))
+
+    def on_memo_changes_applied(self, events):
+        # 동기화로 바뀐 항목만 UI에 반영 (메인 스레드)
+        changed_ids = {event[1][2] if event[0] in ('added', 'updated') else event[1] for event in events}
+        list_events = [event for event in events if event[0] != 'content_changed']
+        if list_events:
+            self.emit_nav_tree_update()
+            if all(event[0] == 'updated' for event in list_events):
+                for event in list_events:
+                    self.on_memo_row_changed(event[1][2])
             else:
-                print("DEBUG: sync_cache_thread - local_cache 변경 없음")
-                self.emitter.status_update.emit("이미 최신 상태입니다.", "info")
+                self.on_sync_finished_update_list()
+        if self.rich_viewer.isVisible() and self.current_viewing_doc_id in changed_ids:
+            if self.current_viewing_doc_id in self.memo_index:
+                self.view_memo_by_id(self.current_viewing_doc_id)
+
+    def _list_shows_all_memos(self):
+        # 필터 없는 '전체 메모' 목록이면 메모가 바뀌어도 목록에 들어갈 행은 그대로
+        if self.memo_list.search_bar.text() or self.memo_list.full_text_search_check.isChecked():
+            return False
+        current_nav_item = self.memo_list.nav_tree.currentItem()
+        return current_nav_item is None or re.sub(r'\s*\(\d+\)', '', current_nav_item.text(0)).strip() == "전체 메모"
+
+    def on_memo_row_changed(self, doc_id):
+        if not self.memo_list.isVisible():
+            return
+        if self._list_shows_all_memos() and self.memo_list.table_model.refresh_doc(doc_id):
+            return
+        self.on_sync_finished_update_list()
 
     def load_cache_only(self, initial_load=False):
         try:
-            if os.path.exists(config_manager.CACHE_FILE):
-                with open(config_manager.CACHE_FILE, 'r', encoding='utf-8') as f:
-                    self.local_cache = json.load(f)
-                self.update_tags_from_cache()
-                if initial_load:
-                    series_cache = self.series_cache if hasattr(self, 'series_cache') else {}
-                    self.emitter.list_data_loaded.emit(self.local_cache, True, series_cache)
-                    self.emitter.nav_tree_updated.emit(self.all_tags, self.local_cache)
+            self.memo_store.migrate_from_json()
+            if initial_load:
+                # 첫 화면에 필요한 행만 먼저 읽고, 나머지는 백그라운드에서 채움
+                first_page = self.memo_store.load_rows(limit=self.local_page_size)
+                with self.cache_lock:
+                    self.local_cache = first_page
+                series_cache = self.series_cache if hasattr(self, 'series_cache') else SeriesIndex()
+                self.emitter.list_data_loaded.emit(first_page, True, series_cache)
+                threading.Thread(target=self.load_remaining_cache_thread, daemon=True).start()
+            else:
+                with self.cache_lock:
+                    self.local_cache = self.memo_store.load_rows()
+                    self.update_tags_from_cache()
+                self.cache_ready.set()
         except Exception as e:
             print(f"캐시 로딩 실패: {e}")
             self.local_cache = []
-            
+            self.cache_ready.set()
+
+    def load_remaining_cache_thread(self):
+        try:
+            rows = self.memo_store.load_rows()
+        except Exception as e:
+            print(f"캐시 로딩 실패: {e}")
+            self.cache_ready.set()
+            return
+        with self.cache_lock:
+            # 그 사이 저장/동기화로 추가된 행은 유지
+            loaded_ids = {row[2] for row in rows}
+            extra_rows = [row for row in self.local_cache if len(row) > 2 and row[2] not in loaded_ids]
+            self.local_cache = extra_rows + rows
+            self.update_tags_from_cache()
+        self.cache_ready.set()
+        self.emit_nav_tree_update()
+        self.emitter.sync_finished_update_list.emit()
+            
+    def _on_content_text_changed(self, doc_id, text):
+        # 콘텐츠 캐시의 .txt가 저장/로드/삭제될 때 (호출 스레드에서 실행)
+        if text is None:
+            self.search_index.remove(doc_id)
+            self.link_index.mark_stale(doc_id) # 링크는 본문을 다시 읽을 때까지 마지막으로 알던 것을 유지
+        else:
+            self.search_index.update(doc_id, text, TaskIndex.cache_signature(doc_id))
+            self.link_index.update(doc_id, text)
+
+    def build_search_index_thread(self):
+        # 시작 시 한 번: 마지막 색인 이후 바뀐 .txt만 다시 읽어 색인
+        self.cache_ready.wait()
+        doc_ids = set(self.memo_index.all_ids())
+        reindexed = 0
+        for doc_id in doc_ids:
+            signature = TaskIndex.cache_signature(doc_id)
+            if signature is None:
+                self.search_index.remove(doc_id)
+                continue
+            if self.search_index.is_fresh(doc_id, signature) and not self.link_index.needs_update(doc_id):
+                continue
+            text = self.content_cache.read_text(doc_id, 'txt')
+            if text is None:
+                continue
+            self.link_index.update(doc_id, text)
+            if self.search_index.update(doc_id, text, signature):
+                reindexed += 1
+        self.search_index.prune(doc_ids)
+        self.search_index.save()
+        self.link_index.prune(doc_ids)
+        self.link_index.save()
+        print(f"검색 인덱스 준비 완료: 다시 색인 {reindexed}개")
+
+    def _get_cached_tags(self, doc_id):
+        # 로컬 캐시에 있는 태그를 돌려줌. 없으면 None (API가 시트에서 찾도록)
+        return self.memo_index.get_tags(doc_id)
+
     def update_tags_from_cache(self):
+        # 태그는 메모 인덱스가 변경 시점마다 갱신하므로 목록만 가져옴
         self.all_tags.clear()
-        for row in self.local_cache:
-            if len(row) > 3 and row[3]:
-                tags = [t.strip().lstrip('#') for t in row[3].replace(',', ' ').split() if t.strip().startswith('#')]
-                self.all_tags.update(tags)
-        
-        
+        self.all_tags.update(self.memo_index.all_tags())
+
+    def emit_nav_tree_update(self):
+        # 네비게이션 트리는 태그별 문서 수와 전체 메모 수만 있으면 됨
+        self.emitter.nav_tree_updated.emit(self.memo_index.tag_counts(), len(self.local_cache))
 
     def on_navigation_selected(self, selected_item_id):
         self.memo_list.search_bar.clear()
         self.memo_list.full_text_search_check.setChecked(False)
-        
-        # 네비게이션 변경 시 페이지를 1로 리셋
-        self.current_local_page = 1
+        self._cancel_search()
 
         # 시리즈 캐시 가져오기
-        series_cache = self.series_cache if hasattr(self, 'series_cache') else {}
+        series_cache = self.series_cache if hasattr(self, 'series_cache') else SeriesIndex()
         
         # id가 favorites이면 즐겨찾기 목록을 표시
         if selected_item_id == "favorites":
             fav_memos = [row for row in self.local_cache if len(row) > 2 and row[2] in self.favorites]
             # 즐겨찾기에서도 시리즈 문서의 회차들을 포함하여 표시
-            self._display_paginated_data(fav_memos)
+            self._display_memo_rows(fav_memos)
             return
 
         # "태그 (12)" 와 같은 형식에서 텍스트 부분만 추출
         clean_selected_item = re.sub(r'\s*\(\d+\)', '', selected_item_id).strip()
 
         if clean_selected_item == "전체 메모":
-            self._display_paginated_data(self.local_cache)
+            self._display_memo_rows(self.local_cache)
         elif clean_selected_item not in ["태그", ""]:
             # 선택된 태그를 포함하는 메모만 필터링
-            filtered_data = [
-                row for row in self.local_cache
-                if len(row) > 3 and row[3] and clean_selected_item in [tag.strip().lstrip('#') for tag in row[3].replace(',', ' ').split()]
-            ]
-            self._display_paginated_data(filtered_data)
+            self._display_memo_rows(self.memo_index.rows_for_tag(clean_selected_item))
 
     def on_editor_text_changed(self):
         self.emitter.auto_save_status_update.emit("변경사항이 있습니다...")
@@ -439,6 +661,8 @@ class AppController:
             self.memo_editor.restoreGeometry(QByteArray.fromHex(geometry_hex.encode('utf-8')))
 
         self.memo_editor.clear_fields()
+        # 새 메모는 문서 ID가 생기기 전까지 이 키로 저장 큐에 들어감
+        self.new_memo_key = f"new-{uuid.uuid4()}"
         self.emitter.auto_save_status_update.emit("새 메모")
         self.memo_editor.show()
         self.memo_editor.activateWindow()
@@ -464,7 +688,7 @@ class AppController:
         self.memo_list.search_bar.setPlaceholderText("본문 내용으로 검색..." if is_full_text else "제목으로 실시간 필터링...")
         
         # 네비게이션 트리 업데이트
-        self.memo_list.update_nav_tree(self.all_tags, self.local_cache)
+        self.memo_list.update_nav_tree(self.memo_index.tag_counts(), len(self.local_cache))
 
         # 이전에 선택된 아이템이 있으면 복원
         if current_nav_item:
@@ -511,6 +735,8 @@ class AppController:
 
     def on_search_text_changed(self):
         if self.memo_list.full_text_search_check.isChecked():
+            # 로컬 인덱스는 입력마다 바로 검색하고, Drive 보충 검색만 입력이 멈춘 뒤 실행
+            self.perform_search()
             self.search_timer.start(600)
         else:
             self.filter_local_cache()
@@ -519,15 +745,13 @@ class AppController:
         is_full_text = self.memo_list.full_text_search_check.isChecked()
         self.memo_list.search_bar.setPlaceholderText("본문 내용으로 검색..." if is_full_text else "제목으로 실시간 필터링...")
         
-        # 검색 모드 변경 시 페이지 리셋
-        self.current_local_page = 1
-        
         if is_full_text:
-            series_cache = self.series_cache if hasattr(self, 'series_cache') else {}
+            series_cache = self.series_cache if hasattr(self, 'series_cache') else SeriesIndex()
             self.emitter.list_data_loaded.emit([], False, series_cache)
-            self.memo_list.update_paging_buttons(False, False, 1)
             self.perform_search()
+            self.search_timer.start(600)
         else:
+            self._cancel_search()
             current_nav = self.memo_list.nav_tree.currentItem()
             if current_nav:
                 self.on_navigation_selected(current_nav.text(0))
@@ -544,73 +768,82 @@ class AppController:
 
         base_data = self.local_cache
         if nav_text != "전체 메모":
-             base_data = [
-                row for row in self.local_cache 
-                if len(row) > 3 and row[3] and nav_text in [tag.strip().lstrip('#') for tag in row[3].replace(',', ' ').split()]
-            ]
+            base_data = self.memo_index.rows_for_tag(nav_text)
 
         if query:
             filtered_data = [row for row in base_data if query in row[0].lower()]
         else:
             filtered_data = base_data
-        
-        # 검색 시 페이지를 1로 리셋
-        self.current_local_page = 1
-        self._display_paginated_data(filtered_data)
+
+        self._display_memo_rows(filtered_data)
 
 
-    def perform_search(self, page_token=None, is_prev=False, is_next=False):
+    def _cancel_search(self):
+        # 진행 중인 Drive 보충 검색 결과가 나중에 와도 목록을 덮어쓰지 않도록 함
+        self.search_generation += 1
+        self.search_query = None
+        self.search_timer.stop()
+
+    def perform_search(self):
         query = self.memo_list.search_bar.text()
+        self.search_generation += 1
         if not query:
-            series_cache = self.series_cache if hasattr(self, 'series_cache') else {}
+            self.search_results = []
+            self.search_query = None
+            series_cache = self.series_cache if hasattr(self, 'series_cache') else SeriesIndex()
             self.emitter.list_data_loaded.emit([], False, series_cache)
-            self.memo_list.update_paging_buttons(False, False, 1)
             self.emitter.status_update.emit("검색어를 입력하세요.", "info")
             return
 
-        self.emitter.status_update.emit(f"'{query}' 검색 중...", "info")
-        if not is_prev and not is_next:
-            self.prev_page_tokens.clear()
-        if is_next:
-            self.prev_page_tokens.append(self.current_page_token)
-        self.current_page_token = page_token
-        threading.Thread(target=self.fetch_data_api, args=(query, page_token), daemon=True).start()
-
-    def fetch_data_api(self, query, page_token):
-        data, next_token = google_api_handler.search_memos_by_content(query, page_token)
-        self.next_page_token = next_token
-        series_cache = self.series_cache if hasattr(self, 'series_cache') else {}
-        self.emitter.list_data_loaded.emit(data if data else [], False, series_cache)
-        prev_enabled = len(self.prev_page_tokens) > 0
-        page_num = len(self.prev_page_tokens) + 1
-        self.memo_list.update_paging_buttons(prev_enabled, self.next_page_token is not None, page_num)
-        self.emitter.status_update.emit(f"'{query}' 검색 완료.", "success")
+        # 캐시된 문서는 로컬 인덱스에서 바로 찾음
+        results = []
+        for doc_id, _ in self.search_index.search(query):
+            row = self.memo_index.get(doc_id)
+            if row:
+                results.append(row)
+        self.search_results = results
+        self.search_query = query
+        self._display_search_results()
+        self.emitter.status_update.emit(f"'{query}' 검색 완료 ({len(results)}건).", "success")
+
+    def perform_fallback_search(self):
+        # 아직 캐시되지 않은 문서가 있을 때만 Drive 검색으로 보충
+        query = self.memo_list.search_bar.text()
+        if not query or query != self.search_query:
+            return
+        uncached = {doc_id for doc_id in self.memo_index.all_ids() if not self.search_index.has(doc_id)}
+        if uncached:
+            self.emitter.status_update.emit(f"'{query}' 검색 중... (캐시되지 않은 문서 {len(uncached)}개)", "info")
+            threading.Thread(target=self.fetch_data_api, args=(self.search_generation, query, uncached), daemon=True).start()
+
+    def fetch_data_api(self, generation, query, uncached):
+        # 작업 스레드에서는 Drive 결과만 모으고, 목록 병합은 UI 스레드(on_search_fallback_ready)에서 함
+        extra_rows = []
+        page_token = None
+        for _ in range(5): # Drive 결과는 최대 다섯 페이지까지만 보충
+            data, page_token = google_api_handler.search_memos_by_content(query, page_token)
+            for row in data or []:
+                if row[2] in uncached:
+                    extra_rows.append(self.memo_index.get(row[2]) or row)
+            if not page_token:
+                break
+        self.emitter.search_fallback_ready.emit(generation, query, extra_rows)
 
-        
-    def go_to_prev_page(self):
-        # 로컬 캐시 페이징인지 API 페이징인지 확인
-        if self.memo_list.full_text_search_check.isChecked():
-            # API 검색 모드
-            if self.prev_page_tokens:
-                prev_token = self.prev_page_tokens.pop()
-                self.perform_search(page_token=prev_token, is_prev=True)
-        else:
-            # 로컬 캐시 페이징
-            if self.current_local_page > 1:
-                self.current_local_page -= 1
-                self.update_memo_list_table()
+    def on_search_fallback_ready(self, generation, query, extra_rows):
+        # 그 사이 검색을 다시 했거나 본문 검색을 끄고 다른 목록으로 옮겼으면 버림
+        if generation != self.search_generation or not self.memo_list.full_text_search_check.isChecked():
+            return
+        if not extra_rows:
+            self.emitter.status_update.emit(f"'{query}' 검색 완료.", "success")
+            return
+        self.search_results = self.search_results + extra_rows
+        self._display_search_results()
+        self.emitter.status_update.emit(f"'{query}' 검색 완료 ({len(self.search_results)}건).", "success")
 
-    def go_to_next_page(self):
-        # 로컬 캐시 페이징인지 API 페이징인지 확인
-        if self.memo_list.full_text_search_check.isChecked():
-            # API 검색 모드
-            if self.next_page_token:
-                self.perform_search(page_token=self.next_page_token, is_next=True)
-        else:
-            # 로컬 캐시 페이징
-            if self.current_local_page < self.total_local_pages:
-                self.current_local_page += 1
-                self.update_memo_list_table()
+    def _display_search_results(self):
+        # 순위를 유지해야 하므로 MOC/회차 묶음 없이 그대로 보여 줌
+        series_cache = self.series_cache if hasattr(self, 'series_cache') else SeriesIndex()
+        self.emitter.list_data_loaded.emit(self.search_results, False, series_cache)
 
     def save_memo(self, is_auto_save=False):
         self.auto_save_timer.stop()
@@ -626,15 +859,27 @@ class AppController:
             return
 
         self.emitter.auto_save_status_update.emit("저장 중...")
-
-        if doc_id:
-            threading.Thread(target=self.update_memo_thread, args=(doc_id, title, content, tags, is_auto_save), daemon=True).start()
-        else:
-            threading.Thread(target=self.save_memo_thread, args=(title, content, tags, is_auto_save), daemon=True).start()
+        self.enqueue_save(doc_id, title, content, tags, is_auto_save)
         
         if not is_auto_save:
             editor.close()
 
+    def enqueue_save(self, doc_id, title, content, tags, is_auto_save=False):
+        # 같은 문서의 저장이 진행 중이면 대기 중인 요청을 이 요청으로 대체
+        job = {'doc_id': doc_id, 'title': title, 'content': content, 'tags': tags, 'is_auto_save': is_auto_save}
+        self.save_queue.submit(doc_id or self.new_memo_key, job)
+
+    def _run_save_job(self, job):
+        # 저장 큐의 작업자 스레드에서 실행됨
+        if job['doc_id']:
+            success = self.update_memo_thread(job['doc_id'], job['title'], job['content'], job['tags'], job['is_auto_save'])
+            return job['doc_id'] if success else None
+        return self.save_memo_thread(job['title'], job['content'], job['tags'], job['is_auto_save'])
+
+    def _on_save_queue_stats(self, depth, last_latency):
+        latency_ms = last_latency * 1000 if last_latency is not None else -1.0
+        self.emitter.save_queue_stats_updated.emit(depth, latency_ms)
+
     def save_memo_thread(self, title, content, tags, is_auto_save=False):
         from datetime import datetime
         self.emitter.status_update.emit(f"'{title}' 저장 중...", "info")
@@ -647,73 +892,59 @@ class AppController:
             # 새 문서 ID를 에디터에 설정 (자동 저장 후 수동 저장 시 업데이트를 위함)
             if self.memo_editor.isVisible() and not self.memo_editor.current_doc_id:
                 self.memo_editor.current_doc_id = new_doc_id
+            self.last_saved_meta[new_doc_id] = (title, tags)
 
             # 로컬 캐시에 새 메모 추가
             current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             new_row = [title, current_date, new_doc_id, tags]
-            self.local_cache.insert(0, new_row) # 새 메모를 맨 위에 추가
-
-            # 캐시 파일 저장
-            try:
-                with open(config_manager.CACHE_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(self.local_cache, f, ensure_ascii=False, indent=4)
-            except IOError as e:
-                print(f"캐시 파일 쓰기 오류: {e}")
+            self.memo_index.insert(new_row, at_top=True) # 새 메모를 맨 위에 추가
+            self.memo_store.upsert(new_row, at_top=True)
 
             # UI 업데이트
             self.update_tags_from_cache()
-            self.emitter.nav_tree_updated.emit(self.all_tags, self.local_cache)
+            self.emit_nav_tree_update()
             if self.memo_list.isVisible():
                 current_nav_item = self.memo_list.nav_tree.currentItem()
                 nav_text = current_nav_item.text(0) if current_nav_item else "전체 메모"
                 self.on_navigation_selected(nav_text)
 
             self.emitter.status_update.emit("저장 완료.", "success")
+            return new_doc_id
         else:
             self.emitter.status_update.emit("저장 실패", "error")
             self.emitter.auto_save_status_update.emit("저장 실패")
+            return None
 
     def update_memo_thread(self, doc_id, title, content, tags, is_auto_save=False):
         from datetime import datetime
         self.emitter.status_update.emit(f"'{title}' 업데이트 중...", "info")
-        success = google_api_handler.update_memo(doc_id, title, content, tags)
+        # 제목/태그가 바뀐 경우에만 Drive 이름 변경과 시트 기록을 보냄 (수동 저장은 날짜 갱신을 위해 시트 기록)
+        last_title, last_tags = self.last_saved_meta.get(doc_id, (None, None))
+        title_changed = title != last_title
+        sheet_changed = title_changed or tags != last_tags or not is_auto_save
+        success = google_api_handler.update_memo(doc_id, title, content, tags,
+                                                 rename=title_changed, update_sheet=sheet_changed)
         if success:
+            self.last_saved_meta[doc_id] = (title, tags)
             self.emitter.auto_save_status_update.emit("모든 변경사항이 저장됨")
-            cache_path_html = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.html")
-            if os.path.exists(cache_path_html):
-                os.remove(cache_path_html)
+            self.content_cache.remove(doc_id, ('html',))
             
             if not is_auto_save:
                 self.emitter.toast_notification.emit("업데이트 완료", f"'{title}' 메모가 업데이트되었습니다.")
 
             # 로컬 캐시 직접 업데이트
             current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            for i, row in enumerate(self.local_cache):
-                if len(row) > 2 and row[2] == doc_id:
-                    self.local_cache[i][0] = title
-                    self.local_cache[i][1] = current_date
-                    if len(self.local_cache[i]) > 3:
-                        self.local_cache[i][3] = tags
-                    else: # 태그 필드가 없는 경우
-                        while len(self.local_cache[i]) < 4:
-                            self.local_cache[i].append("")
-                        self.local_cache[i][3] = tags
-                    break
-            
-            # 캐시 파일 저장
-            try:
-                with open(config_manager.CACHE_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(self.local_cache, f, ensure_ascii=False, indent=4)
-            except IOError as e:
-                print(f"캐시 파일 쓰기 오류: {e}")
+            # 시트에 기록된 경우에만 수정 날짜 갱신
+            updated_row = self.memo_index.update(doc_id, title=title, date=current_date if sheet_changed else None, tags=tags)
+            if updated_row:
+                self.memo_store.upsert(updated_row) # 바뀐 행만 DB에 기록
 
-            # UI 업데이트
+            # UI 업데이트 (목록은 바뀐 행만 다시 그림)
             self.update_tags_from_cache()
-            self.emitter.nav_tree_updated.emit(self.all_tags, self.local_cache)
-            if self.memo_list.isVisible():
-                current_nav_item = self.memo_list.nav_tree.currentItem()
-                nav_text = current_nav_item.text(0) if current_nav_item else "전체 메모"
-                self.on_navigation_selected(nav_text)
+            self.emit_nav_tree_update()
+            self.emitter.memo_row_changed.emit(doc_id)
+            if '#moc' in tags.lower() or '#시리즈' in tags.lower():
+                self.update_series_cache([doc_id], {doc_id: content}) # 저장한 본문으로 이 MOC만 확인
 
             if self.rich_viewer.isVisible() and self.current_viewing_doc_id == doc_id:
                 self.view_memo_by_id(doc_id)
@@ -721,6 +952,8 @@ class AppController:
             self.emitter.status_update.emit("업데이트 완료.", "success")
         else:
             self.emitter.status_update.emit("업데이트 실패", "error")
+            self.emitter.auto_save_status_update.emit("저장 실패")
+        return success
 
 
     def _get_view_mode_info(self, doc_id):
@@ -732,7 +965,7 @@ class AppController:
         prev_chapter_id = None
         next_chapter_id = None
 
-        cached_info = next((row for row in self.local_cache if row[2] == doc_id), None)
+        cached_info = self.memo_index.get(doc_id)
         if cached_info:
             tags_text = cached_info[3].lower() if len(cached_info) > 3 else ""
             current_title = cached_info[0]
@@ -746,20 +979,18 @@ class AppController:
                     is_chapter = True
                     print(f"DEBUG: series_cache에서 시리즈 문서로 인식됨")
                 else:
-                    all_mocs = [row for row in self.local_cache if len(row) > 3 and ('#moc' in row[3].lower() or '#시리즈' in row[3].lower())]
-                    for moc_row in all_mocs:
-                        moc_title = moc_row[0]
-                        if current_title.startswith(moc_title + " - "):
+                    # "MOC 제목 - 회차 제목" 패턴: 가능한 접두어마다 제목 인덱스로 MOC인지 확인
+                    title_parts = current_title.split(" - ")
+                    for i in range(1, len(title_parts)):
+                        moc_title = " - ".join(title_parts[:i])
+                        moc_tags = (self.memo_index.get_tags(self.memo_index.id_for_title(moc_title), "") or "").lower()
+                        if '#moc' in moc_tags or '#시리즈' in moc_tags:
                             is_chapter = True
                             print(f"DEBUG: 제목 패턴으로 시리즈 문서로 인식됨 - MOC: {moc_title}")
                             break
         
         # 대소문자 구분 없이 series_cache에서 찾기
-        series_info = None
-        for cache_id, info in self.series_cache.items():
-            if cache_id.lower() == doc_id.lower():
-                series_info = info
-                break
+        series_info = self.series_cache.find(doc_id)
         
         if series_info:
             is_chapter = True  # 시리즈 정보를 찾았으면 시리즈 문서로 설정
@@ -784,22 +1015,6 @@ class AppController:
         print(f"DEBUG: 반환값: {result}")
         return result
 
-    def view_memo_from_item(self, item):
-        # QTreeWidgetItem인 경우와 QTableWidgetItem인 경우 모두 처리
-        try:
-            # QTreeWidgetItem인 경우 (column, role 순서)
-            doc_id = item.data(0, Qt.UserRole)
-        except (TypeError, AttributeError):
-            try:
-                # QTableWidgetItem인 경우 (role만)
-                doc_id = item.data(Qt.UserRole)
-            except (TypeError, AttributeError):
-                print(f"DEBUG: view_memo_from_item - 아이템 타입을 확인할 수 없음: {type(item)}")
-                return
-        
-        if doc_id:
-            self.view_memo_by_id(doc_id)
-
     def view_memo_by_id(self, doc_id, force_refresh=False):
         if self.rich_viewer.isVisible() and self.current_viewing_doc_id == doc_id and not force_refresh:
             self.rich_viewer.activateWindow()
@@ -813,33 +1028,52 @@ class AppController:
         self.rich_viewer.update_favorite_status(doc_id in self.favorites)
         self.current_viewing_doc_id = doc_id
         
-        cached_info = next((row for row in self.local_cache if row[2] == doc_id), None)
+        cached_info = self.memo_index.get(doc_id)
         title_from_cache = cached_info[0] if cached_info else "불러오는 중..."
         tags_from_cache = cached_info[3] if cached_info and len(cached_info) > 3 else ""
 
-        cache_path = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.html")
         is_background_check = False
+        cached_html_full = None if force_refresh else self.content_cache.read_text(doc_id, 'html')
         
         # 강제 새로고침이거나 캐시가 없는 경우
-        if force_refresh or not os.path.exists(cache_path):
+        if cached_html_full is None:
             loading_html = self._get_final_html(title_from_cache, "<body><p>콘텐츠를 불러오는 중입니다...</p></body>", tags_from_cache)
             self.emitter.show_rich_view.emit(doc_id, title_from_cache, loading_html, view_mode_info)
         else:
             # 캐시가 있는 경우
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    cached_html_full = f.read()
-                self.emitter.show_rich_view.emit(doc_id, title_from_cache, cached_html_full, view_mode_info)
-                is_background_check = True
-            except Exception:
-                error_html = self._get_final_html("오류", "<body><p>캐시 파일을 읽을 수 없습니다.</p></body>", "")
-                self.emitter.show_rich_view.emit(doc_id, "오류", error_html, view_mode_info)
+            self.emitter.show_rich_view.emit(doc_id, title_from_cache, cached_html_full, view_mode_info)
+            is_background_check = True
 
         threading.Thread(target=self.sync_rich_content_thread, args=(doc_id, is_background_check), daemon=True).start()
 
+    def _rich_cache_key(self, doc_id):
+        # 렌더링된 HTML에 들어가는 제목/태그, 사용자 CSS, [[링크]]가 가리키는 문서가 바뀌면
+        # 리비전이 같아도 다시 렌더링해야 함 (링크 대상 메모가 새로 생기거나 이름이 바뀐 경우)
+        cached_info = self.memo_index.get(doc_id)
+        title = cached_info[0] if cached_info else ""
+        tags = cached_info[3] if cached_info and len(cached_info) > 3 else ""
+        links = "\n".join(f"{linked_title}={self.memo_index.id_for_title(linked_title) or ''}"
+                          for linked_title in self.link_index.links_of(doc_id))
+        key_text = f"{title}\n{tags}\n{html_renderer.css_fingerprint()}\n{links}"
+        return hashlib.sha1(key_text.encode('utf-8')).hexdigest()
+
     def sync_rich_content_thread(self, doc_id, is_background_check=False):
-        title, html_body, tags = google_api_handler.load_doc_content(doc_id, as_html=True)
         view_mode_info = self._get_view_mode_info(doc_id)
+        cache_key = self._rich_cache_key(doc_id)
+
+        if is_background_check:
+            # 캐시된 HTML의 리비전이 그대로면 본문 다운로드와 렌더링을 모두 생략
+            doc_meta = google_api_handler.load_doc_meta(doc_id)
+            if doc_meta.get('html_revision_id') and doc_meta.get('html_key') == cache_key:
+                exists, revision_id = google_api_handler.get_doc_revision(doc_id)
+                if not exists:
+                    self.cleanup_stale_document(doc_id)
+                    return
+                if revision_id == doc_meta['html_revision_id']:
+                    return
+
+        fetch_meta = {}
+        title, html_body, tags = google_api_handler.load_doc_content(doc_id, as_html=True, tags_text=self._get_cached_tags(doc_id), meta=fetch_meta)
 
         if title is None: # 404 Not Found
             if not is_background_check:
@@ -849,88 +1083,88 @@ class AppController:
             self.cleanup_stale_document(doc_id)
             return
 
-        processed_html_body = self._process_html_images(html_body)
+        processed_html_body, pending_urls = self._process_html_images(html_body, doc_id)
         new_html_full = self._get_final_html(title, processed_html_body, tags)
         
-        current_html_full = ""
-        cache_path = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.html")
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    current_html_full = f.read()
-            except IOError:
-                pass
+        current_html_full = self.content_cache.read_text(doc_id, 'html') or ""
 
-        if new_html_full != current_html_full:
-            try:
-                with open(cache_path, 'w', encoding='utf-8') as f:
-                    f.write(new_html_full)
-                if self.rich_viewer.isVisible() and self.current_viewing_doc_id == doc_id:
-                    self.emitter.show_rich_view.emit(doc_id, title, new_html_full, view_mode_info)
-            except Exception as e:
-                print(f"콘텐츠 캐시 저장 오류: {e}")
+        if pending_urls:
+            # 자리표시자 페이지를 먼저 보여 주고, 이미지는 받는 대로 페이지 안에서 교체
+            # (다운로드는 페이지를 보낸 뒤에 시작해야 교체 알림이 이전 페이지에 먼저 도착하지 않음)
+            if self.rich_viewer.isVisible() and self.current_viewing_doc_id == doc_id:
+                self.emitter.show_rich_view.emit(doc_id, title, new_html_full, view_mode_info)
+            pending = self._start_image_downloads(doc_id, pending_urls)
+            concurrent.futures.wait(pending)
+            # 캐시에는 로컬 경로로 바뀐 최종 HTML만 저장 (자리표시자가 남지 않도록)
+            processed_html_body, _ = self._process_html_images(html_body)
+            new_html_full = self._get_final_html(title, processed_html_body, tags)
+            if not self.content_cache.write_text(doc_id, 'html', new_html_full):
+                return
+            if any(future.cancelled() or future.exception() or future.result() is None for future in pending):
+                return # 받지 못한 이미지가 있으면 리비전을 기록하지 않아 다음에 다시 시도
+        elif new_html_full != current_html_full:
+            if not self.content_cache.write_text(doc_id, 'html', new_html_full):
+                return
+            if self.rich_viewer.isVisible() and self.current_viewing_doc_id == doc_id:
+                self.emitter.show_rich_view.emit(doc_id, title, new_html_full, view_mode_info)
+        if fetch_meta.get('revision_id'):
+            google_api_handler.save_doc_meta(doc_id, html_revision_id=fetch_meta['revision_id'], html_key=cache_key)
 
     def cleanup_stale_document(self, doc_id):
-        # 1. 오래된 로컬 콘텐츠 캐시 파일(.html, .txt) 삭제
-        cache_path_html = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.html")
-        cache_path_txt = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.txt")
-        if os.path.exists(cache_path_html):
-            try: os.remove(cache_path_html)
-            except OSError as e: print(f"HTML 캐시 삭제 오류: {e}")
-        if os.path.exists(cache_path_txt):
-            try: os.remove(cache_path_txt)
-            except OSError as e: print(f"TXT 캐시 삭제 오류: {e}")
+        # 1. 오래된 로컬 콘텐츠 캐시 파일(.html, .txt, 메타) 삭제
+        self.content_cache.remove(doc_id)
 
         # 2. 메인 캐시 리스트(self.local_cache)에서 해당 문서 제거
         with self.cache_lock:
-            initial_len = len(self.local_cache)
-            self.local_cache = [row for row in self.local_cache if len(row) > 2 and row[2] != doc_id]
-            if len(self.local_cache) < initial_len:
+            if self.memo_index.remove(doc_id) is not None:
                 print(f"삭제된 문서({doc_id})를 메인 캐시에서 제거했습니다.")
-                try:
-                    with open(config_manager.CACHE_FILE, 'w', encoding='utf-8') as f:
-                        json.dump(self.local_cache, f, ensure_ascii=False, indent=4)
-                except IOError as e:
-                    print(f"캐시 파일 쓰기 오류: {e}")
+                self.memo_store.delete(doc_id)
                 
                 # 3. UI 업데이트 (목록 및 태그 트리 새로고침)
                 self.update_tags_from_cache()
-                self.emitter.nav_tree_updated.emit(self.all_tags, self.local_cache)
+                self.emit_nav_tree_update()
                 self.emitter.sync_finished_update_list.emit()
 
-    def _process_html_images(self, html_body):
+    def _process_html_images(self, html_body, doc_id=None):
+        """원격 이미지를 로컬 캐시 경로로 바꾼 HTML과, 아직 받지 않은 이미지 URL 목록을 반환.
+
+        doc_id를 주면 캐시에 없는 이미지는 자리표시자로 두고 URL을 돌려주며, 다운로드는 호출자가
+        자리표시자 페이지를 보낸 뒤 _start_image_downloads로 시작합니다. doc_id가 없으면 실패로 표시합니다.
+        """
         soup = BeautifulSoup(html_body, 'html.parser')
-        images_dir = os.path.join(config_manager.CONTENT_CACHE_DIR, 'images')
-        if not os.path.exists(images_dir):
-            os.makedirs(images_dir)
+        pending_urls = []
 
         for img in soup.find_all('img'):
             src = img.get('src')
             if src and src.startswith('http'):
-                try:
-                    # 이미지 URL로부터 고유한 파일명 생성
-                    filename = hashlib.md5(src.encode()).hexdigest()
-                    file_extension = os.path.splitext(src.split('?')[0])[-1] or '.png'
-                    if not file_extension.startswith('.'):
-                        file_extension = '.' + file_extension
-                    
-                    filepath = os.path.join(images_dir, filename + file_extension)
-
-                    # 이미지가 로컬에 없으면 다운로드
-                    if not os.path.exists(filepath):
-                        response = requests.get(src, stream=True, timeout=10)
-                        response.raise_for_status()
-                        with open(filepath, 'wb') as f:
-                            for chunk in response.iter_content(8192):
-                                f.write(chunk)
-                    
+                filepath = self.image_downloader.cached_path(src)
+                if filepath is not None:
                     # 이미지 태그의 src를 로컬 파일 경로로 변경
                     img['src'] = f"file:///{os.path.abspath(filepath).replace(os.sep, '/')}"
-                except requests.exceptions.RequestException as e:
-                    print(f"Error downloading image {src}: {e}")
+                elif doc_id is not None:
+                    img['src'] = PLACEHOLDER_SRC
+                    img['data-remote-src'] = src
+                    if src not in pending_urls:
+                        pending_urls.append(src)
+                else:
                     img['alt'] = f"이미지 로드 실패: {src}"
         
-        return str(soup)
+        return str(soup), pending_urls
+
+    def _start_image_downloads(self, doc_id, urls):
+        # 받을 때마다 image_localized 신호로 보기 창에 알림 (이미 끝난 Future면 바로 호출됨)
+        pending = []
+        for url in urls:
+            future = self.image_downloader.fetch(url)
+            future.add_done_callback(functools.partial(self._on_image_downloaded, doc_id, url))
+            pending.append(future)
+        return pending
+
+    def _on_image_downloaded(self, doc_id, url, future):
+        # 다운로드 작업자 스레드에서 호출됨
+        filepath = None if future.cancelled() or future.exception() else future.result()
+        local_url = f"file:///{os.path.abspath(filepath).replace(os.sep, '/')}" if filepath else ""
+        self.emitter.image_localized.emit(doc_id, url, local_url)
 
     def edit_memo(self, doc_id):
         self.current_editing_doc_id = doc_id
@@ -938,7 +1172,7 @@ class AppController:
         threading.Thread(target=self.load_for_edit_thread, args=(doc_id,)).start()
         
     def load_for_edit_thread(self, doc_id):
-        title, markdown_content, tags_text = google_api_handler.load_doc_content(doc_id, as_html=False)
+        title, markdown_content, tags_text = google_api_handler.load_doc_content(doc_id, as_html=False, tags_text=self._get_cached_tags(doc_id))
         if title is not None:
             self.emitter.show_edit_memo.emit(doc_id, title, markdown_content, tags_text)
             self.emitter.status_update.emit("편집 준비 완료.", 2000)
@@ -947,7 +1181,7 @@ class AppController:
         
     def delete_memo(self, doc_id):
         title_to_delete = "메모"
-        cached_info = next((row for row in self.local_cache if row[2] == doc_id), None)
+        cached_info = self.memo_index.get(doc_id)
         if cached_info:
             title_to_delete = cached_info[0]
 
@@ -960,13 +1194,13 @@ class AppController:
         self.emitter.status_update.emit("삭제 중...", 0)
         
         # 삭제할 메모의 정보를 먼저 가져옴
-        deleted_memo_info = next((row for row in self.local_cache if row[2] == doc_id), None)
+        deleted_memo_info = self.memo_index.get(doc_id)
         deleted_title = deleted_memo_info[0] if deleted_memo_info else "알 수 없는 메모"
         
         success = google_api_handler.delete_memo(doc_id)
         if success:
             # 로컬 캐시에서 해당 메모 제거
-            self.local_cache = [row for row in self.local_cache if len(row) > 2 and row[2] != doc_id]
+            self.memo_index.remove(doc_id)
             
             # 시리즈 문서인 경우 MOC 문서에서 링크 제거
             if deleted_memo_info and len(deleted_memo_info) > 3:
@@ -983,13 +1217,13 @@ class AppController:
                     else:
                         print(f"DEBUG: 일반 문서로 판단됨 - {deleted_title}")
             
-            # 캐시 파일에 변경사항 저장
-            with open(config_manager.CACHE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.local_cache, f, ensure_ascii=False, indent=4)
+            # 저장소에서 해당 행 삭제
+            self.memo_store.delete(doc_id)
+            self.content_cache.remove(doc_id)
             
             # 태그 목록 업데이트 및 UI 갱신
             self.update_tags_from_cache()
-            self.emitter.nav_tree_updated.emit(self.all_tags, self.local_cache)
+            self.emit_nav_tree_update()
             self.on_navigation_selected("전체 메모") # 전체 메모 목록으로 돌아가기
             self.emitter.status_update.emit("삭제 완료", 5000)
             self.emitter.toast_notification.emit("삭제 완료", f"메모가 삭제되었습니다.")
@@ -1004,17 +1238,16 @@ class AppController:
             
             # 시리즈 캐시에서 삭제된 문서의 부모 MOC 찾기
             if deleted_doc_id in self.series_cache:
-                parent_moc_id = self.series_cache[deleted_doc_id].get('parent_moc_id')
+                parent_moc_id = self.series_cache.parent_of(deleted_doc_id)
                 if parent_moc_id:
                     print(f"DEBUG: 부모 MOC 문서에서 링크 제거: {parent_moc_id}")
                     self.remove_chapter_link_from_moc(parent_moc_id, deleted_title)
                     
-                    # 시리즈 캐시에서도 제거
-                    del self.series_cache[deleted_doc_id]
+                    # 시리즈 캐시에서도 제거 (이전/다음 회차는 서로 이어짐)
+                    with self.series_lock:
+                        self.series_cache.remove_chapter(deleted_doc_id)
+                        save_series_cache(self.series_cache.to_dict())
                     print(f"DEBUG: 시리즈 캐시에서 제거됨: {deleted_doc_id}")
-                    
-                    # 이전/다음 회차 연결 업데이트
-                    self.update_adjacent_chapters(deleted_doc_id)
             else:
                 print(f"DEBUG: 시리즈 캐시에서 삭제된 문서를 찾을 수 없음, 모든 MOC 문서에서 검색: {deleted_doc_id}")
                 # 시리즈 캐시에 없어도 모든 MOC 문서에서 해당 링크를 찾아서 제거
@@ -1029,7 +1262,7 @@ class AppController:
         """특정 MOC 문서에서 삭제된 시리즈 문서의 링크를 제거"""
         try:
             # MOC 문서의 현재 내용을 가져옴
-            title, html_body, tags_text = google_api_handler.load_doc_content(moc_doc_id, as_html=False)
+            title, html_body, tags_text = google_api_handler.load_doc_content(moc_doc_id, as_html=False, tags_text=self._get_cached_tags(moc_doc_id))
             if not title or not html_body:
                 print(f"DEBUG: MOC 문서 내용을 가져올 수 없음: {moc_doc_id}")
                 return
@@ -1133,42 +1366,10 @@ class AppController:
     def clear_moc_cache(self, moc_doc_id):
         """MOC 문서의 캐시를 삭제"""
         try:
-            cache_path_html = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{moc_doc_id}.html")
-            cache_path_txt = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{moc_doc_id}.txt")
-            
-            if os.path.exists(cache_path_html):
-                os.remove(cache_path_html)
-                print(f"DEBUG: MOC HTML 캐시 삭제: {cache_path_html}")
-            if os.path.exists(cache_path_txt):
-                os.remove(cache_path_txt)
-                print(f"DEBUG: MOC TXT 캐시 삭제: {cache_path_txt}")
-                
+            self.content_cache.remove(moc_doc_id, ('txt', 'html'))
         except Exception as e:
             print(f"DEBUG: MOC 캐시 삭제 중 오류: {e}")
 
-    def update_adjacent_chapters(self, deleted_doc_id):
-        """삭제된 회차의 이전/다음 회차 연결을 업데이트"""
-        try:
-            if deleted_doc_id not in self.series_cache:
-                return
-                
-            deleted_info = self.series_cache[deleted_doc_id]
-            prev_id = deleted_info.get('prev_chapter_id')
-            next_id = deleted_info.get('next_chapter_id')
-            
-            # 이전 회차의 next_chapter_id를 다음 회차로 변경
-            if prev_id and prev_id in self.series_cache:
-                self.series_cache[prev_id]['next_chapter_id'] = next_id
-                print(f"DEBUG: 이전 회차 연결 업데이트: {prev_id} -> {next_id}")
-            
-            # 다음 회차의 prev_chapter_id를 이전 회차로 변경
-            if next_id and next_id in self.series_cache:
-                self.series_cache[next_id]['prev_chapter_id'] = prev_id
-                print(f"DEBUG: 다음 회차 연결 업데이트: {next_id} -> {prev_id}")
-                
-        except Exception as e:
-            print(f"DEBUG: 인접 회차 연결 업데이트 중 오류: {e}")
-
     def search_and_remove_from_all_mocs(self, deleted_title):
         """모든 MOC 문서에서 삭제된 시리즈 문서의 링크를 찾아서 제거"""
         try:
@@ -1193,15 +1394,14 @@ class AppController:
             traceback.print_exc()
 
     def show_context_menu(self, pos):
-        item = self.memo_list.table.itemAt(pos)
-        if not item: return
-        doc_id = item.data(0, Qt.UserRole)  # column과 role을 명시적으로 지정
+        doc_id = self.memo_list.doc_id_at(pos)
+        if not doc_id: return
         menu = QMenu()
         edit_action = menu.addAction("편집하기")
         edit_tags_action = menu.addAction("태그 수정하기")
         menu.addSeparator()
         delete_action = menu.addAction("삭제하기")
-        action = menu.exec_(self.memo_list.table.mapToGlobal(pos))
+        action = menu.exec_(self.memo_list.table.viewport().mapToGlobal(pos))
         if action == edit_action:
             self.edit_memo(doc_id)
         elif action == edit_tags_action:
@@ -1212,7 +1412,7 @@ class AppController:
     def edit_tags_from_list(self, doc_id):
         # 로컬 캐시에서 정보를 먼저 찾음
         title, content, current_tags = "","",""
-        cached_info = next((row for row in self.local_cache if row[2] == doc_id), None)
+        cached_info = self.memo_index.get(doc_id)
         if cached_info:
             current_tags = cached_info[3]
         
@@ -1221,12 +1421,12 @@ class AppController:
 
         if ok and new_tags != current_tags:
             # API를 통해 전체 문서 내용 로드
-            title, content, _ = google_api_handler.load_doc_content(doc_id, as_html=False)
+            title, content, _ = google_api_handler.load_doc_content(doc_id, as_html=False, tags_text=self._get_cached_tags(doc_id))
             if title is None:
                 QMessageBox.warning(self.memo_list, "오류", "문서 내용을 불러올 수 없어 태그를 편집할 수 없습니다.")
                 return
-            # 업데이트 스레드 실행
-            self.update_memo_thread(doc_id, title, content, new_tags)
+            # 저장 큐에 업데이트 요청
+            self.enqueue_save(doc_id, title, content, new_tags)
 
 
     def show_settings_window(self):
@@ -1254,13 +1454,34 @@ class AppController:
         self.toast_notification_window.move(x, y)
         self.toast_notification_window.show_toast(title, message)
     
+    def schedule_editor_preview(self):
+        # 입력 중에는 타이머를 다시 걸지 않음 (디바운스가 아니라 프레임 단위 스로틀)
+        if not self.memo_editor.preview_timer.isActive():
+            self.memo_editor.preview_timer.start(self.preview_engine.next_interval_ms())
+
+    def reset_editor_preview(self):
+        self.preview_engine.reset()
+        self.preview_page_loading = False
+
+    def on_editor_preview_loaded(self, ok):
+        self.preview_page_loading = False
+        if not ok:
+            self.preview_engine.reset()
+
     def update_editor_preview(self):
+        if self.preview_page_loading:
+            # 전체 페이지를 불러오는 중에는 패치할 대상이 없으므로 로딩이 끝난 뒤 다시 시도
+            self.memo_editor.preview_timer.start(self.preview_engine.next_interval_ms())
+            return
         markdown_text = self.memo_editor.editor.toPlainText()
-        html_body = markdown.markdown(markdown_text, extensions=['fenced_code', 'codehilite', 'tables', 'nl2br'])
         tags_text = self.memo_editor.tag_input.text()
-        final_html_with_css = self._get_final_html("미리보기", html_body, tags_text)
-        base_url = QUrl.fromLocalFile(os.path.abspath(os.getcwd()).replace('\\', '/') + '/')
-        self.memo_editor.viewer.setHtml(final_html_with_css, base_url)
+        kind, payload = self.preview_engine.update(markdown_text, tags_text)
+        if kind == 'full':
+            base_url = QUrl.fromLocalFile(os.path.abspath(os.getcwd()).replace('\\', '/') + '/')
+            self.preview_page_loading = True
+            self.memo_editor.viewer.setHtml(payload, base_url)
+        elif kind == 'patch':
+            self.memo_editor.viewer.page().runJavaScript(payload)
 
     def on_launcher_item_selected(self, selected_data):
         self.quick_launcher.hide()
@@ -1277,111 +1498,14 @@ class AppController:
             self.view_memo_by_id(doc_id)
     
     def _get_final_html(self, title, html_body, tags_text=""):
-        # 위키 링크 [[문서제목]]을 하이퍼링크로 변환
-        title_to_id_map = {row[0]: row[2] for row in self.local_cache if len(row) > 2}
-
-        def replace_wiki_links(match):
-            linked_title = match.group(1)
-            doc_id = title_to_id_map.get(linked_title)
-            if doc_id:
-                return f'<a href="memo://{doc_id}" title="메모 열기: {linked_title}">{linked_title}</a>'
-            return f'<span class="broken-link" title="존재하지 않는 메모: {linked_title}">[[{linked_title}]]</span>'
-        
-        def convert_local_images(html):
-            """로컬 이미지 경로를 절대 경로로 변환"""
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
-            for img in soup.find_all('img'):
-                src = img.get('src')
-                if src and not src.startswith(('http://', 'https://', 'file://')):
-                    # 상대 경로인 경우 절대 경로로 변환
-                    if src.startswith('resources/'):
-                        abs_path = os.path.abspath(resource_path(src))
-                        img['src'] = f"file:///{abs_path.replace(os.sep, '/')}"
-                    elif src.startswith('./') or src.startswith('../'):
-                        abs_path = os.path.abspath(os.path.join(os.getcwd(), src))
-                        img['src'] = f"file:///{abs_path.replace(os.sep, '/')}"
-            return str(soup)
-        
-        def style_checkboxes(html):
-            # 완료되지 않은 체크박스
-            html = re.sub(r'<li>\[ \]', r'<li><span class="task-checkbox-empty"></span>', html)
-            # 완료된 체크박스: '✔'
-            html = re.sub(r'<li>\[x\]', r'<li><span class="task-checkbox-done"></span>', html)
-            return html
-
-        def style_priority_tags(html):
-            # !p1, !p2 등을 - [ ] 로 보이게 함
-            html = re.sub(r'!p([1-5])', r'<span class="rank-\1"></span>', html)
-            return html
-        
-        def style_todotime_tags(html):
-            html = re.sub(r'\s(@\S+\s\S*:\S+)', r'<span class="datetime-tag">\1</span>', html)
-            html = re.sub(r'\s(@\S+)', r'<span class="date-tag">\1</span>', html)
-            return html
-
-        # 이미지 경로 변환 먼저 적용
-        processed_html = convert_local_images(html_body)
-        # 위키 링크 변환 적용
-        parsed_body = re.sub(r'\[\[(.*?)\]\]', replace_wiki_links, processed_html)
-        parsed_body = style_checkboxes(parsed_body)
-        parsed_body = style_priority_tags(parsed_body)
-        parsed_body = style_todotime_tags(parsed_body)
-        
-
-        # 태그를 표시하고 클릭 가능하게 만듦
-        tags_html = ""
-        if tags_text:
-            tags = [t.strip() for t in tags_text.replace(',', ' ').split() if t.strip()]
-            tags_html = '<div class="tags-container">'
-            for tag in tags:
-                clean_tag = tag.lstrip('#')
-                tags_html += f'<a href="tag://{clean_tag}" class="tag-link">#{clean_tag}</a> '
-            tags_html += '</div>'
-
-        # 기본 CSS
-        DEFAULT_CSS = """
-        <style>
-            body { font-family: "Segoe UI", "Malgun Gothic", sans-serif; line-height: 1.7; padding: 35px; background-color: #ffffff; color: #333333; }
-            h1, h2, h3, h4, h5, h6 { font-weight: 600; color: #111111; margin-top: 1.5em; margin-bottom: 0.5em; line-height: 1.25; }
-            h1 { font-size: 2em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }
-            h2 { font-size: 1.5em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }
-            p { margin: 0 0 16px 0; }
-            a { color: #0366d6; text-decoration: none; } a:hover { text-decoration: underline; }
-            .broken-link { color: #dc3545; text-decoration: line-through; cursor: help; }
-            pre { background-color: #f6f8fa; border-radius: 4px; padding: 16px; overflow: auto; font-size: 85%; }
-            code { font-family: "D2Coding", "Consolas", monospace; background-color: rgba(27,31,35,0.05); border-radius: 3px; padding: .2em .4em; font-size: 90%; }
-            pre > code { padding: 0; background-color: transparent; }
-            blockquote { margin: 0 0 16px 0; padding: 0 1.2em; color: #6a737d; border-left: 0.25em solid #dfe2e5; }
-            ul, ol { padding-left: 2em; margin-bottom: 16px; }
-            table { border-collapse: collapse; margin-bottom: 16px; display: block; width: 100%; overflow: auto; }
-            th, td { border: 1px solid #dfe2e5; padding: 8px 13px; }
-            tr { border-top: 1px solid #c6cbd1; background-color: #fff; }
-            tr:nth-child(2n) { background-color: #f6f8fa; }
-            hr { height: .25em; padding: 0; margin: 24px 0; background-color: #e1e4e8; border: 0; }
-            .tags-container { margin-bottom: 20px; border-bottom: 1px solid #eaecef; padding-bottom: 10px; }
-            .tag-link { background-color: #f1f8ff; color: #0366d6; padding: 3px 8px; border-radius: 12px; font-size: 0.9em; margin-right: 5px; }
-            .tag-link:hover { background-color: #ddeeff; }
-        </style>
-        """
-        
-        final_css = DEFAULT_CSS
-        custom_css_path = config_manager.get_setting('Display', 'custom_css_path')
-        if custom_css_path and os.path.exists(custom_css_path):
-            try:
-                with open(custom_css_path, 'r', encoding='utf-8') as f:
-                    final_css = f"<style>{f.read()}</style>"
-            except Exception:
-                pass
-        
-        return f'<html><head><meta charset="UTF-8"><title>{title}</title>{final_css}</head><body>{tags_html}{parsed_body}</body></html>'
+        # 위키 링크/체크박스/우선순위/날짜 변환과 CSS 적용 (core.html_renderer에서 한 번에 처리)
+        return html_renderer.render_page(title, html_body, tags_text, self.memo_index.id_for_title)
     
     def on_link_activated(self, url):
         url_string = url.toString()
         if url_string.startswith('memo://'):
             doc_id = url_string.replace('memo://', '')
-            print("[Link] 시리즈 캐시를 강제로 재구성합니다.")
-            self.rebuild_series_cache() # 링크 클릭 시 시리즈 캐시를 동기적으로 재구성
+            # 시리즈 캐시는 저장/동기화 때 백그라운드에서 갱신되므로 여기서는 그대로 사용
             self.view_memo_from_cache_only(doc_id)
         elif url_string.startswith('tag://'):
             tag_name = url_string.replace('tag://', '')
@@ -1395,23 +1519,16 @@ class AppController:
 
     def view_memo_from_cache_only(self, doc_id):
         view_mode_info = self._get_view_mode_info(doc_id)
-        cached_info = next((row for row in self.local_cache if row[2] == doc_id), None)
+        cached_info = self.memo_index.get(doc_id)
         title = cached_info[0] if cached_info else "캐시된 메모"
 
-        cache_path = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.html")
+        cached_html_full = self.content_cache.read_text(doc_id, 'html')
         
         # 캐시가 있으면 사용하고, 없으면 원본에서 로드
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    cached_html_full = f.read()
-                
-                self.rich_viewer.update_favorite_status(doc_id in self.favorites)
-                self.current_viewing_doc_id = doc_id
-                self.emitter.show_rich_view.emit(doc_id, title, cached_html_full, view_mode_info)
-            except Exception as e:
-                error_html = self._get_final_html("오류", f"<body><p>캐시 파일을 읽는 중 오류가 발생했습니다: {e}</p></body>", "")
-                self.emitter.show_rich_view.emit(doc_id, "오류", error_html, view_mode_info)
+        if cached_html_full is not None:
+            self.rich_viewer.update_favorite_status(doc_id in self.favorites)
+            self.current_viewing_doc_id = doc_id
+            self.emitter.show_rich_view.emit(doc_id, title, cached_html_full, view_mode_info)
         else:
             # 캐시가 없는 경우 원본에서 로드
             print(f"DEBUG: 캐시가 없어서 원본에서 로드: {doc_id}")
@@ -1424,7 +1541,7 @@ class AppController:
         doc_id = self.current_viewing_doc_id
         
         # API를 통해 최신 정보 로드
-        title, content, current_tags = google_api_handler.load_doc_content(doc_id, as_html=False)
+        title, content, current_tags = google_api_handler.load_doc_content(doc_id, as_html=False, tags_text=self._get_cached_tags(doc_id))
 
         if title is None:
             QMessageBox.warning(self.rich_viewer, "오류", "문서 내용을 불러올 수 없어 태그를 편집할 수 없습니다.")
@@ -1433,7 +1550,7 @@ class AppController:
         new_tags, ok = QInputDialog.getText(self.rich_viewer, "태그 편집", "태그를 입력하세요 (쉼표나 공백으로 구분):", text=current_tags)
 
         if ok and new_tags != current_tags:
-            self.update_memo_thread(doc_id, title, content, new_tags)
+            self.enqueue_save(doc_id, title, content, new_tags)
 
     def stay_awake(self):
         pass
@@ -1455,6 +1572,7 @@ class AppController:
 
     def load_favorites(self):
         self.favorites = config_manager.get_favorites()
+        self.memo_list.table_model.set_favorites(self.favorites)
 
     def toggle_favorite(self, doc_id):
         if doc_id in self.favorites:
@@ -1478,65 +1596,46 @@ class AppController:
             self.toggle_favorite(self.current_viewing_doc_id)
 
     def on_favorite_status_changed(self, doc_id, is_favorite):
-        # 1. 목록 창의 아이콘 업데이트 (QTreeWidget용)
-        def update_favorite_icon(item):
-            if item.data(0, Qt.UserRole) == doc_id:
-                icon = qta.icon('fa5s.star', color='#f0c420') if is_favorite else qta.icon('fa5s.star', color='#ced4da')
-                item.setIcon(0, icon)
-                return True
-            return False
-        
-        # 최상위 아이템들 검사
-        for i in range(self.memo_list.table.topLevelItemCount()):
-            item = self.memo_list.table.topLevelItem(i)
-            if update_favorite_icon(item):
-                return
-            # 하위 아이템들도 검사
-            for j in range(item.childCount()):
-                child_item = item.child(j)
-                if update_favorite_icon(child_item):
-                    return
+        # 1. 목록 창의 아이콘 업데이트 (해당 행만 다시 그림)
+        self.memo_list.table_model.set_favorite(doc_id, is_favorite)
         
         if self.rich_viewer.isVisible() and self.current_viewing_doc_id == doc_id:
             self.rich_viewer.update_favorite_status(is_favorite)
 
         # 2. 네비게이션 트리 업데이트
-        self.emitter.nav_tree_updated.emit(self.all_tags, self.local_cache)
+        self.emit_nav_tree_update()
 
     def load_tasks_thread(self):
         with self.cache_lock:
-            local_cache_copy = list(self.local_cache)
+            memos = [(row[2], row[0]) for row in self.local_cache if len(row) > 2]
         try:
-            contents = {}
-            for memo in local_cache_copy:
-                doc_id, source_memo = memo[2], memo[0]
-                cache_path = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.txt")
-                content = None
-                if os.path.exists(cache_path):
-                    try:
-                        with open(cache_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                    except Exception as e:
-                        print(f"Error reading cache for {doc_id}: {e}")
-
+            self.task_index.prune({doc_id for doc_id, _ in memos})
+            missing = {}
+            reparsed = 0
+            for doc_id, source_memo in memos:
+                # .txt 캐시가 마지막 색인 이후 그대로면 파일을 읽지 않음
+                signature = self.task_index.cache_signature(doc_id)
+                if self.task_index.is_fresh(doc_id, signature):
+                    self.task_index.set_source_memo(doc_id, source_memo)
+                    continue
+                content = google_api_handler.read_content_cache(doc_id) if signature else None
                 if content is None:
-                    _, markdown_content, _ = google_api_handler.load_doc_content(doc_id, as_html=False)
-                    # 문서 로드에 실패한 경우(None) content는 None으로 유지
-                    if markdown_content is not None:
-                        content = markdown_content
-                        try:
-                            cache_dir = os.path.dirname(cache_path)
-                            if not os.path.exists(cache_dir):
-                                os.makedirs(cache_dir)
-                            with open(cache_path, 'w', encoding='utf-8') as f:
-                                f.write(content)
-                        except Exception as e:
-                            print(f"Error writing cache for {doc_id}: {e}")
-                
-                if content:
-                    contents[doc_id] = {'content': content, 'source_memo': source_memo}
-            
-            self.emitter.tasks_data_loaded.emit(contents)
+                    missing[doc_id] = source_memo
+                elif self.task_index.update(doc_id, content, source_memo, signature):
+                    reparsed += 1
+
+            # 캐시에 없는 문서는 한꺼번에 동시 로드 (받은 내용은 .txt 캐시에 저장됨)
+            for doc_id, _, content in google_api_handler.fetch_doc_contents(missing.keys()):
+                # 문서 로드에 실패한 경우(None)는 건너뜀
+                if content is not None:
+                    if self.task_index.update(doc_id, content, missing[doc_id], self.task_index.cache_signature(doc_id)):
+                        reparsed += 1
+
+            self.task_index.save()
+            self.content_cache.save()
+            self.search_index.save()
+            print(f"할 일 인덱스: 문서 {len(memos)}개 중 {reparsed}개 다시 파싱")
+            self.emitter.tasks_data_loaded.emit(self.task_index.all_tasks([doc_id for doc_id, _ in memos]))
 
         except Exception as e:
             print(f"할 일 데이터 로딩 중 오류: {e}")
@@ -1544,48 +1643,10 @@ class AppController:
         finally:
             self.is_loading_tasks = False
     
-    def process_loaded_tasks(self, contents):
-        tasks = []
-        # 마감일 패턴: @YYYY-MM-DD 또는 @YYYY-MM-DD HH:MM
-        deadline_pattern = re.compile(r'@(\d{4}-\d{2}-\d{2}(?:\s\d{2}:\d{2})?)')
-        # 우선순위 패턴: !p1, !p2, !p3 등
-        priority_pattern = re.compile(r'!p([1-5])')
-
-        for doc_id, data in contents.items():
-            content = data['content']
-            source_memo = data['source_memo']
-            for line in content.split('\n'):
-                stripped_line = line.strip()
-                if stripped_line.startswith(("- [ ] ", "- [x] ")):
-                    is_checked = stripped_line.startswith("- [x] ")
-                    task_text = stripped_line[5:].strip()
-
-                    deadline_str = None
-                    priority_val = None
-                    
-                    # 마감일 찾기
-                    deadline_match = deadline_pattern.search(task_text)
-                    if deadline_match:
-                        deadline_str = deadline_match.group(1)
-                        task_text = task_text.replace(deadline_match.group(0), '').strip()
-                    
-                    # 우선순위 찾기
-                    priority_match = priority_pattern.search(task_text)
-                    if priority_match:
-                        priority_val = int(priority_match.group(1))
-                        task_text = task_text.replace(priority_match.group(0), '').strip()
-
-                    tasks.append({
-                        'doc_id': doc_id,
-                        'line_text': task_text,          # 순수 할 일 텍스트
-                        'original_line': stripped_line,
-                        'source_memo': source_memo,
-                        'is_checked': is_checked,
-                        'deadline': deadline_str,    # @ 파싱 결과 (문자열)
-                        'priority': priority_val,    # !p 파싱 결과 (숫자)
-                    })
-        
+    def process_loaded_tasks(self, tasks):
         self.all_tasks = tasks
+        self.deadline_scheduler.set_tasks(tasks)
+        self.arm_deadline_timer()
         self.apply_task_filter_and_update_ui()
 
     def toggle_todo_dashboard(self):
@@ -1609,6 +1670,8 @@ class AppController:
         for task in self.all_tasks:
             if task['original_line'] == task_info['original_line'] and task['doc_id'] == task_info['doc_id']:
                 task['is_checked'] = is_checked
+                self.deadline_scheduler.add(task) # 완료되면 대기열에서 빠지고, 해제되면 다시 예약
+                self.arm_deadline_timer()
                 break
 
         self.apply_task_filter_and_update_ui()
@@ -1631,14 +1694,13 @@ class AppController:
 
     def update_content_cache_after_toggle(self, task_info, is_checked):
         doc_id = task_info['doc_id']
-        cache_path = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.txt")
-        if not os.path.exists(cache_path): 
+        content = self.content_cache.read_text(doc_id, 'txt')
+        if content is None:
             print(f"Cache file not found for {doc_id}, cannot update.")
             return
         
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            lines = content.splitlines(keepends=True)
 
             new_line_prefix = "- [x] " if is_checked else "- [ ] "
             original_line_lf = task_info['original_line']
@@ -1658,9 +1720,8 @@ class AppController:
                 # 만약 못찾으면, 그냥 새로고침해서 서버로부터 다시 받도록 유도할 수 있음
                 return
 
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
-            print("Content cache updated successfully.")
+            if self.content_cache.write_text(doc_id, 'txt', "".join(new_lines)):
+                print("Content cache updated successfully.")
         except Exception as e:
             print(f"Error updating content cache: {e}")
 
@@ -1669,36 +1730,14 @@ class AppController:
         if geometry_hex:
             self.memo_editor.restoreGeometry(QByteArray.fromHex(geometry_hex.encode('utf-8')))
             
+        self.last_saved_meta[doc_id] = (title, tags_text)
         self.memo_editor.open_document(doc_id, title, markdown_content, tags_text)
     
     def sync_cache_and_reload_tasks(self):
         print("메인 캐시 동기화 시작...")
-        new_data = google_api_handler.load_memo_list()
-        if new_data is not None:
-            with self.cache_lock:
-                # 변경된 문서를 확인하기 위해 이전 캐시의 문서 ID와 날짜를 맵으로 저장
-                old_dates = {row[2]: row[1] for row in self.local_cache if len(row) > 2}
-                self.local_cache = new_data
-                try:
-                    with open(config_manager.CACHE_FILE, 'w', encoding='utf-8') as f:
-                        json.dump(self.local_cache, f, ensure_ascii=False, indent=4)
-                    print("메인 캐시 동기화 완료.")
-                except IOError as e:
-                    print(f"메인 캐시 저장 오류: {e}")
-
-                # 새 목록과 이전 날짜를 비교하여 변경된 문서의 콘텐츠 캐시만 삭제
-                for memo in self.local_cache:
-                    if len(memo) > 2:
-                        doc_id = memo[2]
-                        new_date = memo[1]
-                        if doc_id not in old_dates or old_dates[doc_id] != new_date:
-                            cache_path = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.txt")
-                            if os.path.exists(cache_path):
-                                try:
-                                    os.remove(cache_path)
-                                    print(f"콘텐츠 캐시 무효화 (업데이트됨): {doc_id}")
-                                except OSError as e:
-                                    print(f"콘텐츠 캐시 파일 삭제 오류: {e}")
+        # 증분 동기화: 바뀐 행만 반영하고, 본문이 바뀐 문서의 콘텐츠 캐시만 무효화
+        if self.run_list_sync() is not None:
+            print("메인 캐시 동기화 완료.")
         
         # 최적화된 로드 스레드 시작
         self.load_tasks_thread()
@@ -1727,69 +1766,33 @@ class AppController:
         def sort_key(task):
             # 우선순위, 마감일, 일반 항목 순서로 정렬
             priority = task['priority'] if task['priority'] is not None else 99  # 우선순위 없으면 가장 낮게
-            try:
-                # 시간 정보가 있는 경우 (예: 2024-12-25 10:00)
-                if task['deadline'] and ':' in task['deadline']:
-                    deadline_dt = datetime.strptime(task['deadline'], "%Y-%m-%d %H:%M")
-                # 시간 정보가 없는 경우 (예: 2024-12-25)
-                elif task['deadline']:
-                     deadline_dt = datetime.strptime(task['deadline'], "%Y-%m-%d")
-                else:
-                    deadline_dt = datetime.max # 마감일 없으면 가장 늦게
-            except (ValueError, TypeError):
-                deadline_dt = datetime.max # 마감일 형식 오류 또는 None인 경우 가장 늦게
-            
-            return (priority, deadline_dt) # 우선순위 오름차순, 마감일 오름차순
+            # 마감일은 인덱스에서 미리 파싱한 타임스탬프 사용 (없거나 형식 오류면 가장 늦게)
+            deadline_ts = task.get('deadline_ts')
+            return (priority, deadline_ts if deadline_ts is not None else float('inf')) # 우선순위 오름차순, 마감일 오름차순
         
         tasks_to_show.sort(key=sort_key)
         self.emitter.todo_list_updated.emit(tasks_to_show)
 
+    def arm_deadline_timer(self):
+        delay_ms = self.deadline_scheduler.next_delay_ms()
+        if delay_ms is None:
+            self.notification_timer.stop()
+        else:
+            self.notification_timer.start(delay_ms)
+
     def check_task_deadlines(self):
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] 마감일 알림 검사 시작...")
-        now = datetime.now()
-        today_str = now.date().isoformat()
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] 마감일 알림 검사 ({len(self.deadline_scheduler)}개 대기 중)")
+        today_str = datetime.now().date().isoformat()
 
-        tasks_to_notify = []
+        for task in self.deadline_scheduler.pop_due():
+            # 알림 기록은 한 줄씩 추가 (전체 파일을 다시 쓰지 않음)
+            config_manager.append_notified_task(task_id_of(task), today_str)
+            title = "마감일 알림 ⏰"
+            message = f"할 일: {task['line_text']}\n출처: {task['source_memo']}"
+            print(f"알림 발생: {message}")
+            self.emitter.persistent_notification.emit(title, message, task['doc_id'])
 
-        for task in self.all_tasks:
-            if task['is_checked'] or not task['deadline']:
-                continue
-
-            task_id = f"{task['doc_id']}-{task['original_line']}"
-            
-            try:
-                if ':' in task['deadline']:
-                    deadline_dt = datetime.strptime(task['deadline'], "%Y-%m-%d %H:%M")
-                else:
-                    deadline_dt = datetime.strptime(task['deadline'], "%Y-%m-%d").replace(hour=23, minute=59, second=59)
-
-                if deadline_dt <= now:
-                    last_notified_str = self.notified_tasks.get(task_id)
-                    
-                    if last_notified_str is None:
-                        # Never notified before
-                        tasks_to_notify.append(task)
-                        self.notified_tasks[task_id] = today_str
-                    else:
-                        # Notified before, check if it was on a previous day
-                        last_notified_date = datetime.fromisoformat(last_notified_str).date()
-                        if last_notified_date < now.date():
-                            tasks_to_notify.append(task)
-                            self.notified_tasks[task_id] = today_str
-
-            except (ValueError, TypeError) as e:
-                print(f"마감일 파싱 중 오류 (무시됨): {e}")
-                pass
-
-        if tasks_to_notify:
-            for task in tasks_to_notify:
-                title = "마감일 알림 ⏰"
-                message = f"할 일: {task['line_text']}\n출처: {task['source_memo']}"
-                print(f"알림 발생: {message}")
-                self.emitter.persistent_notification.emit(title, message, task['doc_id'])
-            
-            # Save the updated notification history
-            config_manager.save_notified_tasks(self.notified_tasks)
+        self.arm_deadline_timer()
 
     def view_memo_from_notification(self, doc_id):
         self.view_memo_by_id(doc_id)
@@ -1837,93 +1840,67 @@ class AppController:
         else:
             self.emitter.status_update.emit("그래프 생성 실패.", 5000)
 
+    def index_missing_links(self, doc_ids):
+        """링크 인덱스에 없거나 본문 캐시가 지워진 문서만 .txt 캐시에서 다시 색인.
+        한 번도 색인하지 않은 문서는 캐시에도 없으면 API로 불러옴 (받은 내용은 .txt 캐시에 저장됨)."""
+        missing_ids = []
+        for doc_id in doc_ids:
+            if not self.link_index.needs_update(doc_id):
+                continue
+            content = google_api_handler.read_content_cache(doc_id)
+            if content is not None:
+                self.link_index.update(doc_id, content)
+            elif not self.link_index.has(doc_id):
+                missing_ids.append(doc_id)
+        for doc_id, _, content in google_api_handler.fetch_doc_contents(missing_ids):
+            if content is not None:
+                self.link_index.update(doc_id, content)
+        self.link_index.save()
+
     def build_graph_thread(self):
         try:
             print("[Graph] 지식 그래프 데이터 생성을 시작합니다.")
 
-            # NetworkX 그래프 생성
-            G = nx.DiGraph()
-
             # --- 데이터 준비 ---
-            title_to_id_map = {row[0]: row[2] for row in self.local_cache if len(row) > 2}
-            doc_id_to_info_map = {row[2]: {"title": row[0], "tags": [t.strip().lstrip('#') for t in row[3].replace(',', ' ').split() if t.strip().startswith('#')] if len(row) > 3 and row[3] else []} for row in self.local_cache if len(row) > 2}
-
-            # --- 노드 추가 ---
-            for doc_id, info in doc_id_to_info_map.items():
-                G.add_node(doc_id, label=info['title'], title=f"메모 열기: {info['title']}")
-            print(f"[Graph] {G.number_of_nodes()}개의 노드를 추가했습니다.")
-
-            # --- 엣지 추가 ---
-            link_pattern = re.compile(r'\[\[(.*?)\]\]')
-            for source_doc_id in G.nodes():
-                cache_path = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{source_doc_id}.txt")
-                content = ""
-                if os.path.exists(cache_path):
-                    with open(cache_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                else:
-                    _, content, _ = google_api_handler.load_doc_content(source_doc_id, as_html=False)
-
-                if content:
-                    matches = link_pattern.findall(content)
-                    for target_title in matches:
-                        target_doc_id = title_to_id_map.get(target_title)
-                        if target_doc_id and G.has_node(target_doc_id) and source_doc_id != target_doc_id:
-                            G.add_edge(source_doc_id, target_doc_id)
-            
-            print(f"[Graph] {G.number_of_edges()}개의 엣지를 추가했습니다.")
-
-            # --- 시각적 속성 설정 ---
-            tag_colors = {}
-            def get_tag_color(tag):
-                if tag not in tag_colors:
-                    hue = (hash(tag) & 0xFFFFFF) / 0xFFFFFF
-                    saturation = 0.85
-                    lightness = 0.60
-                    rgb_float = colorsys.hls_to_rgb(hue, lightness, saturation)
-                    color_hex = f"#{int(rgb_float[0] * 255):02x}{int(rgb_float[1] * 255):02x}{int(rgb_float[2] * 255):02x}"
-                    tag_colors[tag] = color_hex
-                return tag_colors[tag]
-
-            # 1. 태그별 색상 매핑
-            all_graph_tags = {tag for doc_id in G.nodes() for tag in doc_id_to_info_map.get(doc_id, {}).get('tags', [])}
-            
-            tag_to_color_map = {tag: get_tag_color(tag) for tag in all_graph_tags}
-
-            # 2. 노드 크기 및 색상 설정
-            in_degrees = G.in_degree()
+            with self.cache_lock:
+                doc_id_to_info_map = {row[2]: {"title": row[0], "tags": self.memo_index.tags_of(row[2])} for row in self.local_cache if len(row) > 2}
+
+            # --- 엣지: 저장된 링크 인덱스에서 (아직 색인하지 않은 문서만 읽음) ---
+            valid_ids = set(doc_id_to_info_map)
+            self.index_missing_links(valid_ids)
+            edges = self.link_index.edges(self.memo_index.id_for_title, valid_ids)
+            in_degrees = {}
+            for _, target_id in edges:
+                in_degrees[target_id] = in_degrees.get(target_id, 0) + 1
+            print(f"[Graph] 노드 {len(doc_id_to_info_map)}개, 엣지 {len(edges)}개")
+
+            # --- 좌표: 캐시된 배치에서 새 노드와 링크가 바뀐 노드만 다시 배치 ---
+            positions = self.graph_layout.update(list(doc_id_to_info_map), edges)
+            self.graph_layout.save()
+
+            # --- 노드: 크기는 받은 링크 수, 색은 첫 번째 태그의 색 ---
             BASE_NODE_SIZE = 12
             SCALE_FACTOR = 4
-            
             nodes_for_vis = []
-            for node_id, data in G.nodes(data=True):
-                degree = in_degrees[node_id]
-                tags = doc_id_to_info_map.get(node_id, {}).get('tags', [])
-                
-                node_color = '#9E9E9E' # 기본 색상
-                if tags:
-                    for tag in tags:
-                        if tag in tag_to_color_map:
-                            node_color = tag_to_color_map[tag]
-                            break
-                
+            for node_id, info in doc_id_to_info_map.items():
+                tags = info['tags']
                 nodes_for_vis.append({
                     "id": node_id,
-                    "label": data['label'],
-                    "title": data['title'],
-                    "size": BASE_NODE_SIZE + (degree * SCALE_FACTOR),
-                    "color": node_color,
-                    "tags": tags
+                    "label": info['title'],
+                    "title": f"메모 열기: {info['title']}",
+                    "size": BASE_NODE_SIZE + (in_degrees.get(node_id, 0) * SCALE_FACTOR),
+                    "color": self.get_tag_color(tags[0]) if tags else '#9E9E9E', # 태그가 없으면 기본 색상
+                    "tags": tags,
+                    "x": round(positions[node_id][0], 1),
+                    "y": round(positions[node_id][1], 1)
                 })
 
             # --- 최종 데이터 생성 ---
-            edges_for_vis = [{"from": u, "to": v} for u, v in G.edges()]
+            edges_for_vis = [{"from": u, "to": v} for u, v in edges]
             
-            tag_info = {}
-            for tag, color in tag_to_color_map.items():
-                count = sum(1 for doc_id in G.nodes() if tag in doc_id_to_info_map.get(doc_id, {}).get('tags', []))
-                if count > 0:
-                    tag_info[tag] = {"color": color, "count": count}
+            # 그래프 노드는 전체 메모이므로 태그별 문서 수는 인덱스 값을 그대로 사용
+            tag_info = {tag: {"color": self.get_tag_color(tag), "count": count}
+                        for tag, count in self.memo_index.tag_counts().items() if count > 0}
 
             graph_data = {"nodes": nodes_for_vis, "edges": edges_for_vis, "tag_info": tag_info}
             
@@ -1935,6 +1912,22 @@ class AppController:
             traceback.print_exc()
             self.emitter.graph_data_generated.emit(None)
 
+    def get_backlinks(self, doc_id):
+        """doc_id를 [[제목]]으로 링크한 메모들의 (doc_id, 제목) 목록 (제목순)"""
+        title = self.memo_index.get_title(doc_id)
+        if not title or self.memo_index.id_for_title(title) != doc_id:
+            return [] # 같은 제목의 다른 문서가 링크 대상인 경우
+        backlinks = []
+        for source_id in self.link_index.backlinks(title, doc_id):
+            source_title = self.memo_index.get_title(source_id)
+            if source_title is not None:
+                backlinks.append((source_id, source_title))
+        backlinks.sort(key=lambda item: item[1])
+        return backlinks
+
+    def on_rich_view_shown(self, doc_id, title, html_content, view_mode_info):
+        self.rich_viewer.set_backlinks(doc_id, self.get_backlinks(doc_id))
+
     def on_graph_node_clicked(self, doc_id):
         self.graph_window.hide()
         self.view_memo_by_id(doc_id)
@@ -1942,14 +1935,7 @@ class AppController:
     def on_viewer_refresh_requested(self, doc_id):
         print(f"뷰어에서 새로고침 요청: {doc_id}")
         # 해당 문서의 로컬 콘텐츠 캐시를 삭제
-        cache_path_html = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.html")
-        cache_path_txt = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.txt")
-        if os.path.exists(cache_path_html):
-            try: os.remove(cache_path_html)
-            except OSError as e: print(f"HTML 캐시 삭제 오류: {e}")
-        if os.path.exists(cache_path_txt):
-            try: os.remove(cache_path_txt)
-            except OSError as e: print(f"TXT 캐시 삭제 오류: {e}")
+        self.content_cache.remove(doc_id, ('txt', 'html'))
         
         # 문서를 다시 로드하여 뷰를 갱신
         self.view_memo_by_id(doc_id)
@@ -1965,23 +1951,10 @@ class AppController:
             self.emitter.show_rich_view.emit(doc_id, "새로고침 중...", loading_html, view_mode_info)
             
             # 추가로 캐시 파일이 남아있으면 강제 삭제
-            cache_path_html = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.html")
-            cache_path_txt = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{doc_id}.txt")
-            if os.path.exists(cache_path_html):
-                try:
-                    os.remove(cache_path_html)
-                    print(f"DEBUG: 추가 캐시 삭제 완료: {cache_path_html}")
-                except OSError as e:
-                    print(f"DEBUG: 추가 캐시 삭제 오류: {e}")
-            if os.path.exists(cache_path_txt):
-                try:
-                    os.remove(cache_path_txt)
-                    print(f"DEBUG: 추가 캐시 삭제 완료: {cache_path_txt}")
-                except OSError as e:
-                    print(f"DEBUG: 추가 캐시 삭제 오류: {e}")
+            self.content_cache.remove(doc_id, ('txt', 'html'))
             
             # Google Drive에서 최신 콘텐츠 가져오기
-            title, html_body, tags_text = google_api_handler.load_doc_content(doc_id, as_html=True)
+            title, html_body, tags_text = google_api_handler.load_doc_content(doc_id, as_html=True, tags_text=self._get_cached_tags(doc_id))
             
             if title and html_body is not None:
                 # 최종 HTML 생성
@@ -2015,7 +1988,7 @@ class AppController:
                 all_memos_item = self.memo_list.nav_tree.findItems("전체 메모", Qt.MatchFixedString | Qt.MatchRecursive, 0)
                 if all_memos_item:
                     self.memo_list.nav_tree.setCurrentItem(all_memos_item[0])
-                self._display_paginated_data(self.local_cache)
+                self._display_memo_rows(self.local_cache)
                 return
             
             nav_id = current_item.data(0, Qt.UserRole)
@@ -2027,245 +2000,96 @@ class AppController:
                     favorites = config_manager.get_favorites()
                     filtered_data = [row for row in self.local_cache if row[2] in favorites]
                     print(f"DEBUG: 즐겨찾기 필터링 결과: {len(filtered_data)}개")
-                    self._display_paginated_data(filtered_data)
+                    self._display_memo_rows(filtered_data)
                 else:
                     # 태그별 필터링
-                    filtered_data = []
-                    for row in self.local_cache:
-                        if len(row) > 3 and row[3]:
-                            tags_in_row = [t.strip().lstrip('#') for t in row[3].replace(',', ' ').split() if t.strip().startswith('#')]
-                            if nav_id in tags_in_row:
-                                filtered_data.append(row)
+                    filtered_data = self.memo_index.rows_for_tag(nav_id)
                     print(f"DEBUG: 태그 '{nav_id}' 필터링 결과: {len(filtered_data)}개")
-                    self._display_paginated_data(filtered_data)
+                    self._display_memo_rows(filtered_data)
             else:
                 # 전체 메모 표시
                 print("DEBUG: 전체 메모 표시")
-                self._display_paginated_data(self.local_cache)
+                self._display_memo_rows(self.local_cache)
                 
         except Exception as e:
             print(f"DEBUG: update_memo_list_table 오류: {e}")
             import traceback
             traceback.print_exc()
     
-    def _display_paginated_data(self, data):
-        """데이터를 페이지 단위로 나누어서 표시 (MOC와 회차 그룹화, 회차는 페이징 제외)"""
-        try:
-            # MOC 문서와 회차들을 그룹화
-            grouped_data = self._group_moc_and_chapters(data)
-            
-            # 페이징을 위한 메인 문서들만 필터링 (회차 제외)
-            main_docs = []
-            for row in grouped_data:
-                # 회차 마커가 없는 문서만 페이징에 포함
-                if len(row) < 5 or row[4] != '_chapter_':
-                    main_docs.append(row)
-            
-            # 전체 페이지 수 계산 (메인 문서만)
-            self.total_local_pages = max(1, (len(main_docs) + self.local_page_size - 1) // self.local_page_size)
-            
-            # 현재 페이지가 전체 페이지를 초과하지 않도록 조정
-            if self.current_local_page > self.total_local_pages:
-                self.current_local_page = self.total_local_pages
-            
-            # 현재 페이지에 해당하는 메인 문서들 추출
-            start_idx = (self.current_local_page - 1) * self.local_page_size
-            end_idx = start_idx + self.local_page_size
-            page_main_docs = main_docs[start_idx:end_idx]
-            
-            # 현재 페이지의 메인 문서들과 그 회차들을 포함한 최종 데이터 구성
-            final_page_data = []
-            for main_doc in page_main_docs:
-                final_page_data.append(main_doc)
-                
-                # 이 메인 문서가 MOC인 경우, 해당 회차들도 추가
-                if len(main_doc) > 3 and main_doc[3] and '#moc' in main_doc[3].lower():
-                    moc_id = main_doc[2] if len(main_doc) > 2 else ""
-                    if hasattr(self, 'series_cache'):
-                        for chapter_id, chapter_info in self.series_cache.items():
-                            if chapter_info.get('parent_moc_id') == moc_id:
-                                # 회차 문서를 grouped_data에서 찾기
-                                for row in grouped_data:
-                                    if len(row) > 2 and row[2] == chapter_id and len(row) > 4 and row[4] == '_chapter_':
-                                        # 회차 마커 제거하고 추가
-                                        chapter_row = row[:-1]  # 마지막 요소(_chapter_) 제거
-                                        final_page_data.append(chapter_row)
-                                        break
-            
-            print(f"DEBUG: 페이징 - 메인 문서 {len(main_docs)}개, 페이지 {self.current_local_page}/{self.total_local_pages}, 표시 {len(final_page_data)}개")
-            
-            # 시리즈 캐시와 함께 데이터 전송
-            series_cache = self.series_cache if hasattr(self, 'series_cache') else {}
-            self.emitter.list_data_loaded.emit(final_page_data, True, series_cache)
-            
-            # 페이징 버튼 상태 업데이트
-            prev_enabled = self.current_local_page > 1
-            next_enabled = self.current_local_page < self.total_local_pages
-            self.memo_list.update_paging_buttons(prev_enabled, next_enabled, self.current_local_page)
-            
-        except Exception as e:
-            print(f"DEBUG: _display_paginated_data 오류: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def _group_moc_and_chapters(self, data):
-        """MOC 문서와 그 회차들을 그룹화하여 페이징 시 MOC만 카운트되도록 함"""
-        try:
-            # MOC 문서와 일반 문서를 분리
-            moc_docs = []
-            regular_docs = []
-            chapter_docs = set()  # 회차 문서 ID들을 추적
-            
-            for row in data:
-                if len(row) > 3 and row[3] and '#moc' in row[3].lower():
-                    moc_docs.append(row)
-                else:
-                    regular_docs.append(row)
-            
-            # 시리즈 캐시에서 회차 문서들 확인
-            if hasattr(self, 'series_cache'):
-                for chapter_id in self.series_cache.keys():
-                    chapter_docs.add(chapter_id)
-            
-            # MOC 문서들을 먼저 추가하고, 각 MOC의 회차들을 찾아서 함께 그룹화
-            grouped_data = []
-            
-            for moc_row in moc_docs:
-                moc_id = moc_row[2] if len(moc_row) > 2 else ""
-                grouped_data.append(moc_row)
-                
-                # 이 MOC의 회차들을 찾아서 추가 (페이징 카운트에는 포함되지 않음)
-                if hasattr(self, 'series_cache'):
-                    for chapter_id, chapter_info in self.series_cache.items():
-                        if chapter_info.get('parent_moc_id') == moc_id:
-                            # 회차 문서를 regular_docs에서 찾기
-                            chapter_found = False
-                            for reg_row in regular_docs:
-                                if len(reg_row) > 2 and reg_row[2] == chapter_id:
-                                    # 회차 문서는 별도 표시를 위해 특별한 마커 추가
-                                    reg_row_with_marker = reg_row + ['_chapter_']  # 회차 마커 추가
-                                    grouped_data.append(reg_row_with_marker)
-                                    chapter_found = True
-                                    break
-                            
-                            # regular_docs에서 찾지 못한 경우, 전체 local_cache에서 찾기
-                            if not chapter_found:
-                                for cache_row in self.local_cache:
-                                    if len(cache_row) > 2 and cache_row[2] == chapter_id:
-                                        # 회차 문서는 별도 표시를 위해 특별한 마커 추가
-                                        cache_row_with_marker = cache_row + ['_chapter_']  # 회차 마커 추가
-                                        grouped_data.append(cache_row_with_marker)
-                                        break
-            
-            # 시리즈에 속하지 않은 일반 문서들 추가
-            for reg_row in regular_docs:
-                reg_id = reg_row[2] if len(reg_row) > 2 else ""
-                if reg_id not in chapter_docs:
-                    grouped_data.append(reg_row)
-            
-            print(f"DEBUG: 그룹화 완료 - MOC: {len(moc_docs)}개, 회차: {len(chapter_docs)}개, 일반: {len(regular_docs) - len(chapter_docs)}개")
-            return grouped_data
-            
-        except Exception as e:
-            print(f"DEBUG: _group_moc_and_chapters 오류: {e}")
-            return data
+    def _display_memo_rows(self, data):
+        """목록 창에 행 전체를 넘김. MOC/회차 묶음과 화면에 보일 만큼씩 불러오기는 목록 모델이 처리"""
+        series_cache = self.series_cache if hasattr(self, 'series_cache') else SeriesIndex()
+        self.emitter.list_data_loaded.emit(list(data), True, series_cache)
 
     def update_series_cache_immediately(self, moc_doc_id, new_chapter_id, new_chapter_title):
         """새 회차 추가 시 시리즈 캐시를 즉시 업데이트"""
         try:
-            # 기존 회차들의 정보를 가져옴
-            existing_chapters = []
-            for chapter_id, info in self.series_cache.items():
-                if info.get('parent_moc_id') == moc_doc_id:
-                    existing_chapters.append(chapter_id)
-            
             # 새 회차를 맨 앞에 추가 (최신 회차)
-            if existing_chapters:
-                # 기존 첫 번째 회차의 이전 회차를 새 회차로 설정
-                first_chapter = existing_chapters[0]
-                if first_chapter in self.series_cache:
-                    self.series_cache[first_chapter]['prev_chapter_id'] = new_chapter_id
-            
-            # 새 회차의 시리즈 정보 설정
-            moc_info = next((row for row in self.local_cache if row[2] == moc_doc_id), None)
+            moc_info = self.memo_index.get(moc_doc_id)
             if moc_info:
-                self.series_cache[new_chapter_id] = {
-                    'parent_moc_id': moc_doc_id,
-                    'parent_moc_title': moc_info[0],
-                    'prev_chapter_id': None,
-                    'next_chapter_id': existing_chapters[0] if existing_chapters else None,
-                    'chapter_title': new_chapter_title
-                }
+                with self.series_lock:
+                    self.series_cache.add_chapter(moc_doc_id, moc_info[0], new_chapter_id, at_front=True,
+                                                  chapter_title=new_chapter_title)
                 print(f"시리즈 캐시에 새 회차 추가: {new_chapter_title}")
         except Exception as e:
             print(f"시리즈 캐시 즉시 업데이트 오류: {e}")
 
-    def rebuild_series_cache_if_needed(self):
-        # 앱 시작 시 또는 데이터 동기화 후 호출되어 시리즈 정보를 재구성합니다.
-        print("시리즈 캐시 재구성 시작...")
-        threading.Thread(target=self.rebuild_series_cache, daemon=True).start()
-
-    def rebuild_series_cache(self):
-        print("DEBUG: rebuild_series_cache 시작")
-        new_series_cache = {}
-        title_to_id_map = {row[0]: row[2] for row in self.local_cache if len(row) > 2}
-        print(f"DEBUG: title_to_id_map 생성됨 - {len(title_to_id_map)}개 항목")
-
-        # 1. 모든 MOC 문서를 찾는다.
-        moc_docs = []
-        for row in self.local_cache:
-            if len(row) > 3 and ('#moc' in row[3].lower() or '#시리즈' in row[3].lower()):
-                moc_docs.append({"id": row[2], "title": row[0]})
-        print(f"DEBUG: MOC 문서 {len(moc_docs)}개 발견")
-
-        # 2. 각 MOC에 대해 회차 목록을 파싱한다.
-        for moc in moc_docs:
-            moc_id = moc['id']
-            moc_title = moc['title']
-            print(f"DEBUG: MOC 처리 중 - {moc_title} ({moc_id})")
-            
-            # MOC의 콘텐츠를 가져온다 (캐시 우선, 없으면 API)
-            content = ""
-            cache_path = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{moc_id}.txt")
-            if os.path.exists(cache_path):
-                with open(cache_path, 'r', encoding='utf-8') as f: content = f.read()
-                print(f"DEBUG: 캐시에서 콘텐츠 로드됨 - 길이: {len(content)}")
-            else:
-                _, content, _ = google_api_handler.load_doc_content(moc_id, as_html=False)
-                if content: 
-                    with open(cache_path, 'w', encoding='utf-8') as f: f.write(content)
-                    print(f"DEBUG: API에서 콘텐츠 로드됨 - 길이: {len(content)}")
-
-            if not content:
-                print(f"DEBUG: 콘텐츠 없음, 건너뜀")
-                continue
+    def update_series_cache_async(self, doc_ids=None, contents=None):
+        # 앱 시작 시, 동기화 후, MOC 저장 후 호출. 시리즈 정보 갱신은 항상 백그라운드에서 합니다.
+        threading.Thread(target=self.update_series_cache, args=(doc_ids, contents), daemon=True).start()
 
-            # 3. 회차 목록을 기반으로 각 회차의 이전/다음 정보를 계산한다.
-            link_pattern = re.compile(r'\[\[(.*?)\]\]')
-            chapter_titles = link_pattern.findall(content)
-            print(f"DEBUG: 링크 패턴으로 찾은 회차 제목들: {chapter_titles}")
-            
-            chapter_ids = [title_to_id_map.get(title) for title in chapter_titles]
-            chapter_ids = [id for id in chapter_ids if id] # None 값 제거
-            print(f"DEBUG: 매핑된 회차 ID들: {chapter_ids}")
+    def update_series_cache(self, doc_ids=None, contents=None):
+        """시리즈 캐시를 증분 갱신 (작업 스레드).
 
-            for i, chapter_id in enumerate(chapter_ids):
-                prev_id = chapter_ids[i-1] if i > 0 else None
-                next_id = chapter_ids[i+1] if i < len(chapter_ids) - 1 else None
-                
-                new_series_cache[chapter_id] = {
-                    "parent_moc_id": moc_id,
-                    "parent_moc_title": moc_title,
-                    "prev_chapter_id": prev_id,
-                    "next_chapter_id": next_id
-                }
-                print(f"DEBUG: 회차 캐시 추가됨 - {chapter_id}: prev={prev_id}, next={next_id}")
-
-        # 4. 완성된 새 캐시를 저장한다.
-        self.series_cache = new_series_cache
-        save_series_cache(self.series_cache)
-        print(f"DEBUG: 시리즈 캐시 재구성 완료. 총 {len(new_series_cache)}개 항목")
-        print(f"DEBUG: 시리즈 캐시 내용: {new_series_cache}")
+        doc_ids가 없으면 모든 MOC를, 있으면 그 문서들 중 MOC만 확인합니다. 본문은 contents(doc_id -> 본문),
+        .txt 캐시 순으로 찾고, 한 번도 파싱하지 않았거나 바뀐 것으로 알려진 MOC만 API로 불러옵니다.
+        본문 해시가 같은 MOC는 다시 파싱하지 않으며, 문서 제목 변화는 저장된 링크 제목만 다시 매핑해 반영합니다.
+        """
+        contents = contents or {}
+        # 1. 현재 MOC 문서 목록
+        with self.cache_lock:
+            moc_titles = {row[2]: row[0] for row in self.local_cache
+                          if len(row) > 3 and ('#moc' in row[3].lower() or '#시리즈' in row[3].lower())}
+
+        # 2. 확인할 MOC의 본문 (바뀌었을 수 있는 것만 API로, 잠금 밖에서)
+        targets = list(moc_titles) if doc_ids is None else [doc_id for doc_id in doc_ids if doc_id in moc_titles]
+        moc_contents = {}
+        missing_ids = []
+        for moc_id in targets:
+            content = contents.get(moc_id)
+            if content is None:
+                content = google_api_handler.read_content_cache(moc_id)
+            if content is not None:
+                moc_contents[moc_id] = content
+            elif doc_ids is not None or self.series_cache.moc_hash(moc_id) is None:
+                missing_ids.append(moc_id)
+        for moc_id, _, content in google_api_handler.fetch_doc_contents(missing_ids):
+            if content is not None:
+                moc_contents[moc_id] = content
+
+        with self.series_lock:
+            series = self.series_cache
+            changed = False
+            for moc_id in series.moc_ids():
+                if moc_id not in moc_titles:
+                    series.remove_moc(moc_id) # 삭제되었거나 MOC 태그가 빠진 문서
+                    changed = True
+
+            # 3. 본문 해시가 바뀐 MOC만 다시 파싱하고, 제목만 바뀐 MOC는 제목만 반영
+            for moc_id, moc_title in moc_titles.items():
+                if moc_id in moc_contents:
+                    if series.update_moc(moc_id, moc_title, moc_contents[moc_id], self.memo_index.id_for_title):
+                        print(f"DEBUG: 시리즈 갱신됨 - {moc_title}: {len(series.children(moc_id))}개 회차")
+                        changed = True
+                elif series.rename_moc(moc_id, moc_title):
+                    changed = True
+
+            # 4. 새로 생기거나 이름이 바뀐/삭제된 회차 문서를 저장된 링크에 다시 매핑
+            if series.relink_titles(self.memo_index.id_for_title):
+                changed = True
+            if changed:
+                save_series_cache(series.to_dict())
+                print(f"DEBUG: 시리즈 캐시 갱신 완료. 총 {len(series)}개 항목")
 
     def on_add_chapter_requested(self):
         if not self.current_viewing_doc_id:
@@ -2273,7 +2097,7 @@ class AppController:
 
         # 1. 부모 MOC 메모의 정보 가져오기
         moc_doc_id = self.current_viewing_doc_id
-        moc_info = next((row for row in self.local_cache if row[2] == moc_doc_id), None)
+        moc_info = self.memo_index.get(moc_doc_id)
         if not moc_info:
             self.emitter.status_update.emit("오류: 현재 MOC 메모 정보를 찾을 수 없습니다.", 4000)
             return
@@ -2296,7 +2120,7 @@ class AppController:
         full_new_title = f"{moc_title} - {chapter_title}"
         initial_content = f"# {chapter_title}\n\n이전 시리즈: [[{moc_title}]]\n\n"
         
-        moc_tags_text = next((row[3] for row in self.local_cache if row[2] == moc_doc_id), "")
+        moc_tags_text = self.memo_index.get_tags(moc_doc_id, "")
         inherited_tags = [t for t in moc_tags_text.replace(',', ' ').split() if t.lower() not in ['#moc', '#시리즈']]
         tags_str = " ".join(inherited_tags)
         
@@ -2308,7 +2132,7 @@ class AppController:
 
         # 2. 부모 MOC 문서에 새 회차 링크 추가 (예쁘게 포맷팅)
         # 먼저 MOC 문서의 현재 내용을 확인하여 목록 섹션 찾기
-        moc_title, moc_content, moc_tags = google_api_handler.load_doc_content(moc_doc_id, as_html=False)
+        moc_title, moc_content, moc_tags = google_api_handler.load_doc_content(moc_doc_id, as_html=False, tags_text=self._get_cached_tags(moc_doc_id))
         
         if moc_content:
             # 기존 회차 개수 세기 (더 정확한 패턴 매칭)
@@ -2375,9 +2199,8 @@ class AppController:
         new_row = [full_new_title, current_date, new_doc_id, tags_str]
         
         # 새 항목이 이미 있는지 확인하고 중복 방지
-        existing_ids = {row[2] for row in self.local_cache if len(row) > 2}
-        if new_doc_id not in existing_ids:
-            self.local_cache.insert(0, new_row)
+        if self.memo_index.insert(new_row, at_top=True):
+            self.memo_store.upsert(new_row, at_top=True)
             print(f"DEBUG: 새 회차가 local_cache에 추가됨: {full_new_title}")
         else:
             print(f"DEBUG: 새 회차가 이미 local_cache에 존재함: {full_new_title}")
@@ -2385,20 +2208,7 @@ class AppController:
         self.update_tags_from_cache()
 
         # 4. MOC 문서의 로컬 콘텐츠 캐시 삭제
-        moc_cache_path_html = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{moc_doc_id}.html")
-        moc_cache_path_txt = os.path.join(config_manager.CONTENT_CACHE_DIR, f"{moc_doc_id}.txt")
-        if os.path.exists(moc_cache_path_html):
-            try: 
-                os.remove(moc_cache_path_html)
-                print(f"DEBUG: MOC HTML 캐시 삭제 완료: {moc_cache_path_html}")
-            except OSError as e: 
-                print(f"MOC HTML 캐시 삭제 오류: {e}")
-        if os.path.exists(moc_cache_path_txt):
-            try: 
-                os.remove(moc_cache_path_txt)
-                print(f"DEBUG: MOC TXT 캐시 삭제 완료: {moc_cache_path_txt}")
-            except OSError as e: 
-                print(f"MOC TXT 캐시 삭제 오류: {e}")
+        self.content_cache.remove(moc_doc_id, ('txt', 'html'))
 
         # 5. UI 업데이트
         self.emitter.status_update.emit("새 회차가 성공적으로 추가되었습니다.", 3000)
@@ -2416,7 +2226,7 @@ class AppController:
         
         # 네비게이션 트리 업데이트
         print("DEBUG: 네비게이션 트리 업데이트")
-        self.emitter.nav_tree_updated.emit(self.all_tags, self.local_cache)
+        self.emit_nav_tree_update()
         
         # 문서 목록 테이블도 즉시 업데이트 (memo_list가 열려있을 때만)
         if hasattr(self, 'memo_list') and self.memo_list.isVisible():
@@ -2429,9 +2239,9 @@ class AppController:
         print("DEBUG: 시리즈 캐시 즉시 업데이트")
         self.update_series_cache_immediately(moc_doc_id, new_doc_id, chapter_title)
         
-        # 6. 백그라운드에서 전체 동기화 실행 (다른 변경사항과의 일관성 유지)
-        print("DEBUG: 백그라운드 동기화 시작")
-        self.rebuild_series_cache_if_needed()
+        # 6. 백그라운드에서 이 MOC만 다시 확인 (다른 변경사항과의 일관성 유지)
+        print("DEBUG: 백그라운드 시리즈 갱신 시작")
+        self.update_series_cache_async([moc_doc_id])
 
         # 7. 새로 생성된 회차의 콘텐츠를 미리 캐싱
         print("DEBUG: 새 회차 콘텐츠 캐싱 시작")
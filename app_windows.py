@@ -1,4 +1,4 @@
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QUrl, QSize, QObject, pyqtSlot
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QUrl, QSize, QObject, pyqtSlot, QAbstractItemModel, QModelIndex
 from datetime import datetime
 from PyQt5.QtWebChannel import QWebChannel
 from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineSettings
@@ -6,7 +6,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLineEdit, QHBoxLayout,
                              QTextEdit, QPushButton, QTableWidget, QTableWidgetItem,
                              QHeaderView, QMessageBox, QMenu, QStatusBar, QLabel,
                              QFormLayout, QCheckBox, QSplitter, QListWidget,
-                             QListWidgetItem, QTreeWidget, QTreeWidgetItem, QFrame,
+                             QListWidgetItem, QTreeWidget, QTreeWidgetItem, QTreeView, QFrame,
                              QFileDialog, QToolBar, QAction, QSizePolicy,QScrollArea, QGraphicsDropShadowEffect)
 from PyQt5.QtGui import QDesktopServices, QFont, QTextCursor, QColor, QCursor, QPixmap, QIcon
 
@@ -23,6 +23,8 @@ class ClickableLabel(QLabel):
 
 from core import config_manager
 from core.utils import get_screen_geometry, center_window, resource_path
+from core.series_index import group_rows, is_moc_row
+from core.graph_layout import cluster_by_tag, neighborhood
 import qtawesome as qta
 import os
 import json
@@ -158,6 +160,8 @@ class RichMemoViewWindow(QWidget):
         self.content_display.setPage(self.page)
         self.page.linkClicked.connect(self.link_activated)
         self.content_display.tags_edit_requested.connect(self.tags_edit_requested.emit)
+        self.content_display.loadFinished.connect(self.on_content_loaded)
+        self.localized_images = {} # 원격 이미지 URL -> 로컬 file:// URL (현재 문서)
         
         # 더블클릭으로 편집 모드 전환
         self.content_display.mouseDoubleClickEvent = self.on_content_double_click
@@ -234,6 +238,12 @@ class RichMemoViewWindow(QWidget):
         zoom_in_action.triggered.connect(self.zoom_in)
         self.toolbar.addAction(zoom_in_action)
 
+        self.backlinks_action = QAction(qta.icon('fa5s.link', color=icon_color), "역링크", self)
+        self.backlinks_action.setToolTip("이 메모를 링크한 메모 목록을 보여줍니다.")
+        self.backlinks_action.setCheckable(True)
+        self.backlinks_action.toggled.connect(self.toggle_backlinks_panel)
+        self.toolbar.addAction(self.backlinks_action)
+
         self.fav_action = QAction(qta.icon('fa5s.star', color='#666'), "즐겨찾기", self)
         self.fav_action.setCheckable(True) # 토글 버튼으로 만듬
         self.fav_action.triggered.connect(self.favorite_toggled.emit)
@@ -262,8 +272,50 @@ class RichMemoViewWindow(QWidget):
         layout.addWidget(toolbar_area)
 
         layout.addWidget(self.content_display)
+
+        # 역링크 패널 (이 메모를 [[제목]]으로 링크한 메모들)
+        self.backlinks_panel = QFrame()
+        self.backlinks_panel.setObjectName("BacklinksPanel")
+        self.backlinks_panel.setStyleSheet("QFrame#BacklinksPanel { border-top: 1px solid #e0e0e0; }")
+        backlinks_layout = QVBoxLayout(self.backlinks_panel)
+        backlinks_layout.setContentsMargins(10, 6, 10, 6)
+        backlinks_layout.setSpacing(4)
+        self.backlinks_label = QLabel("역링크")
+        self.backlinks_label.setStyleSheet("color: #495057; font-weight: bold;")
+        backlinks_layout.addWidget(self.backlinks_label)
+        self.backlinks_list = QListWidget()
+        self.backlinks_list.setMaximumHeight(150)
+        self.backlinks_list.setStyleSheet("border: none;")
+        self.backlinks_list.itemClicked.connect(self.on_backlink_activated)
+        backlinks_layout.addWidget(self.backlinks_list)
+        self.backlinks_panel.setVisible(False)
+        layout.addWidget(self.backlinks_panel)
         self.setLayout(layout)
 
+    def set_backlinks(self, doc_id, backlinks):
+        # backlinks: [(doc_id, 제목), ...]. 그 사이 다른 문서로 넘어갔으면 무시
+        if doc_id != self.current_doc_id:
+            return
+        self.backlinks_list.clear()
+        for source_id, title in backlinks:
+            item = QListWidgetItem(title)
+            item.setData(Qt.UserRole, source_id)
+            self.backlinks_list.addItem(item)
+        if not backlinks:
+            item = QListWidgetItem("이 메모를 링크한 메모가 없습니다.")
+            item.setFlags(Qt.NoItemFlags)
+            self.backlinks_list.addItem(item)
+        self.backlinks_action.setText(f"역링크 ({len(backlinks)})")
+        self.backlinks_label.setText(f"역링크 {len(backlinks)}개")
+
+    def toggle_backlinks_panel(self, checked):
+        self.backlinks_panel.setVisible(checked)
+
+    def on_backlink_activated(self, item):
+        source_id = item.data(Qt.UserRole)
+        if source_id:
+            self.navigation_requested.emit(source_id)
+
     def set_view_mode(self, is_moc, is_chapter, parent_moc_info, prev_chapter_id, next_chapter_id):
         # 1. MOC 자체에서만 '회차 추가' 버튼 보이기
         self.add_chapter_action.setVisible(is_moc)
@@ -338,6 +390,8 @@ class RichMemoViewWindow(QWidget):
             # view_mode_info가 없는 경우 (캐시된 문서 등), 기존 저장된 정보로 뷰 모드 업데이트
             self._update_view_mode_from_stored_info()
         
+        if doc_id != self.current_doc_id:
+            self.localized_images = {} # 같은 문서를 다시 그릴 때는 이미 받은 이미지 교체를 유지 (로딩 후 다시 적용)
         self.current_doc_id = doc_id # 현재 문서 ID 저장
         self.setWindowTitle(title)
         base_url = QUrl.fromLocalFile(os.path.abspath(os.getcwd()).replace('\\', '/') + '/')
@@ -349,6 +403,35 @@ class RichMemoViewWindow(QWidget):
         self.activateWindow()
         self.raise_()
 
+    def swap_image(self, doc_id, url, local_url):
+        # 다운로드가 끝난 이미지의 자리표시자를 로컬 파일로 교체 (페이지를 다시 불러오지 않음)
+        if doc_id != self.current_doc_id:
+            return
+        self.localized_images[url] = local_url
+        self._apply_image_swaps({url: local_url})
+
+    def _apply_image_swaps(self, swaps):
+        if not swaps:
+            return
+        script = """
+        (function(swaps) {
+            var images = document.querySelectorAll('img[data-remote-src]');
+            for (var i = 0; i < images.length; i++) {
+                var url = images[i].getAttribute('data-remote-src');
+                if (!(url in swaps)) continue;
+                if (swaps[url]) { images[i].src = swaps[url]; }
+                else { images[i].src = url; images[i].alt = '이미지 로드 실패: ' + url; }
+                images[i].removeAttribute('data-remote-src');
+            }
+        })(%s);
+        """ % json.dumps(swaps)
+        self.content_display.page().runJavaScript(script)
+
+    def on_content_loaded(self, ok):
+        # 페이지 로딩 중에 도착한 교체는 로딩이 끝난 뒤 한 번에 적용
+        if ok:
+            self._apply_image_swaps(self.localized_images)
+
     def on_refresh_triggered(self):
         if self.current_doc_id:
             self.refresh_requested.emit(self.current_doc_id)
@@ -409,6 +492,7 @@ class RichMemoViewWindow(QWidget):
 
 class MarkdownEditorWindow(QWidget):
     view_requested = pyqtSignal(str)  # 편집 모드에서 보기 모드로 전환 요청
+    preview_cleared = pyqtSignal()  # 미리보기 페이지를 비움 (다음 미리보기는 전체 렌더링)
     
     def __init__(self):
         super().__init__()
@@ -473,10 +557,14 @@ class MarkdownEditorWindow(QWidget):
         self.auto_save_status_label.setAlignment(Qt.AlignLeft)
         self.auto_save_status_label.setStyleSheet("color: #6c757d; padding-top: 5px;") # 위쪽 여백 추가
         self.auto_save_status_label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum) 
+        self.save_queue_label = QLabel("")
+        self.save_queue_label.setAlignment(Qt.AlignRight)
+        self.save_queue_label.setStyleSheet("color: #6c757d; padding-top: 5px;")
 
         tag_layout.addWidget(tag_label);
         tag_layout.addWidget(self.tag_input);
         bottom_layout.addWidget(self.auto_save_status_label)
+        bottom_layout.addWidget(self.save_queue_label)
         main_layout.addLayout(tag_layout)
         main_layout.addLayout(bottom_layout)
         self.setLayout(main_layout)
@@ -485,6 +573,7 @@ class MarkdownEditorWindow(QWidget):
         self.current_doc_id = doc_id; self.setWindowTitle(f'메모 편집: {title}'); self.title_input.setText(title); self.editor.setPlainText(markdown_content); self.tag_input.setText(tags_text); self.show(); self.activateWindow()
     def clear_fields(self):
         self.current_doc_id = None; self.setWindowTitle('새 메모 작성'); self.title_input.clear(); self.editor.clear(); self.viewer.setHtml(""); self.tag_input.clear()
+        self.preview_cleared.emit()
     
     def add_image(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "이미지 선택", "", "Image Files (*.png *.jpg *.bmp *.gif)")
@@ -560,9 +649,27 @@ class MarkdownEditorWindow(QWidget):
             self.auto_save_status_label.setText(f"{status}")
             self.auto_save_status_label.setStyleSheet("color: #6c757d;") # 기본 회색
 
+    def update_save_queue_stats(self, depth, latency_ms):
+        # 저장 대기열 깊이와 마지막 저장 소요 시간 표시 (latency_ms < 0 이면 기록 없음)
+        parts = []
+        if depth > 0:
+            parts.append(f"대기 {depth}건")
+        if latency_ms >= 0:
+            parts.append(f"최근 저장 {latency_ms:.0f}ms")
+        self.save_queue_label.setText(" · ".join(parts))
+
 class KnowledgeGraphWindow(QWidget):
+    """지식 그래프 창.
+
+    좌표는 컨트롤러가 Python에서 미리 계산해 넘기므로 vis-network의 물리 시뮬레이션은 끕니다.
+    그래프 페이지(graph_template.html)는 한 번만 불러오고, 보기가 바뀔 때마다 노드와 링크를 CHUNK_SIZE개씩
+    QWebChannel로 보냅니다 (페이지가 한 덩어리를 그린 뒤 다음 덩어리를 요청).
+    보기: 전체 / 태그 묶음(큰 태그를 노드 하나로 접음, 클릭하면 펼침) / 이웃만(노드 우클릭).
+    """
     node_clicked = pyqtSignal(str)
     tag_clicked = pyqtSignal(str)
+    CHUNK_SIZE = 500
+    LARGE_GRAPH_NODES = 1500 # 노드가 이보다 많으면 처음부터 태그 묶음 보기
 
     def __init__(self):
         super().__init__()
@@ -578,10 +685,23 @@ class KnowledgeGraphWindow(QWidget):
         # WebChannel 설정
         self.channel = QWebChannel()
         self.bridge = GraphSignalBridge()
-        self.bridge.node_clicked.connect(self.node_clicked.emit)
+        self.bridge.node_clicked.connect(self.on_node_clicked)
+        self.bridge.node_focus_requested.connect(self.show_neighborhood)
+        self.bridge.page_ready.connect(self.on_page_ready)
+        self.bridge.chunk_requested.connect(self.send_next_chunk)
         self.channel.registerObject("qt_bridge", self.bridge)
         self.webview.page().setWebChannel(self.channel)
 
+        self.graph_data = None # 전체 그래프 (노드 좌표 포함)
+        self.tag_colors = {}
+        self.view_mode = 'all' # 'all' / 'clusters' / 'neighborhood'
+        self.cluster_mode = False
+        self.expanded_tags = set()
+        self.page_loaded = False
+        self.page_ready = False
+        self.pending_reset = None # 페이지가 준비되면 보낼 보기 정보
+        self.pending_chunks = []
+
         # 범례(Legend) 위젯 추가
         self.legend_scroll_area = QScrollArea(self)
         self.legend_scroll_area.setWidgetResizable(True)
@@ -606,14 +726,50 @@ class KnowledgeGraphWindow(QWidget):
 
     @pyqtSlot(str)
     def on_tag_clicked(self, tag_name):
-        # JavaScript 문자열로 안전하게 전달하기 위해 작은따옴표를 이스케이프
-        safe_tag_name = tag_name.replace("'", "'\'")
-        self.webview.page().runJavaScript(f"highlightNodesByTag('{safe_tag_name}');")
+        # json.dumps로 JavaScript 문자열 리터럴을 만들어 따옴표 등을 안전하게 전달
+        self.webview.page().runJavaScript(f"highlightNodesByTag({json.dumps(tag_name)});")
 
     def on_reset_highlight_clicked(self):
         self.webview.page().runJavaScript("resetHighlight();")
+        if self.view_mode == 'neighborhood' or self.expanded_tags:
+            self.expanded_tags = set()
+            self.show_overview()
+
+    def on_cluster_toggled(self, checked):
+        self.cluster_mode = checked
+        self.expanded_tags = set()
+        self.show_overview()
+
+    def on_node_clicked(self, node_id):
+        if node_id.startswith("tag:"):
+            # 접힌 태그 노드는 펼쳐서 다시 그림
+            self.expanded_tags.add(node_id[len("tag:"):])
+            self.show_overview()
+        else:
+            self.node_clicked.emit(node_id)
 
     def show_graph(self, graph_data, tag_info):
+        self.graph_data = graph_data
+        self.tag_colors = {tag: info['color'] for tag, info in tag_info.items()}
+        self.cluster_mode = len(graph_data['nodes']) > self.LARGE_GRAPH_NODES
+        self.expanded_tags = set()
+        self._rebuild_legend(tag_info)
+
+        # 그래프 페이지는 처음 한 번만 불러옴 (이후에는 데이터만 다시 보냄)
+        if not self.page_loaded:
+            html_template_path = resource_path("resources/graph_template.html")
+            try:
+                with open(html_template_path, 'r', encoding='utf-8') as f:
+                    html_content = f.read()
+            except FileNotFoundError:
+                self.webview.setHtml("<h1>Error: graph_template.html not found</h1>")
+                return
+            base_url = QUrl.fromLocalFile(resource_path("").replace('\\', '/') + '/')
+            self.webview.setHtml(html_content, baseUrl=base_url)
+            self.page_loaded = True
+        self.show_overview()
+
+    def _rebuild_legend(self, tag_info):
         # 범례 업데이트
         while self.legend_layout.count():
             child = self.legend_layout.takeAt(0)
@@ -629,11 +785,18 @@ class KnowledgeGraphWindow(QWidget):
 
         # 강조 해제 버튼 추가
         reset_button = QPushButton("전체 보기")
+        reset_button.setToolTip("강조와 이웃 보기를 해제합니다. (노드 우클릭: 주변 메모만 보기)")
         reset_button.setStyleSheet("background-color: #f0f0f0; border: 1px solid #ccc; padding: 4px; margin-bottom: 5px;")
         reset_button.setCursor(QCursor(Qt.PointingHandCursor))
         reset_button.clicked.connect(self.on_reset_highlight_clicked)
         self.legend_layout.addWidget(reset_button)
 
+        cluster_check = QCheckBox("태그별로 묶기")
+        cluster_check.setToolTip("메모가 많은 태그를 노드 하나로 접습니다. 접힌 노드를 클릭하면 펼칩니다.")
+        cluster_check.setChecked(self.cluster_mode)
+        cluster_check.toggled.connect(self.on_cluster_toggled)
+        self.legend_layout.addWidget(cluster_check)
+
         # 태그 버튼들 추가 (count 기준으로 정렬)
         sorted_tags = sorted(tag_info.items(), key=lambda item: item[1]['count'], reverse=True)
 
@@ -653,36 +816,271 @@ class KnowledgeGraphWindow(QWidget):
             h_layout.addStretch()
             self.legend_layout.addLayout(h_layout)
 
-        # 그래프 표시
-        html_template_path = resource_path("resources/graph_template.html")
-        try:
-            with open(html_template_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-        except FileNotFoundError:
-            self.webview.setHtml("<h1>Error: graph_template.html not found</h1>")
+    # --- 보기 ---
+
+    def show_overview(self):
+        if not self.graph_data:
             return
+        nodes, edges = self.graph_data['nodes'], self.graph_data['edges']
+        if self.cluster_mode:
+            self.view_mode = 'clusters'
+            nodes, edges = cluster_by_tag(nodes, edges, self.tag_colors, expanded=self.expanded_tags)
+        else:
+            self.view_mode = 'all'
+        self._stream_view(nodes, edges)
 
-        base_url = QUrl.fromLocalFile(resource_path("").replace('\\', '/') + '/')
-        self.webview.setHtml(html_content, baseUrl=base_url)
+    def show_neighborhood(self, node_id):
+        if not self.graph_data or node_id.startswith("tag:"):
+            return
+        selected = neighborhood(node_id, [(edge['from'], edge['to']) for edge in self.graph_data['edges']])
+        nodes = [node for node in self.graph_data['nodes'] if node['id'] in selected]
+        edges = [edge for edge in self.graph_data['edges'] if edge['from'] in selected and edge['to'] in selected]
+        self.view_mode = 'neighborhood'
+        self._stream_view(nodes, edges, focus_id=node_id)
+
+    # --- 페이지로 나눠 보내기 ---
+
+    def _stream_view(self, nodes, edges, focus_id=None):
+        chunks = []
+        for start in range(0, len(nodes), self.CHUNK_SIZE):
+            chunks.append({"nodes": nodes[start:start + self.CHUNK_SIZE], "edges": []})
+        for start in range(0, len(edges), self.CHUNK_SIZE * 2):
+            chunks.append({"nodes": [], "edges": edges[start:start + self.CHUNK_SIZE * 2]})
+        self.pending_chunks = chunks
+        self.pending_reset = {"mode": self.view_mode, "nodes": len(nodes), "edges": len(edges), "focus": focus_id}
+        if self.page_ready:
+            self._send_reset()
+
+    def _send_reset(self):
+        reset = self.pending_reset
+        if reset is None:
+            return
+        self.pending_reset = None
+        self.bridge.graph_reset.emit(json.dumps(reset, ensure_ascii=False))
+        self.send_next_chunk()
 
-        graph_data_json = json.dumps(graph_data)
+    def on_page_ready(self):
+        self.page_ready = True
+        self._send_reset()
 
-        # loadFinished 시그널이 여러번 연결되는 것을 방지
-        try:
-            self.webview.loadFinished.disconnect()
-        except TypeError:
-            pass # 연결이 안되어있을 때 오류 방지
-        self.webview.loadFinished.connect(
-            lambda: self.webview.page().runJavaScript(f"drawGraph({graph_data_json})")
-        )
+    def send_next_chunk(self):
+        if self.pending_chunks:
+            self.bridge.graph_chunk.emit(json.dumps(self.pending_chunks.pop(0), ensure_ascii=False))
+        else:
+            self.bridge.graph_done.emit()
 
 class GraphSignalBridge(QObject):
+    """그래프 페이지(JavaScript)와 주고받는 QWebChannel 객체 (qt_bridge)"""
     node_clicked = pyqtSignal(str)
+    node_focus_requested = pyqtSignal(str)
+    page_ready = pyqtSignal()
+    chunk_requested = pyqtSignal()
+    # Python -> 페이지
+    graph_reset = pyqtSignal(str)
+    graph_chunk = pyqtSignal(str)
+    graph_done = pyqtSignal()
 
     @pyqtSlot(str)
     def on_node_clicked(self, node_id):
         self.node_clicked.emit(node_id)
 
+    @pyqtSlot(str)
+    def on_node_focus(self, node_id):
+        self.node_focus_requested.emit(node_id)
+
+    @pyqtSlot()
+    def on_ready(self):
+        self.page_ready.emit()
+
+    @pyqtSlot()
+    def next_chunk(self):
+        self.chunk_requested.emit()
+
+
+class _MemoNode:
+    __slots__ = ('doc_id', 'row', 'kind', 'parent', 'position', 'children')
+
+    def __init__(self, row, kind, parent, position):
+        self.doc_id = row[2]
+        self.row = row
+        self.kind = kind # 'moc' / 'chapter' / 'doc'
+        self.parent = parent
+        self.position = position
+        self.children = []
+
+class MemoListModel(QAbstractItemModel):
+    """메모 목록 트리 모델 (MOC -> 회차 2단계).
+
+    행은 MemoIndex의 행 리스트를 그대로 참조하므로, 메모 하나가 바뀌면 refresh_doc으로 그 행만 다시 그립니다.
+    최상위 행은 스크롤이 끝에 닿을 때마다 FETCH_BATCH개씩 뷰에 알려 주고(fetchMore),
+    아이콘과 글꼴은 한 번만 만들어 재사용합니다.
+    """
+    COLUMNS = ['', '제목', '태그', '날짜']
+    FETCH_BATCH = 200
+
+    def __init__(self, row_lookup=None, parent=None):
+        super().__init__(parent)
+        self.row_lookup = row_lookup # doc_id -> 행 (목록에 없는 회차를 찾을 때)
+        self._top = []
+        self._loaded = 0
+        self._nodes = {} # doc_id -> 노드
+        self._favorites = set()
+        self._icons = {}
+        self._fonts = {}
+
+    # --- 데이터 교체 ---
+
+    def set_rows(self, rows, series_cache=None, grouped=True):
+        """grouped면 MOC 아래에 회차를 붙이고 회차는 최상위에서 뺌 (series_cache는 SeriesIndex). 아니면 주어진 순서 그대로."""
+        self.beginResetModel()
+        self._top = []
+        self._nodes = {}
+        if grouped:
+            for row, chapter_rows in group_rows(rows, series_cache, self.row_lookup):
+                if chapter_rows is None:
+                    self._add_node(row, 'doc', None, self._top)
+                    continue
+                node = self._add_node(row, 'moc', None, self._top)
+                for chapter_row in chapter_rows:
+                    self._add_node(chapter_row, 'chapter', node, node.children)
+        else:
+            for row in rows:
+                if len(row) > 2:
+                    self._add_node(row, 'moc' if is_moc_row(row) else 'doc', None, self._top)
+        self._loaded = min(self.FETCH_BATCH, len(self._top))
+        self.endResetModel()
+
+    def _add_node(self, row, kind, parent, siblings):
+        node = _MemoNode(row, kind, parent, len(siblings))
+        siblings.append(node)
+        self._nodes[node.doc_id] = node
+        return node
+
+    def top_level_count(self):
+        return len(self._top)
+
+    # --- 행 단위 갱신 ---
+
+    def _is_visible(self, node):
+        top = node.parent or node
+        return top.position < self._loaded
+
+    def _emit_row_changed(self, node, first_column=0, last_column=3):
+        if self._is_visible(node):
+            self.dataChanged.emit(self.createIndex(node.position, first_column, node),
+                                  self.createIndex(node.position, last_column, node))
+
+    def refresh_doc(self, doc_id):
+        """바뀐 메모 한 줄만 다시 그림. MOC 여부가 바뀌어 트리 구조를 다시 짜야 하면 False."""
+        node = self._nodes.get(doc_id)
+        if node is None:
+            return True
+        if self.row_lookup:
+            row = self.row_lookup(doc_id)
+            if row is not None:
+                node.row = row
+        if node.kind != 'chapter' and (node.kind == 'moc') != is_moc_row(node.row):
+            return False
+        self._emit_row_changed(node)
+        return True
+
+    def set_favorites(self, favorites):
+        self._favorites = set(favorites)
+        if self._loaded:
+            self.dataChanged.emit(self.index(0, 0), self.index(self._loaded - 1, 0))
+
+    def set_favorite(self, doc_id, is_favorite):
+        if is_favorite:
+            self._favorites.add(doc_id)
+        else:
+            self._favorites.discard(doc_id)
+        node = self._nodes.get(doc_id)
+        if node is not None:
+            self._emit_row_changed(node, 0, 0)
+
+    # --- QAbstractItemModel ---
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        siblings = parent.internalPointer().children if parent.isValid() else self._top
+        return self.createIndex(row, column, siblings[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None:
+            return QModelIndex()
+        return self.createIndex(parent_node.position, 0, parent_node)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return self._loaded
+        if parent.column() > 0:
+            return 0
+        return len(parent.internalPointer().children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._loaded < len(self._top)
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._top) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+        row = node.row
+        if role == Qt.DisplayRole:
+            if column == 1:
+                prefix = {'moc': "📚 ", 'chapter': "  📄 ", 'doc': "📄 "}[node.kind]
+                return prefix + (row[0] if row else "")
+            if column == 2:
+                return row[3] if len(row) > 3 else ""
+            if column == 3:
+                return row[1] if len(row) > 1 else ""
+        elif role == Qt.DecorationRole and column == 0:
+            return self._star_icon(node.doc_id in self._favorites)
+        elif role == Qt.UserRole:
+            return node.doc_id
+        elif role == Qt.FontRole and column == 1:
+            return self._font(node.kind)
+        elif role == Qt.TextAlignmentRole and column in (2, 3):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def _star_icon(self, is_favorite):
+        icon = self._icons.get(is_favorite)
+        if icon is None:
+            icon = self._icons[is_favorite] = qta.icon('fa5s.star', color='#f0c420' if is_favorite else '#ced4da')
+        return icon
+
+    def _font(self, kind):
+        font = self._fonts.get(kind)
+        if font is None:
+            if kind == 'moc':
+                font = QFont("Segoe UI", 10, QFont.Bold)
+            else:
+                font = QFont("Segoe UI", 9 if kind == 'chapter' else 10)
+            self._fonts[kind] = font
+        return font
 
 class MemoListWindow(QWidget):
     navigation_selected = pyqtSignal(str);
@@ -917,34 +1315,34 @@ class MemoListWindow(QWidget):
         table_layout = QVBoxLayout(table_container)
         table_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.table = QTreeWidget()
-        self.table.setColumnCount(4)
-        self.table.setHeaderLabels(['', '제목', '태그', '날짜'])  # 태그와 날짜 순서 변경
+        # 전체 목록을 한 번에 보여 주되, 행은 모델이 스크롤에 맞춰 조금씩 내줌
+        self.table_model = MemoListModel()
+        self.table = QTreeView()
+        self.table.setModel(self.table_model)
+        self.table.setUniformRowHeights(True) # 행 높이가 같다고 알려 주면 긴 목록도 스크롤이 가벼움
         self.table.setColumnWidth(0, 50)  # 즐겨찾기 컬럼 초기 너비 (더 작게)
         self.table.setColumnWidth(2, 100)  # 태그 컬럼 초기 너비 (최소한으로)
         self.table.setColumnWidth(3, 150)  # 날짜 컬럼 초기 너비 (최소한으로)
         self.table.header().setSectionResizeMode(0, QHeaderView.Fixed) # 즐겨찾기 열 고정
         self.table.header().setSectionResizeMode(1, QHeaderView.Stretch) # 제목 열 너비 확장 (가장 넓게)
-        # self.table.header().setSectionResizeMode(2, QHeaderView.Fixed) # 태그 열 완전 고정
-        # self.table.header().setSectionResizeMode(3, QHeaderView.Fixed) # 날짜 열 완전 고정
         self.table.header().setStretchLastSection(False)  # 마지막 섹션 자동 확장 비활성화
         self.table.setRootIsDecorated(True) # 루트 아이템에 화살표 표시
         self.table.setAlternatingRowColors(True) # 번갈아가며 색상 표시
         self.table.setStyleSheet("""
-            QTreeWidget {
+            QTreeView {
                 background-color: transparent;
                 border: none;
                 font-size: 10pt;
             }
-            QTreeWidget::item {
+            QTreeView::item {
                 padding: 8px 4px;
                 border-bottom: 1px solid #f1f3f5;
             }
-            QTreeWidget::item:selected {
+            QTreeView::item:selected {
                 background-color: #e3f2fd;
                 color: #1976d2;
             }
-            QTreeWidget::item:hover {
+            QTreeView::item:hover {
                 background-color: #f5f5f5;
             }
             /* 스크롤바 스타일링 */
@@ -1004,44 +1402,19 @@ class MemoListWindow(QWidget):
         table_layout.addWidget(self.table)
         right_layout.addWidget(table_container)
 
-        # --- 4. 페이징 컨트롤 ---
-        paging_container = QFrame()
-        paging_container.setObjectName("PagingContainer")
-        paging_container.setStyleSheet("""
-            #PagingContainer {
-                background-color: #f8f9fa;
-                border: 1px solid #e9ecef;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
-        paging_layout = QHBoxLayout(paging_container)
-        paging_layout.setContentsMargins(8, 8, 8, 8)
-        paging_layout.setSpacing(8)
-        
-        self.prev_button = QPushButton(qta.icon('fa5s.chevron-left', color='#495057'), "")
-        self.prev_button.setObjectName("PagingButton")
-        self.prev_button.setToolTip("이전 페이지")
-        
-        self.page_label = QLabel("1 페이지")
-        self.page_label.setAlignment(Qt.AlignCenter)
-        self.page_label.setStyleSheet("""
+        # --- 4. 목록 개수 ---
+        self.count_label = QLabel("")
+        self.count_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        self.count_label.setStyleSheet("""
             QLabel {
-                font-weight: 600;
-                color: #495057;
+                color: #6c757d;
+                font-size: 9pt;
                 background: transparent;
                 border: none;
+                padding: 2px 4px;
             }
         """)
-        
-        self.next_button = QPushButton(qta.icon('fa5s.chevron-right', color='#495057'), "")
-        self.next_button.setObjectName("PagingButton")
-        self.next_button.setToolTip("다음 페이지")
-
-        paging_layout.addWidget(self.prev_button)
-        paging_layout.addWidget(self.page_label)
-        paging_layout.addWidget(self.next_button)
-        right_layout.addWidget(paging_container)
+        right_layout.addWidget(self.count_label)
 
         # ===================================================================
         # 스플리터 및 메인 레이아웃에 위젯 배치
@@ -1055,8 +1428,8 @@ class MemoListWindow(QWidget):
         # 시그널(Signal) / 슬롯(Slot) 연결
         # ===================================================================
         self.nav_tree.currentItemChanged.connect(self.on_nav_selected)
-        self.table.itemClicked.connect(self.on_item_clicked)
-        self.table.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.table.clicked.connect(self.on_item_clicked)
+        self.table.doubleClicked.connect(self.on_item_double_clicked)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.context_menu_requested.emit)
 
@@ -1068,12 +1441,11 @@ class MemoListWindow(QWidget):
             else:
                 self.navigation_selected.emit(current.text(0))
 
-    def update_nav_tree(self, all_tags, local_cache):
+    def update_nav_tree(self, tag_counts, all_memos_count):
         self.nav_tree.blockSignals(True)
         self.nav_tree.clear()
 
         # 전체 메모 카운트 (첫 번째로 배치)
-        all_memos_count = len(local_cache)
         all_memos_item = QTreeWidgetItem(self.nav_tree)
         all_memos_item.setText(0, f"전체 메모 ({all_memos_count})")
         all_memos_item.setIcon(0, qta.icon('fa5s.inbox', color='#495057'))
@@ -1092,21 +1464,13 @@ class MemoListWindow(QWidget):
         separator.setText(0, "──────────")
         separator.setFlags(separator.flags() & ~Qt.ItemIsSelectable) # 선택 불가능하게 설정
 
-        if all_tags:
+        if tag_counts:
             tags_root_item = QTreeWidgetItem(self.nav_tree)
-            tags_root_item.setText(0, f"태그 ({len(all_tags)})")
+            tags_root_item.setText(0, f"태그 ({len(tag_counts)})")
             tags_root_item.setIcon(0, qta.icon('fa5s.tags', color='#495057'))
             tags_root_item.setFont(0, QFont("Segoe UI", 10, QFont.Bold))
             
-            # 각 태그의 문서 수 계산
-            tag_counts = {}
-            for row in local_cache:
-                if len(row) > 3 and row[3]:
-                    tags_in_row = [t.strip().lstrip('#') for t in row[3].replace(',', ' ').split() if t.strip().startswith('#')]
-                    for tag in tags_in_row:
-                        tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-            for tag in sorted(all_tags):
+            for tag in sorted(tag_counts):
                 count = tag_counts.get(tag, 0)
                 tag_item = QTreeWidgetItem(tags_root_item)
                 tag_item.setText(0, f"{tag} ({count})")
@@ -1118,145 +1482,13 @@ class MemoListWindow(QWidget):
         self.nav_tree.blockSignals(False)
 
     def populate_table(self, data, is_local, series_cache=None):
-        # 페이징 버튼은 항상 표시 (로컬 캐시와 API 검색 모두 지원)
-        self.prev_button.setVisible(True)
-        self.next_button.setVisible(True)
-        self.page_label.setVisible(True)
-        
-        self.table.clear()
-        
-        favorites = config_manager.get_favorites()
-        
-        # 시리즈 캐시가 제공된 경우 사용, 없으면 빈 딕셔너리
-        if series_cache is None:
-            series_cache = {}
-        
-        # MOC 문서들과 일반 문서들을 분리
-        moc_docs = []
-        regular_docs = []
-        
-        for row in data:
-            title = row[0] if len(row) > 0 else ""
-            date = row[1] if len(row) > 1 else ""
-            doc_id = row[2] if len(row) > 2 else ""
-            tags = row[3] if len(row) > 3 else ""
-            
-            # MOC 문서인지 확인
-            if tags and '#moc' in tags.lower():
-                moc_docs.append(row)
-            else:
-                regular_docs.append(row)
-        
-        # MOC 문서들을 먼저 추가하고 하위 회차들을 연결
-        for moc_row in moc_docs:
-            title = moc_row[0] if len(moc_row) > 0 else ""
-            date = moc_row[1] if len(moc_row) > 1 else ""
-            doc_id = moc_row[2] if len(moc_row) > 2 else ""
-            tags = moc_row[3] if len(moc_row) > 3 else ""
-            
-            # MOC 아이템 생성
-            moc_item = QTreeWidgetItem()
-            moc_item.setText(1, f"📚 {title}")  # MOC 아이콘 추가
-            moc_item.setText(2, tags)  # 태그 (2번 컬럼)
-            moc_item.setText(3, date)  # 날짜 (3번 컬럼)
-            moc_item.setData(0, Qt.UserRole, doc_id)
-            moc_item.setData(1, Qt.UserRole, doc_id)
-            moc_item.setData(2, Qt.UserRole, doc_id)
-            moc_item.setData(3, Qt.UserRole, doc_id)
-            
-            # 컬럼 정렬 설정
-            moc_item.setTextAlignment(2, Qt.AlignRight | Qt.AlignVCenter)  # 태그 오른쪽 정렬
-            moc_item.setTextAlignment(3, Qt.AlignRight | Qt.AlignVCenter)  # 날짜 오른쪽 정렬
-            
-            # 즐겨찾기 아이콘 설정
-            is_favorite = doc_id in favorites
-            icon = qta.icon('fa5s.star', color='#f0c420') if is_favorite else qta.icon('fa5s.star', color='#ced4da')
-            moc_item.setIcon(0, icon)
-            
-            # MOC 아이템 스타일 설정
-            moc_item.setFont(1, QFont("Segoe UI", 10, QFont.Bold))  # 제목을 굵게
-            
-            # MOC 아이템을 트리에 추가
-            self.table.addTopLevelItem(moc_item)
-            
-            # 시리즈 캐시에서 이 MOC의 회차들을 찾아서 하위 아이템으로 추가
-            for chapter_doc_id, chapter_info in series_cache.items():
-                if chapter_info.get('parent_moc_id') == doc_id:
-                    # 해당 회차의 정보를 regular_docs에서 찾기
-                    chapter_row = None
-                    for row in regular_docs:
-                        if len(row) > 2 and row[2] == chapter_doc_id:
-                            chapter_row = row
-                            break
-                    
-                    if chapter_row:
-                        chapter_title = chapter_row[0] if len(chapter_row) > 0 else ""
-                        chapter_date = chapter_row[1] if len(chapter_row) > 1 else ""
-                        chapter_tags = chapter_row[3] if len(chapter_row) > 3 else ""
-                        
-                        # 회차 아이템 생성
-                        chapter_item = QTreeWidgetItem()
-                        chapter_item.setText(1, f"  📄 {chapter_title}")  # 회차 아이콘과 들여쓰기
-                        chapter_item.setText(2, chapter_tags)  # 태그 (2번 컬럼)
-                        chapter_item.setText(3, chapter_date)  # 날짜 (3번 컬럼)
-                        chapter_item.setData(0, Qt.UserRole, chapter_doc_id)
-                        chapter_item.setData(1, Qt.UserRole, chapter_doc_id)
-                        chapter_item.setData(2, Qt.UserRole, chapter_doc_id)
-                        chapter_item.setData(3, Qt.UserRole, chapter_doc_id)
-                        
-                        # 컬럼 정렬 설정
-                        chapter_item.setTextAlignment(2, Qt.AlignRight | Qt.AlignVCenter)  # 태그 오른쪽 정렬
-                        chapter_item.setTextAlignment(3, Qt.AlignRight | Qt.AlignVCenter)  # 날짜 오른쪽 정렬
-                        
-                        # 회차 즐겨찾기 아이콘
-                        is_chapter_favorite = chapter_doc_id in favorites
-                        chapter_icon = qta.icon('fa5s.star', color='#f0c420') if is_chapter_favorite else qta.icon('fa5s.star', color='#ced4da')
-                        chapter_item.setIcon(0, chapter_icon)
-                        
-                        # 회차 아이템 스타일 설정
-                        chapter_item.setFont(1, QFont("Segoe UI", 9))  # 회차는 일반 폰트
-                        
-                        moc_item.addChild(chapter_item)
-        
-        # 시리즈에 속하지 않은 일반 문서들 추가
-        for row in regular_docs:
-            doc_id = row[2] if len(row) > 2 else ""
-            
-            # 이미 시리즈에 포함된 문서인지 확인
-            is_chapter = any(chapter_info.get('parent_moc_id') for chapter_info in series_cache.values() if chapter_info.get('parent_moc_id'))
-            is_chapter = is_chapter and doc_id in series_cache
-            
-            if not is_chapter:
-                title = row[0] if len(row) > 0 else ""
-                date = row[1] if len(row) > 1 else ""
-                tags = row[3] if len(row) > 3 else ""
-                
-                # 일반 문서 아이템 생성
-                doc_item = QTreeWidgetItem()
-                doc_item.setText(1, f"📄 {title}")
-                doc_item.setText(2, tags)  # 태그 (2번 컬럼)
-                doc_item.setText(3, date)  # 날짜 (3번 컬럼)
-                doc_item.setData(0, Qt.UserRole, doc_id)
-                doc_item.setData(1, Qt.UserRole, doc_id)
-                doc_item.setData(2, Qt.UserRole, doc_id)
-                doc_item.setData(3, Qt.UserRole, doc_id)
-                
-                # 컬럼 정렬 설정
-                doc_item.setTextAlignment(2, Qt.AlignRight | Qt.AlignVCenter)  # 태그 오른쪽 정렬
-                doc_item.setTextAlignment(3, Qt.AlignRight | Qt.AlignVCenter)  # 날짜 오른쪽 정렬
-                
-                # 즐겨찾기 아이콘
-                is_favorite = doc_id in favorites
-                icon = qta.icon('fa5s.star', color='#f0c420') if is_favorite else qta.icon('fa5s.star', color='#ced4da')
-                doc_item.setIcon(0, icon)
-                
-                # 일반 문서 아이템 스타일 설정
-                doc_item.setFont(1, QFont("Segoe UI", 10))  # 일반 폰트
-                
-                self.table.addTopLevelItem(doc_item)
-    
-    def update_paging_buttons(self, prev_enabled, next_enabled, page_num):
-        self.prev_button.setEnabled(prev_enabled); self.next_button.setEnabled(next_enabled); self.page_label.setText(f"{page_num} 페이지")
+        # 로컬 목록은 MOC 아래에 회차를 묶고, 검색 결과(is_local=False)는 순위 그대로 보여 줌
+        self.table_model.set_rows(data, series_cache, grouped=is_local)
+        self.count_label.setText(f"{self.table_model.top_level_count()}개")
+
+    def doc_id_at(self, pos):
+        index = self.table.indexAt(pos)
+        return index.data(Qt.UserRole) if index.isValid() else None
     
     def show_status_message(self, message, message_type="info"):
         """상태 표시바에 메시지를 표시합니다.
@@ -1317,24 +1549,21 @@ class MemoListWindow(QWidget):
             }
         """)
     
-    def on_item_clicked(self, item, column):
-        if column == 0: # 0번 열(즐겨찾기 아이콘)이 클릭되었을 때
-            doc_id = item.data(0, Qt.UserRole)
-            if doc_id:
-                self.favorite_toggled_from_list.emit(doc_id)
+    def on_item_clicked(self, index):
+        doc_id = index.data(Qt.UserRole)
+        if not doc_id:
+            return
+        if index.column() == 0: # 0번 열(즐겨찾기 아이콘)이 클릭되었을 때
+            self.favorite_toggled_from_list.emit(doc_id)
         else:
-            # 다른 열 클릭 시 - 시리즈 문서인지 확인
-            doc_id = item.data(0, Qt.UserRole)
-            if doc_id:
-                # MOC 문서인지 확인 (📚 아이콘이 있으면 MOC)
-                title_text = item.text(1)
-                if "📚" in title_text and item.childCount() > 0:
-                    # MOC 문서이고 하위 아이템이 있으면 펼치기/접기
-                    item.setExpanded(not item.isExpanded())
+            # MOC 문서이고 하위 회차가 있으면 펼치기/접기
+            first_column = index.sibling(index.row(), 0)
+            if self.table_model.hasChildren(first_column):
+                self.table.setExpanded(first_column, not self.table.isExpanded(first_column))
     
-    def on_item_double_clicked(self, item, column):
+    def on_item_double_clicked(self, index):
         # 더블클릭 시 해당 문서 열기
-        doc_id = item.data(0, Qt.UserRole)
+        doc_id = index.data(Qt.UserRole)
         if doc_id:
             # 시그널을 통해 컨트롤러에 알림
             self.memo_selected.emit(doc_id)
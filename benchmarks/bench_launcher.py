@@ -0,0 +1,95 @@
+"""
+빠른 실행 창 제목 검색 벤치마크.
+
+제목 2만 개에서 한 글자씩 입력하는 검색어마다, 이전 방식(모든 행에 대해 `query in title` 후 전부 반환)과
+core.launcher_matcher.LauncherMatcher.search의 처리 시간을 비교합니다. 목표는 검색당 5 ms 미만입니다.
+오래된(우선순위가 낮은) 메모라도 제목 전체가 검색어와 같으면 맨 위에 나오는지도 확인합니다.
+
+    python benchmarks/bench_launcher.py [--titles 20000] [--limit 50]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.launcher_matcher import LauncherMatcher
+
+WORDS = ["회의록", "프로젝트", "일기", "독서", "메모", "아이디어", "계획", "정리", "공부", "여행", "레시피", "주간",
+         "Python", "Qt", "Google", "Docs", "API", "design", "review", "todo", "2024", "v2", "draft", "notes"]
+# 가장 오래된 날짜로 추가하는 제목 -> 이 제목을 그대로 검색하면 맨 위에 나와야 함
+EXACT_TITLES = {"프로젝트": "exact-0", "Qt": "exact-1"}
+QUERIES = ["회의록 2024", "ㅎㅇㄹ", "프로젝트", "pyqt", "google docs", "gd", "아이디어 정리", "ㅇㄱ", "review", "여행 계획"]
+
+
+def build_rows(count):
+    rng = random.Random(42)
+    rows = []
+    for i in range(count):
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))) + f" {i}"
+        date = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00:00"
+        rows.append([title, date, f"doc-{i}", ""])
+    return rows
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def keystrokes(query):
+    # 입력 도중의 검색어를 모두 (한글은 음절 단위로)
+    return [query[:n] for n in range(1, len(query) + 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--titles", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = build_rows(args.titles)
+    rows += [[title, "2000-01-01 00:00:00", doc_id, ""] for title, doc_id in EXACT_TITLES.items()]
+    favorites = [f"doc-{i}" for i in range(0, args.titles, 97)]
+    typed = [prefix for query in QUERIES for prefix in keystrokes(query)]
+
+    legacy_times = []
+    for query in typed:
+        started = time.perf_counter()
+        [row[:3] for row in rows if query.lower() in row[0].lower()]
+        legacy_times.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    matcher = LauncherMatcher(rows, favorites)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    # 첫 번째 회차는 n-gram 비트마스크와 경계 보너스를 처음 만드는 비용까지 포함
+    passes = []
+    for _ in range(2):
+        times = []
+        for query in [""] + typed:
+            started = time.perf_counter()
+            matcher.search(query, args.limit)
+            times.append((time.perf_counter() - started) * 1000)
+        passes.append(times)
+
+    print(f"제목 {len(rows)}개, 검색어 {len(typed)}개 (입력 도중 포함)")
+    print(f"  이전 방식 (부분 문자열): 평균 {statistics.mean(legacy_times):6.2f} ms, p95 {percentile(legacy_times, 0.95):6.2f} ms")
+    print(f"  LauncherMatcher 구성   : {build_ms:8.1f} ms")
+    for label, times in zip(("첫 검색", "반복 검색"), passes):
+        print(f"  LauncherMatcher {label:<6}: 평균 {statistics.mean(times):6.2f} ms, p95 {percentile(times, 0.95):6.2f} ms, "
+              f"최대 {max(times):6.2f} ms")
+    for title, doc_id in EXACT_TITLES.items():
+        for query in (title, title.lower()):
+            top = matcher.search(query, args.limit)
+            assert top and top[0][2] == doc_id, f"'{query}' 정확히 같은 제목이 맨 위에 없음: {top[:3]}"
+    print(f"  정확히 같은 제목 {len(EXACT_TITLES)}개가 모두 맨 위에 나옴 (가장 오래된 날짜)")
+    for query in QUERIES[:4]:
+        print(f"  '{query}' -> {[title for title, _, _ in matcher.search(query, 3)]}")
+
+
+if __name__ == "__main__":
+    main()
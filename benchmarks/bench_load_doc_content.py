@@ -0,0 +1,90 @@
+"""
+load_doc_content의 시트 왕복 횟수 비교 벤치마크.
+
+가짜 Docs/Sheets 백엔드로 1,000번의 문서 보기를 흉내 내고,
+태그를 시트에서 다시 읽는 경우와 이미 알고 있는 태그를 넘기는 경우의
+HTTP 왕복 횟수와 걸린 시간을 비교합니다.
+
+    python benchmarks/bench_load_doc_content.py [--views 1000] [--memos 3000] [--latency-ms 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core import google_api_handler
+
+
+class _FakeRequest:
+    def __init__(self, backend, payload):
+        self.backend = backend
+        self.payload = payload
+
+    def execute(self):
+        self.backend.round_trips += 1
+        if self.backend.latency:
+            time.sleep(self.backend.latency)
+        return self.payload
+
+
+class _FakeBackend:
+    """documents().get()과 spreadsheets().values().get()만 흉내 내는 백엔드."""
+
+    def __init__(self, memo_count, latency):
+        self.latency = latency
+        self.round_trips = 0
+        self.rows = [[f"doc-{i}", f"#tag{i % 50} #bench"] for i in range(memo_count)]
+
+    # Docs
+    def documents(self):
+        return self
+
+    # Sheets
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, documentId=None, spreadsheetId=None, range=None, fields=None):
+        if documentId is not None:
+            doc = {
+                'title': documentId,
+                'body': {'content': [{'paragraph': {'elements': [
+                    {'textRun': {'content': "# 제목\n- [ ] 할 일 @2024-12-25 !p1\n본문입니다.\n"}}]}}]},
+            }
+            return _FakeRequest(self, doc)
+        return _FakeRequest(self, {'values': self.rows})
+
+
+def _run(views, backend, pass_tags):
+    backend.round_trips = 0
+    started = time.perf_counter()
+    for i in range(views):
+        doc_id = f"doc-{i % len(backend.rows)}"
+        tags = backend.rows[i % len(backend.rows)][1] if pass_tags else None
+        google_api_handler.load_doc_content(doc_id, as_html=False, tags_text=tags)
+    return backend.round_trips, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--views', type=int, default=1000)
+    parser.add_argument('--memos', type=int, default=3000)
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    args = parser.parse_args()
+
+    backend = _FakeBackend(args.memos, args.latency_ms / 1000.0)
+    google_api_handler.get_services = lambda: (backend, backend, None)
+    google_api_handler.invalidate_row_index()
+
+    trips, elapsed = _run(args.views, backend, pass_tags=False)
+    print(f"시트 조회 포함 : {trips:5d}회 왕복, {elapsed:7.2f}s")
+    trips, elapsed = _run(args.views, backend, pass_tags=True)
+    print(f"태그 전달      : {trips:5d}회 왕복, {elapsed:7.2f}s")
+
+
+if __name__ == '__main__':
+    main()
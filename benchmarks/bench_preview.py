@@ -0,0 +1,85 @@
+"""
+편집기 미리보기 갱신 벤치마크.
+
+약 50 KB 메모에서 한 글자씩 입력하는 상황을 흉내 내어, 이전 방식(매번 문서 전체를 markdown 변환 +
+render_page)과 core.preview_engine.PreviewEngine.update의 갱신당 Python 처리 시간을 비교합니다.
+목표는 갱신당 16 ms(한 프레임) 미만입니다.
+
+    python benchmarks/bench_preview.py [--kb 50] [--keystrokes 200]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import markdown
+
+from core import html_renderer
+from core.preview_engine import MARKDOWN_EXTENSIONS, PreviewEngine
+
+
+def build_document(target_kb):
+    parts = []
+    i = 0
+    while sum(len(p.encode('utf-8')) for p in parts) < target_kb * 1024:
+        kind = i % 5
+        if kind == 0:
+            parts.append(f"## 섹션 {i}")
+        elif kind == 1:
+            parts.append(f"- [ ] 할 일 {i} @2024-12-{(i % 28) + 1:02d} !p{(i % 5) + 1}\n- [x] 끝난 일 {i}")
+        elif kind == 2:
+            parts.append(f"```python\ndef f{i}():\n\n    return {i}\n```")
+        elif kind == 3:
+            parts.append(f"| 열 | 값 |\n|---|---|\n| a | {i} |")
+        else:
+            parts.append(f"평범한 문단 {i}. [[메모 {i % 50}]] 참고. " + "가나다라마바사 " * 8)
+        i += 1
+    return "\n\n".join(parts)
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kb", type=int, default=50)
+    parser.add_argument("--keystrokes", type=int, default=200)
+    args = parser.parse_args()
+
+    titles = {f"메모 {i}": f"doc-{i}" for i in range(50)}
+    document = build_document(args.kb)
+    # 문서 가운데 문단에 한 글자씩 입력
+    insert_at = document.index("평범한 문단", len(document) // 2)
+    typed = "새로 입력하는 문장입니다 " * (args.keystrokes // 10 + 1)
+    snapshots = [document[:insert_at] + typed[:n] + document[insert_at:] for n in range(1, args.keystrokes + 1)]
+
+    legacy_times = []
+    for text in snapshots[:min(len(snapshots), 30)]:
+        started = time.perf_counter()
+        html_renderer.render_page("미리보기", markdown.markdown(text, extensions=MARKDOWN_EXTENSIONS), "#a #b", titles.get)
+        legacy_times.append((time.perf_counter() - started) * 1000)
+
+    engine = PreviewEngine(titles.get)
+    started = time.perf_counter()
+    engine.update(document, "#a #b")
+    first_ms = (time.perf_counter() - started) * 1000
+    engine_times = []
+    for text in snapshots:
+        started = time.perf_counter()
+        kind, _ = engine.update(text, "#a #b")
+        engine_times.append((time.perf_counter() - started) * 1000)
+        assert kind == 'patch'
+
+    print(f"문서 {len(document.encode('utf-8')) / 1024:.1f} KB, 입력 {len(snapshots)}회")
+    print(f"  이전 방식 (전체 변환) : 평균 {statistics.mean(legacy_times):7.2f} ms, p95 {percentile(legacy_times, 0.95):7.2f} ms")
+    print(f"  PreviewEngine 첫 렌더링: {first_ms:7.2f} ms")
+    print(f"  PreviewEngine 갱신    : 평균 {statistics.mean(engine_times):7.2f} ms, p95 {percentile(engine_times, 0.95):7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
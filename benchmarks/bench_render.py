@@ -0,0 +1,127 @@
+"""
+_get_final_html 후처리 벤치마크.
+
+큰 메모 여러 개로 된 HTML 코퍼스를 만들어, 이전 방식(매번 제목 맵 생성 + BeautifulSoup 파싱 +
+정규식 여섯 번 + CSS 파일 다시 읽기)과 core.html_renderer.render_page의 렌더링 시간을 비교합니다.
+
+    python benchmarks/bench_render.py [--memos 50] [--lines 2000] [--titles 5000] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bs4 import BeautifulSoup
+
+from core import config_manager, html_renderer
+
+
+def build_corpus(memo_count, line_count, titles, seed=7):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(memo_count):
+        parts = ["<h1>큰 메모</h1>"]
+        for i in range(line_count):
+            kind = i % 6
+            if kind == 0:
+                parts.append(f"<ul>\n<li>[ ] 할 일 {i} @2024-12-{(i % 28) + 1:02d} 10:00 !p{(i % 5) + 1}</li>\n<li>[x] 끝난 일 {i}</li>\n</ul>")
+            elif kind == 1:
+                parts.append(f"<p>참고: [[{rng.choice(titles)}]] 와 [[없는 메모 {i}]] 를 보세요 @2024-01-{(i % 28) + 1:02d}</p>")
+            elif kind == 2:
+                parts.append(f'<p><a href="https://example.com/{i}" title="외부 링크">링크 {i}</a> 본문 문단입니다.</p>')
+            elif kind == 3:
+                parts.append(f"<pre><code>code line {i}\nx = {i}</code></pre>")
+            elif kind == 4:
+                parts.append(f'<p><img src="https://example.com/img/{i}.png" alt="이미지"></p>')
+            else:
+                parts.append(f"<p>평범한 문단 {i}. " + "가나다라마바사 " * 10 + "</p>")
+        corpus.append("\n".join(parts))
+    return corpus
+
+
+def legacy_render(title, html_body, tags_text, local_cache, css_path):
+    """변경 전 _get_final_html과 같은 순서의 처리."""
+    title_to_id_map = {row[0]: row[2] for row in local_cache if len(row) > 2}
+
+    def replace_wiki_links(match):
+        linked_title = match.group(1)
+        doc_id = title_to_id_map.get(linked_title)
+        if doc_id:
+            return f'<a href="memo://{doc_id}" title="메모 열기: {linked_title}">{linked_title}</a>'
+        return f'<span class="broken-link" title="존재하지 않는 메모: {linked_title}">[[{linked_title}]]</span>'
+
+    soup = BeautifulSoup(html_body, 'html.parser')
+    for img in soup.find_all('img'):
+        src = img.get('src')
+        if src and not src.startswith(('http://', 'https://', 'file://')):
+            img['src'] = "file:///" + os.path.abspath(src).replace(os.sep, '/')
+    html = str(soup)
+    html = re.sub(r'\[\[(.*?)\]\]', replace_wiki_links, html)
+    html = re.sub(r'<li>\[ \]', r'<li><span class="task-checkbox-empty"></span>', html)
+    html = re.sub(r'<li>\[x\]', r'<li><span class="task-checkbox-done"></span>', html)
+    html = re.sub(r'!p([1-5])', r'<span class="rank-\1"></span>', html)
+    html = re.sub(r'\s(@\S+\s\S*:\S+)', r'<span class="datetime-tag">\1</span>', html)
+    html = re.sub(r'\s(@\S+)', r'<span class="date-tag">\1</span>', html)
+
+    tags_html = ""
+    if tags_text:
+        tags = [t.strip() for t in tags_text.replace(',', ' ').split() if t.strip()]
+        tags_html = '<div class="tags-container">'
+        for tag in tags:
+            tags_html += f'<a href="tag://{tag.lstrip("#")}" class="tag-link">#{tag.lstrip("#")}</a> '
+        tags_html += '</div>'
+
+    with open(css_path, 'r', encoding='utf-8') as f:
+        final_css = f"<style>{f.read()}</style>"
+    return f'<html><head><meta charset="UTF-8"><title>{title}</title>{final_css}</head><body>{tags_html}{html}</body></html>'
+
+
+def time_it(func, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memos", type=int, default=50)
+    parser.add_argument("--lines", type=int, default=2000)
+    parser.add_argument("--titles", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    local_cache = [[f"메모 {i}", "2024-01-01 00:00:00", f"doc-{i}", "#bench"] for i in range(args.titles)]
+    title_to_id = {row[0]: row[2] for row in local_cache}
+    corpus = build_corpus(args.memos, args.lines, [row[0] for row in local_cache])
+    corpus_bytes = sum(len(body.encode('utf-8')) for body in corpus)
+
+    fd, css_path = tempfile.mkstemp(suffix=".css")
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write("body { color: #333; }\n" * 200)
+    original_get_setting = config_manager.get_setting
+    config_manager.get_setting = lambda section, key: css_path if key == 'custom_css_path' else original_get_setting(section, key)
+
+    try:
+        legacy = time_it(lambda: [legacy_render("벤치", body, "#a #b", local_cache, css_path) for body in corpus], args.repeat)
+        current = time_it(lambda: [html_renderer.render_page("벤치", body, "#a #b", title_to_id.get) for body in corpus], args.repeat)
+    finally:
+        config_manager.get_setting = original_get_setting
+        os.remove(css_path)
+
+    print(f"메모 {args.memos}개 (총 {corpus_bytes / 1024 / 1024:.1f} MB), 제목 {args.titles}개, 최소 {args.repeat}회 측정")
+    print(f"  이전 방식      : {legacy * 1000:8.1f} ms  ({legacy * 1000 / args.memos:.2f} ms/메모)")
+    print(f"  html_renderer : {current * 1000:8.1f} ms  ({current * 1000 / args.memos:.2f} ms/메모)")
+    print(f"  속도 향상      : {legacy / current:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
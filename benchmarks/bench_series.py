@@ -0,0 +1,122 @@
+"""
+메모 목록 MOC/회차 묶기 벤치마크.
+
+MOC 200개 x 회차 50개와 일반 메모로 된 목록에서, 이전 방식(MOC마다 series_cache 전체를 훑고
+회차마다 일반 메모 목록과 전체 캐시를 다시 뒤지는 _group_moc_and_chapters + populate_table)과
+core.series_index.group_rows(부모 -> 회차 색인 + doc_id -> 행 조회)의 처리 시간을 비교합니다.
+
+    python benchmarks/bench_series.py [--mocs 200] [--chapters 50] [--docs 5000] [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.series_index import SeriesIndex, group_rows
+
+
+def build_data(moc_count, chapter_count, doc_count):
+    rows = []
+    series = {}
+    for m in range(moc_count):
+        moc_id = f"moc-{m}"
+        rows.append([f"시리즈 {m}", "2024-01-01 00:00:00", moc_id, "#moc"])
+        chapter_ids = [f"moc-{m}-ch-{c}" for c in range(chapter_count)]
+        for c, chapter_id in enumerate(chapter_ids):
+            rows.append([f"시리즈 {m} - {c + 1}화", "2024-01-02 00:00:00", chapter_id, "#시리즈"])
+            series[chapter_id] = {
+                'parent_moc_id': moc_id,
+                'parent_moc_title': f"시리즈 {m}",
+                'prev_chapter_id': chapter_ids[c - 1] if c > 0 else None,
+                'next_chapter_id': chapter_ids[c + 1] if c < chapter_count - 1 else None,
+            }
+    for d in range(doc_count):
+        rows.append([f"메모 {d}", "2024-01-03 00:00:00", f"doc-{d}", "#일기"])
+    return rows, series
+
+
+def legacy_group(data, series_cache, local_cache):
+    # 이전 AppController._group_moc_and_chapters
+    moc_docs = []
+    regular_docs = []
+    for row in data:
+        if len(row) > 3 and '#moc' in row[3].lower():
+            moc_docs.append(row)
+        else:
+            regular_docs.append(row)
+    grouped_data = []
+    for moc_row in moc_docs:
+        grouped_data.append(moc_row)
+        moc_id = moc_row[2]
+        for chapter_id, info in series_cache.items():
+            if info.get('parent_moc_id') == moc_id:
+                for doc in regular_docs:
+                    if len(doc) > 2 and doc[2] == chapter_id:
+                        grouped_data.append(doc)
+                        break
+    chapter_ids = {chapter_id for chapter_id, info in series_cache.items() if info.get('parent_moc_id')}
+    for doc in regular_docs:
+        if len(doc) > 2 and doc[2] not in chapter_ids:
+            grouped_data.append(doc)
+
+    # 이전 MemoListWindow.populate_table: MOC마다 회차 행을 grouped_data와 전체 캐시에서 다시 찾음
+    tree = []
+    for row in grouped_data:
+        if len(row) > 3 and '#moc' in row[3].lower():
+            children = []
+            for chapter_id, info in series_cache.items():
+                if info.get('parent_moc_id') != row[2]:
+                    continue
+                found = next((r for r in grouped_data if len(r) > 2 and r[2] == chapter_id), None)
+                if found is None:
+                    found = next((r for r in local_cache if len(r) > 2 and r[2] == chapter_id), None)
+                if found:
+                    children.append(found)
+            tree.append((row, children))
+        elif row[2] not in chapter_ids:
+            tree.append((row, None))
+    return tree
+
+
+def timed(func, repeat):
+    times = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        times.append((time.perf_counter() - started) * 1000)
+    return result, times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mocs", type=int, default=200)
+    parser.add_argument("--chapters", type=int, default=50)
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows, series_data = build_data(args.mocs, args.chapters, args.docs)
+    rows_by_id = {row[2]: row for row in rows}
+
+    started = time.perf_counter()
+    series = SeriesIndex(series_data)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    legacy, legacy_times = timed(lambda: legacy_group(rows, series_data, rows), max(1, args.repeat // 5))
+    grouped, new_times = timed(lambda: group_rows(rows, series, rows_by_id.get), args.repeat)
+
+    assert [(row[2], [c[2] for c in children] if children is not None else None) for row, children in legacy] == \
+           [(row[2], [c[2] for c in children] if children is not None else None) for row, children in grouped]
+
+    print(f"행 {len(rows)}개 (MOC {args.mocs}개 x 회차 {args.chapters}개 + 일반 메모 {args.docs}개)")
+    print(f"  이전 방식        : 평균 {statistics.mean(legacy_times):9.1f} ms")
+    print(f"  SeriesIndex 구성 : {load_ms:9.1f} ms (series_cache.json 불러올 때 한 번)")
+    print(f"  group_rows       : 평균 {statistics.mean(new_times):9.1f} ms, 최대 {max(new_times):9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
+import datetime
 import os
+import threading
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -14,30 +16,52 @@ SCOPES = [
 TOKEN_PATH = os.path.join(config_manager.APP_DATA_DIR, 'token.json')
 CLIENT_SECRET_PATH = resource_path('client_secret.json')
 
+# 만료 전에 미리 갱신할 여유 시간
+REFRESH_MARGIN = datetime.timedelta(minutes=5)
+
+# 프로세스 전체에서 공유하는 메모리 내 인증 정보
+_cached_creds = None
+_creds_lock = threading.Lock()
+
+def _needs_refresh(creds):
+    if not creds.valid:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth는 expiry를 naive UTC로 보관함
+    return creds.expiry - datetime.datetime.utcnow() < REFRESH_MARGIN
+
 def get_credentials():
     """
     OAuth 2.0 방식으로 인증 (기본 방식)
+    한 번 읽은 토큰은 메모리에 보관하고, 만료가 가까워지면 미리 갱신합니다.
     """
-    creds = None
-    if os.path.exists(TOKEN_PATH):
-        creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-                print("OAuth 2.0 토큰 갱신 성공")
-            except Exception as e:
-                print(f"OAuth 2.0 토큰 갱신 실패: {e}")
-                print("새로운 인증이 필요합니다.")
-                creds = None
-        
-        if not creds:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                CLIENT_SECRET_PATH, SCOPES)
-            creds = flow.run_local_server(port=0)
-            print("OAuth 2.0 새 인증 완료")
-        
-        with open(TOKEN_PATH, 'w') as token:
-            token.write(creds.to_json())
-    
-    return creds
+    global _cached_creds
+    with _creds_lock:
+        creds = _cached_creds
+        if creds is not None and not _needs_refresh(creds):
+            return creds
+
+        if creds is None and os.path.exists(TOKEN_PATH):
+            creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
+        if not creds or _needs_refresh(creds):
+            if creds and creds.refresh_token:
+                try:
+                    creds.refresh(Request())
+                    print("OAuth 2.0 토큰 갱신 성공")
+                except Exception as e:
+                    print(f"OAuth 2.0 토큰 갱신 실패: {e}")
+                    print("새로운 인증이 필요합니다.")
+                    creds = None
+
+            if not creds:
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    CLIENT_SECRET_PATH, SCOPES)
+                creds = flow.run_local_server(port=0)
+                print("OAuth 2.0 새 인증 완료")
+
+            with open(TOKEN_PATH, 'w') as token:
+                token.write(creds.to_json())
+
+        _cached_creds = creds
+        return creds
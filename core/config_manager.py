@@ -15,7 +15,8 @@ if not os.path.exists(CONTENT_CACHE_DIR):
     os.makedirs(CONTENT_CACHE_DIR)
 
 CONFIG_FILE = os.path.join(APP_DATA_DIR, 'config.ini')
-CACHE_FILE = os.path.join(APP_DATA_DIR, 'cache.json') # 목록 캐시
+CACHE_FILE = os.path.join(APP_DATA_DIR, 'cache.json') # 목록 캐시 (이전 형식, 최초 실행 시 DB로 이전)
+MEMO_DB_FILE = os.path.join(APP_DATA_DIR, 'memos.db') # 메모 메타데이터 저장소
 config = configparser.ConfigParser()
 
 def load_config():
@@ -28,9 +29,16 @@ def load_config():
         'Hotkeys': {'new_memo': 'ctrl+1', 'list_memos': 'ctrl+2', 'quick_launcher': 'ctrl+p'},
         'Google': {
             'spreadsheet_id': 'YOUR_SPREADSHEET_ID', # 기본값은 비워두거나 예시 ID 사용
-            'folder_id': 'YOUR_FOLDER_ID'
+            'folder_id': 'YOUR_FOLDER_ID',
+            'fetch_concurrency': '4', # 문서 일괄 로드 시 동시 요청 수
+            'fetch_rate_per_sec': '5', # 문서 일괄 로드 시 초당 최대 요청 수
+            'upload_concurrency': '4', # 저장 시 이미지 동시 업로드 수
+            # 저장 시 본문의 로컬 이미지를 Drive에 올릴지. 올린 이미지는 링크를 아는 누구나 볼 수 있으므로 기본값은 끔
+            'upload_local_images': 'false'
         },
         'Display': {'page_size': '30', 'local_page_size': '20', 'custom_css_path': '', 'autosave_interval_ms': '3000'},
+        'Cache': {'max_content_cache_mb': '500', # 콘텐츠 캐시(본문/HTML/이미지) 최대 크기
+                  'image_download_concurrency': '6'}, # 본문 이미지 동시 다운로드 수
         'WindowStates': {}
     }
     
@@ -145,32 +153,69 @@ import json
 
 FAVORITES_FILE = os.path.join(APP_DATA_DIR, 'favorites.json')
 NOTIFIED_TASKS_FILE = os.path.join(APP_DATA_DIR, 'notified_tasks.json')
+NOTIFIED_TASKS_LOG = os.path.join(APP_DATA_DIR, 'notified_tasks.log') # 알림 기록 추가 전용 로그
 SERIES_CACHE_FILE = os.path.join(APP_DATA_DIR, 'series_cache.json')
+SYNC_STATE_FILE = os.path.join(APP_DATA_DIR, 'sync_state.json')
+TASK_INDEX_FILE = os.path.join(APP_DATA_DIR, 'task_index.json')
+SEARCH_INDEX_FILE = os.path.join(APP_DATA_DIR, 'search_index.json') # 본문 검색용 용어 빈도
+LINK_INDEX_FILE = os.path.join(APP_DATA_DIR, 'link_index.json') # 문서별 위키 링크 (지식 그래프/역링크)
+GRAPH_LAYOUT_FILE = os.path.join(APP_DATA_DIR, 'graph_layout.json') # 지식 그래프 노드 좌표
+UPLOADED_IMAGES_FILE = os.path.join(APP_DATA_DIR, 'uploaded_images.json') # 로컬 이미지 해시 -> 업로드된 Drive URL
 
 # --- 설정 파일 관리 ---
 
 def save_notified_tasks(tasks_dict):
-    """Saves the dictionary of notified task IDs and their notification dates to the file."""
+    """Saves the dictionary of notified task IDs and their notification dates to the file.
+
+    The snapshot replaces the append-only log, so this is only used for compaction.
+    """
     try:
         with open(NOTIFIED_TASKS_FILE, 'w', encoding='utf-8') as f:
             json.dump(tasks_dict, f, indent=4)
-    except IOError as e:
+        if os.path.exists(NOTIFIED_TASKS_LOG):
+            os.remove(NOTIFIED_TASKS_LOG)
+    except (IOError, OSError) as e:
         print(f"Error saving notified tasks file: {e}")
 
-def load_notified_tasks():
-    """Loads the dictionary of notified task IDs and dates from the file."""
-    if not os.path.exists(NOTIFIED_TASKS_FILE):
-        return {}
+def append_notified_task(task_id, date_str):
+    """Appends one notification record instead of rewriting the whole history."""
     try:
-        with open(NOTIFIED_TASKS_FILE, 'r', encoding='utf-8') as f:
-            tasks_dict = json.load(f)
-            # Ensure it's a dictionary, for backward compatibility from old set format
-            if isinstance(tasks_dict, list):
-                return {}
-            return tasks_dict
-    except (IOError, json.JSONDecodeError) as e:
-        print(f"Error loading notified tasks file: {e}")
-        return {}
+        with open(NOTIFIED_TASKS_LOG, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'task_id': task_id, 'date': date_str}, ensure_ascii=False) + '\n')
+    except IOError as e:
+        print(f"Error appending notified task: {e}")
+
+def load_notified_tasks():
+    """Loads the dictionary of notified task IDs and dates (snapshot + append-only log)."""
+    tasks_dict = {}
+    if os.path.exists(NOTIFIED_TASKS_FILE):
+        try:
+            with open(NOTIFIED_TASKS_FILE, 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+                # Ensure it's a dictionary, for backward compatibility from old set format
+                if isinstance(loaded, dict):
+                    tasks_dict = loaded
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"Error loading notified tasks file: {e}")
+
+    log_lines = 0
+    if os.path.exists(NOTIFIED_TASKS_LOG):
+        try:
+            with open(NOTIFIED_TASKS_LOG, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue # 마지막 줄이 쓰다 만 경우 무시
+                    tasks_dict[record['task_id']] = record['date']
+                    log_lines += 1
+        except IOError as e:
+            print(f"Error loading notified tasks log: {e}")
+
+    # 로그가 충분히 길어지면 스냅샷으로 합침
+    if log_lines > 200 and log_lines > len(tasks_dict):
+        save_notified_tasks(tasks_dict)
+    return tasks_dict
 
 # --- 시리즈 캐시 관리 ---
 def load_series_cache():
@@ -189,3 +234,39 @@ def save_series_cache(cache_data):
             json.dump(cache_data, f, ensure_ascii=False, indent=4)
     except IOError as e:
         print(f"시리즈 캐시 저장 실패: {e}")
+
+# --- 목록 동기화 상태 관리 ---
+def load_sync_state():
+    if not os.path.exists(SYNC_STATE_FILE):
+        return {}
+    try:
+        with open(SYNC_STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, json.JSONDecodeError) as e:
+        print(f"동기화 상태 로드 실패: {e}")
+        return {}
+
+def save_sync_state(state):
+    try:
+        with open(SYNC_STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=4)
+    except IOError as e:
+        print(f"동기화 상태 저장 실패: {e}")
+
+# --- 업로드한 이미지 기록 ---
+def load_uploaded_images():
+    if not os.path.exists(UPLOADED_IMAGES_FILE):
+        return {}
+    try:
+        with open(UPLOADED_IMAGES_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, json.JSONDecodeError) as e:
+        print(f"업로드 이미지 기록 로드 실패: {e}")
+        return {}
+
+def save_uploaded_images(uploaded):
+    try:
+        with open(UPLOADED_IMAGES_FILE, 'w', encoding='utf-8') as f:
+            json.dump(uploaded, f, ensure_ascii=False, indent=4)
+    except IOError as e:
+        print(f"업로드 이미지 기록 저장 실패: {e}")
@@ -0,0 +1,339 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from core import config_manager
+
+# 문서별 캐시 파일 종류: 평문(.txt), 렌더링된 HTML(.html), 동기화 메타(.meta.json)
+DOC_KINDS = ('txt', 'html', 'meta')
+_SUFFIXES = {'txt': '.txt', 'html': '.html', 'meta': '.meta.json'}
+IMAGES_DIR_NAME = 'images'
+INDEX_FILE_NAME = 'cache_index.json'
+
+DEFAULT_MAX_MB = 500
+# 예산을 넘으면 이 비율까지 줄여 두어 쓸 때마다 정리하지 않도록 함
+EVICT_TARGET_RATIO = 0.9
+
+
+def _group_of(name):
+    # 같은 문서의 .txt/.html/.meta.json은 함께 사용되고 함께 정리됨. 이미지는 파일 하나가 한 그룹.
+    if name.startswith(IMAGES_DIR_NAME + '/'):
+        return name
+    for suffix in ('.meta.json', '.txt', '.html'):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+class ContentCache:
+    """콘텐츠 캐시 폴더(CONTENT_CACHE_DIR)의 모든 읽기/쓰기를 맡는 관리자.
+
+    파일마다 크기와 마지막 사용 시각을 작은 인덱스(cache_index.json)에 기록하고, 전체 크기가
+    예산(설정 Cache/max_content_cache_mb)을 넘으면 가장 오래 쓰지 않은 문서/이미지부터 지웁니다.
+    쓰기는 임시 파일에 쓴 뒤 교체하여 원자적으로 처리합니다.
+    """
+
+    SAVE_EVERY_WRITES = 50 # 비정상 종료에 대비해 이만큼 쓸 때마다 인덱스 저장
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = cache_dir or config_manager.CONTENT_CACHE_DIR
+        self.images_dir = os.path.join(self.cache_dir, IMAGES_DIR_NAME)
+        self.index_path = os.path.join(self.cache_dir, INDEX_FILE_NAME)
+        self._max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._entries = {} # 캐시 폴더 기준 상대 이름 -> [크기, 마지막 사용 시각]
+        self._total_bytes = 0
+        self._dirty = False
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0, 'evicted_bytes': 0}
+        self._listeners = [] # .txt가 바뀌거나 지워질 때 호출: listener(doc_id, 본문 또는 None)
+        for directory in (self.cache_dir, self.images_dir):
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+        self._load_index()
+
+    # ------------------------------------------------------------------
+    # 인덱스
+    # ------------------------------------------------------------------
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = {name: list(entry) for name, entry in data.get('entries', {}).items()}
+                self._total_bytes = sum(entry[0] for entry in self._entries.values())
+                return
+        except FileNotFoundError:
+            pass
+        except (IOError, ValueError, TypeError) as e:
+            print(f"콘텐츠 캐시 인덱스 로드 실패, 폴더를 다시 훑습니다: {e}")
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        # 인덱스가 없으면 (이전 버전에서 만든 캐시 등) 폴더를 훑어 만듦
+        entries = {}
+        for directory, prefix in ((self.cache_dir, ''), (self.images_dir, IMAGES_DIR_NAME + '/')):
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if not entry.is_file() or entry.name.startswith('.') or entry.name == INDEX_FILE_NAME:
+                            continue
+                        stat = entry.stat()
+                        entries[prefix + entry.name] = [stat.st_size, stat.st_mtime]
+            except OSError as e:
+                print(f"콘텐츠 캐시 폴더 확인 실패: {e}")
+        with self._lock:
+            self._entries = entries
+            self._total_bytes = sum(entry[0] for entry in entries.values())
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps({'entries': self._entries})
+            self._dirty = False
+        self._atomic_write(self.index_path, data.encode('utf-8'))
+
+    # ------------------------------------------------------------------
+    # 경로
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _doc_name(doc_id, kind):
+        return f"{doc_id}{_SUFFIXES[kind]}"
+
+    def path(self, doc_id, kind):
+        return os.path.join(self.cache_dir, self._doc_name(doc_id, kind))
+
+    @staticmethod
+    def image_name(url):
+        """이미지 URL로부터 캐시 이름(images/<md5><확장자>)을 만듦."""
+        file_extension = os.path.splitext(url.split('?')[0])[-1] or '.png'
+        if not file_extension.startswith('.'):
+            file_extension = '.' + file_extension
+        return f"{IMAGES_DIR_NAME}/{hashlib.md5(url.encode()).hexdigest()}{file_extension}"
+
+    def _full_path(self, name):
+        return os.path.join(self.cache_dir, *name.split('/'))
+
+    # ------------------------------------------------------------------
+    # 읽기/쓰기
+    # ------------------------------------------------------------------
+    def _touch(self, name, hit, count=True):
+        with self._lock:
+            entry = self._entries.get(name)
+            if count:
+                self._stats['hits' if hit else 'misses'] += 1
+            if hit:
+                if entry is not None:
+                    entry[1] = time.time()
+                    self._dirty = True
+            else:
+                if entry is not None:
+                    # 인덱스에는 있지만 파일이 사라진 경우
+                    self._total_bytes -= entry[0]
+                    del self._entries[name]
+                    self._dirty = True
+
+    def _read(self, name, count=True):
+        try:
+            with open(self._full_path(name), 'r', encoding='utf-8') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self._touch(name, False, count)
+            return None
+        except (IOError, UnicodeDecodeError) as e:
+            print(f"콘텐츠 캐시 읽기 오류 ({name}): {e}")
+            self._touch(name, False, count)
+            return None
+        self._touch(name, True, count)
+        return data
+
+    def _atomic_write(self, path, data):
+        directory = os.path.dirname(path)
+        try:
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".cache.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            return True
+        except OSError as e:
+            print(f"콘텐츠 캐시 쓰기 오류 ({os.path.basename(path)}): {e}")
+            return False
+
+    def _write(self, name, data):
+        if not self._atomic_write(self._full_path(name), data):
+            return False
+        with self._lock:
+            old = self._entries.get(name)
+            if old is not None:
+                self._total_bytes -= old[0]
+            self._entries[name] = [len(data), time.time()]
+            self._total_bytes += len(data)
+            self._stats['writes'] += 1
+            self._dirty = True
+            periodic_save = self._stats['writes'] % self.SAVE_EVERY_WRITES == 0
+        self._evict_if_needed(keep=_group_of(name))
+        if periodic_save:
+            self.save()
+        return True
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def _notify(self, name, text):
+        if not self._listeners or not name.endswith(_SUFFIXES['txt']) or '/' in name:
+            return
+        doc_id = name[:-len(_SUFFIXES['txt'])]
+        for listener in self._listeners:
+            try:
+                listener(doc_id, text)
+            except Exception as e:
+                print(f"콘텐츠 캐시 변경 알림 처리 오류 ({doc_id}): {e}")
+
+    def exists(self, doc_id, kind):
+        return os.path.exists(self.path(doc_id, kind))
+
+    def read_text(self, doc_id, kind):
+        """캐시된 .txt/.html 내용. 없거나 읽을 수 없으면 None."""
+        return self._read(self._doc_name(doc_id, kind))
+
+    def write_text(self, doc_id, kind, text):
+        name = self._doc_name(doc_id, kind)
+        if not self._write(name, text.encode('utf-8')):
+            return False
+        self._notify(name, text)
+        return True
+
+    def read_meta(self, doc_id):
+        # 메타 조회는 적중률 통계에서 제외 (본문/이미지 조회만 집계)
+        data = self._read(self._doc_name(doc_id, 'meta'), count=False)
+        if not data:
+            return {}
+        try:
+            return json.loads(data)
+        except ValueError:
+            return {}
+
+    def update_meta(self, doc_id, **fields):
+        with self._lock:
+            # 읽고 고쳐 쓰는 사이 다른 스레드의 갱신을 잃지 않도록 잠금 안에서 처리
+            meta = self.read_meta(doc_id)
+            meta.update(fields)
+            return self._write(self._doc_name(doc_id, 'meta'), json.dumps(meta).encode('utf-8'))
+
+    def image_path(self, url):
+        """이미지가 캐시에 있으면 그 경로, 없으면 None."""
+        name = self.image_name(url)
+        path = self._full_path(name)
+        if os.path.exists(path):
+            self._touch(name, True)
+            return path
+        self._touch(name, False)
+        return None
+
+    def store_image(self, url, data):
+        name = self.image_name(url)
+        if self._write(name, data):
+            return self._full_path(name)
+        return None
+
+    def remove(self, doc_id, kinds=DOC_KINDS):
+        """문서의 캐시 파일 삭제. kinds로 일부만 지울 수 있음."""
+        for kind in kinds:
+            name = self._doc_name(doc_id, kind)
+            if self._remove_file(name):
+                print(f"콘텐츠 캐시 삭제: {name}")
+
+    def _remove_file(self, name):
+        """파일을 지웠으면 True (원래 없었거나 지우지 못했으면 False)."""
+        removed = False
+        try:
+            os.remove(self._full_path(name))
+            removed = True
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"콘텐츠 캐시 삭제 오류 ({name}): {e}")
+            return False
+        with self._lock:
+            entry = self._entries.pop(name, None)
+            if entry is not None:
+                self._total_bytes -= entry[0]
+                self._dirty = True
+        if removed:
+            self._notify(name, None)
+        return removed
+
+    # ------------------------------------------------------------------
+    # 정리 (LRU)
+    # ------------------------------------------------------------------
+    @property
+    def max_bytes(self):
+        if self._max_bytes is not None:
+            return self._max_bytes
+        try:
+            return int(float(config_manager.get_setting('Cache', 'max_content_cache_mb')) * 1024 * 1024)
+        except Exception:
+            return DEFAULT_MAX_MB * 1024 * 1024
+
+    def _evict_if_needed(self, keep=None):
+        max_bytes = self.max_bytes
+        if max_bytes <= 0 or self._total_bytes <= max_bytes:
+            return
+        with self._lock:
+            groups = {}
+            for name, (size, used_at) in self._entries.items():
+                group = groups.setdefault(_group_of(name), [0, 0.0, []])
+                group[0] += size
+                group[1] = max(group[1], used_at)
+                group[2].append(name)
+            target = max_bytes * EVICT_TARGET_RATIO
+            victims = sorted((item for item in groups.items() if item[0] != keep), key=lambda item: item[1][1])
+        evicted = 0
+        evicted_bytes = 0
+        for group_name, (size, _, names) in victims:
+            if self._total_bytes <= target:
+                break
+            for name in names:
+                self._remove_file(name)
+            evicted += 1
+            evicted_bytes += size
+        with self._lock:
+            self._stats['evictions'] += evicted
+            self._stats['evicted_bytes'] += evicted_bytes
+        if evicted:
+            print(f"콘텐츠 캐시 정리: {evicted}개 항목, {evicted_bytes / 1024 / 1024:.1f} MB 삭제 "
+                  f"(현재 {self._total_bytes / 1024 / 1024:.1f} MB / 예산 {max_bytes / 1024 / 1024:.0f} MB)")
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['total_bytes'] = self._total_bytes
+            stats['max_bytes'] = self.max_bytes
+            lookups = stats['hits'] + stats['misses']
+            stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+            return stats
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_content_cache():
+    """앱 전체에서 함께 쓰는 콘텐츠 캐시."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ContentCache()
+        return _default_cache
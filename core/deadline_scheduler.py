@@ -0,0 +1,127 @@
+import heapq
+import itertools
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+def task_id_of(task):
+    return f"{task['doc_id']}-{task['original_line']}"
+
+
+def _start_of_next_day(ts):
+    next_day = datetime.fromtimestamp(ts).date() + timedelta(days=1)
+    return datetime.combine(next_day, datetime.min.time()).timestamp()
+
+
+class DeadlineScheduler:
+    """마감일 알림 대기열 (최소 힙).
+
+    완료되지 않은 할 일만 다음 알림 시각 순으로 보관하고, 호출 측은 next_delay_ms()로
+    타이머 하나만 걸어 두면 됩니다. 알림이 나간 할 일은 다음 날 0시로 다시 예약되어
+    기존처럼 지난 마감 항목을 하루에 한 번씩 알립니다.
+
+    힙의 항목은 지우지 않고 버전으로 무효화합니다 (꺼낼 때 최신 항목인지 확인).
+    notified: task_id -> 마지막 알림 날짜(ISO 문자열).
+    """
+
+    MAX_DELAY_MS = 6 * 60 * 60 * 1000 # 타이머 한 번에 거는 최대 대기 (시계 변경 대비)
+
+    def __init__(self, notified=None):
+        self._lock = threading.Lock()
+        self._heap = []
+        self._entries = {} # task_id -> (버전, 할 일)
+        self._counter = itertools.count()
+        self.notified = notified if notified is not None else {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _fire_time(self, task, now):
+        deadline_ts = task.get('deadline_ts')
+        last_notified = self.notified.get(task_id_of(task))
+        if last_notified:
+            try:
+                last_date = datetime.fromisoformat(last_notified).date()
+            except ValueError:
+                last_date = None
+            # 오늘 이미 알렸으면 다음 날 0시 이후에 다시 알림
+            if last_date is not None and last_date >= datetime.fromtimestamp(now).date():
+                return max(deadline_ts, _start_of_next_day(now))
+        return deadline_ts
+
+    def _push(self, task, now):
+        version = next(self._counter)
+        self._entries[task_id_of(task)] = (version, task)
+        heapq.heappush(self._heap, (self._fire_time(task, now), version, task_id_of(task)))
+
+    def add(self, task, now=None):
+        """할 일 추가/갱신. 완료되었거나 마감일이 없으면 대기열에서 뺌."""
+        now = now if now is not None else time.time()
+        with self._lock:
+            if task.get('is_checked') or task.get('deadline_ts') is None:
+                self._entries.pop(task_id_of(task), None)
+                return
+            self._push(task, now)
+
+    def remove(self, task):
+        with self._lock:
+            self._entries.pop(task_id_of(task), None)
+
+    def set_tasks(self, tasks, now=None):
+        """전체 할 일 목록 반영. 바뀌지 않은 할 일은 그대로 두고, 새로 생기거나 바뀐 것만 다시 넣음."""
+        now = now if now is not None else time.time()
+        with self._lock:
+            pending = {task_id_of(task): task for task in tasks
+                       if not task.get('is_checked') and task.get('deadline_ts') is not None}
+            for task_id in [task_id for task_id in self._entries if task_id not in pending]:
+                del self._entries[task_id]
+            for task_id, task in pending.items():
+                current = self._entries.get(task_id)
+                if current is None or current[1].get('deadline_ts') != task.get('deadline_ts'):
+                    self._push(task, now)
+                else:
+                    # 제목 등 표시 정보만 최신으로
+                    self._entries[task_id] = (current[0], task)
+            if len(self._heap) > 2 * len(self._entries) + 64:
+                self._compact()
+
+    def _compact(self):
+        self._heap = [item for item in self._heap
+                      if item[2] in self._entries and self._entries[item[2]][0] == item[1]]
+        heapq.heapify(self._heap)
+
+    def _discard_stale_head(self):
+        while self._heap:
+            fire_at, version, task_id = self._heap[0]
+            entry = self._entries.get(task_id)
+            if entry is not None and entry[0] == version:
+                return
+            heapq.heappop(self._heap)
+
+    def next_delay_ms(self, now=None):
+        """다음 알림까지 남은 시간(ms). 대기 중인 할 일이 없으면 None."""
+        now = now if now is not None else time.time()
+        with self._lock:
+            self._discard_stale_head()
+            if not self._heap:
+                return None
+            delay_ms = int((self._heap[0][0] - now) * 1000)
+            return max(0, min(delay_ms, self.MAX_DELAY_MS))
+
+    def pop_due(self, now=None):
+        """지금 알릴 할 일 목록. 꺼낸 할 일은 알림 기록 후 다음 날로 다시 예약됨."""
+        now = now if now is not None else time.time()
+        today_str = datetime.fromtimestamp(now).date().isoformat()
+        due = []
+        with self._lock:
+            while True:
+                self._discard_stale_head()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                _, _, task_id = heapq.heappop(self._heap)
+                task = self._entries[task_id][1]
+                due.append(task)
+                self.notified[task_id] = today_str
+                self._push(task, now)
+        return due
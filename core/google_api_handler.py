@@ -1,20 +1,206 @@
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
+from google_auth_httplib2 import AuthorizedHttp
 from core.auth import get_credentials
-from core import config_manager
+from core import config_manager, content_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import configparser
 import datetime
+import difflib
+import hashlib
+import httplib2
 import markdown
+import mimetypes
 import os
 import re
+import threading
+import time
 import uuid
+import weakref
+
+# ===================================================================
+# 서비스 클라이언트 풀
+# ===================================================================
+# httplib2.Http는 여러 스레드가 동시에 쓸 수 없으므로, Docs/Sheets/Drive 클라이언트 묶음을
+# 한 번에 한 스레드에만 빌려 줍니다. 스레드는 처음 호출할 때 풀에서 묶음을 받아(없으면 새로 만들어)
+# 끝날 때까지 재사용하고, 스레드가 끝나면 묶음은 풀로 돌아가 다음 스레드가 씁니다.
+# 컨트롤러 작업은 대부분 짧은 스레드에서 돌기 때문에, 스레드마다 새로 만들면 재사용이 거의 없습니다.
+# 각 클라이언트는 자신의 Http 객체를 유지하므로 연결도 함께 재사용됩니다.
+HTTP_TIMEOUT_SECONDS = 60
+MAX_POOLED_SERVICES = 8 # 쉬고 있는 묶음을 최대 몇 개까지 보관할지 (동시에 도는 스레드 수 정도면 충분)
+
+_thread_services = threading.local()
+_service_pool_lock = threading.Lock()
+_service_pool = [] # [(인증 객체, (docs, sheets, drive)), ...] 지금 아무 스레드도 쓰지 않는 묶음
+_service_stats_lock = threading.Lock()
+_service_stats = {'built': 0, 'reused': 0, 'threads': 0}
+
+def _build_service(name, version, creds):
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS))
+    return build(name, version, http=http, cache_discovery=False)
+
+def _return_services(creds, services):
+    with _service_pool_lock:
+        if len(_service_pool) < MAX_POOLED_SERVICES:
+            _service_pool.append((creds, services))
+
+def _take_pooled_services(creds):
+    with _service_pool_lock:
+        while _service_pool:
+            pooled_creds, services = _service_pool.pop()
+            # 재인증 전에 만든 묶음은 버림
+            if pooled_creds is creds:
+                return services
+    return None
+
+class _ServiceLease:
+    """스레드가 빌린 클라이언트 묶음. 스레드가 끝나 threading.local 값이 정리되면 풀로 돌아갑니다."""
+    __slots__ = ('creds', 'services', '__weakref__')
+
+    def __init__(self, creds, services):
+        self.creds = creds
+        self.services = services
+        finalizer = weakref.finalize(self, _return_services, creds, services)
+        finalizer.atexit = False
 
 def get_services():
     creds = get_credentials()
-    docs_service = build('docs', 'v1', credentials=creds)
-    sheets_service = build('sheets', 'v4', credentials=creds)
-    drive_service = build('drive', 'v3', credentials=creds)
-    return docs_service, sheets_service, drive_service
+    lease = getattr(_thread_services, 'lease', None)
+    # 재인증 등으로 인증 객체 자체가 바뀐 경우에만 다른 묶음으로 바꿈
+    if lease is not None and lease.creds is creds:
+        with _service_stats_lock:
+            _service_stats['reused'] += len(lease.services)
+        return lease.services
+    services = _take_pooled_services(creds)
+    built = services is None
+    if built:
+        services = (
+            _build_service('docs', 'v1', creds),
+            _build_service('sheets', 'v4', creds),
+            _build_service('drive', 'v3', creds),
+        )
+    with _service_stats_lock:
+        if lease is None:
+            _service_stats['threads'] += 1
+        _service_stats['built' if built else 'reused'] += len(services)
+    _thread_services.lease = _ServiceLease(creds, services)
+    return services
+
+def get_service_stats():
+    """생성된 클라이언트 수, 재사용된 횟수, 클라이언트를 빌린 스레드 수, 풀에서 쉬고 있는 묶음 수를 반환합니다."""
+    with _service_stats_lock:
+        stats = dict(_service_stats)
+    with _service_pool_lock:
+        stats['pooled'] = len(_service_pool)
+    return stats
+
+def reset_service_stats():
+    with _service_stats_lock:
+        _service_stats['built'] = 0
+        _service_stats['reused'] = 0
+        _service_stats['threads'] = 0
+
+# ===================================================================
+# 시트 행 인덱스 (doc_id -> 행 번호, 제목, 날짜, 태그)
+# ===================================================================
+# load_memo_list의 A2:D 읽기 결과로 채워지고, 추가/삭제 시 즉시 갱신됩니다.
+# 행 수가 예상과 다르면 인덱스를 버리고 다음 조회 때 다시 읽습니다.
+_row_index_lock = threading.Lock()
+_row_index = {}
+_row_index_sheet_id = None
+_row_count = 0
+
+def _rebuild_row_index(spreadsheet_id, values):
+    global _row_index, _row_index_sheet_id, _row_count
+    new_index = {}
+    for i, row in enumerate(values):
+        if len(row) > 2 and row[2]:
+            new_index[row[2]] = {
+                'row': i + 2, # A2부터 시작
+                'title': row[0],
+                'date': row[1],
+                'tags': row[3] if len(row) > 3 else "",
+            }
+    with _row_index_lock:
+        _row_index = new_index
+        _row_index_sheet_id = spreadsheet_id
+        _row_count = len(values)
+
+def _clear_row_index():
+    global _row_index, _row_index_sheet_id, _row_count
+    _row_index = {}
+    _row_index_sheet_id = None
+    _row_count = 0
+
+def invalidate_row_index():
+    with _row_index_lock:
+        _clear_row_index()
+
+def get_indexed_row(doc_id):
+    """인덱스에 있는 행 정보를 반환합니다. 없으면 None."""
+    spreadsheet_id = config_manager.get_setting('Google', 'spreadsheet_id')
+    with _row_index_lock:
+        if _row_index_sheet_id != spreadsheet_id:
+            return None
+        entry = _row_index.get(doc_id)
+        return dict(entry) if entry else None
+
+def _index_appended_row(spreadsheet_id, row_data, response):
+    global _row_count
+    # 응답의 updatedRange(예: 'Sheet1!A57:D57')에서 실제 추가된 행 번호를 확인
+    updated_range = response.get('updates', {}).get('updatedRange', '')
+    match = re.search(r'![A-Z]+(\d+)', updated_range)
+    with _row_index_lock:
+        if _row_index_sheet_id != spreadsheet_id:
+            return
+        expected_row = _row_count + 2
+        if not match or int(match.group(1)) != expected_row:
+            print("시트 행 수가 인덱스와 달라 행 인덱스를 무효화합니다.")
+            _clear_row_index()
+            return
+        _row_index[row_data[2]] = {'row': expected_row, 'title': row_data[0],
+                                   'date': row_data[1], 'tags': row_data[3]}
+        _row_count += 1
+
+def _index_deleted_row(doc_id, row_number):
+    global _row_count
+    with _row_index_lock:
+        _row_index.pop(doc_id, None)
+        for entry in _row_index.values():
+            if entry['row'] > row_number:
+                entry['row'] -= 1
+        _row_count = max(0, _row_count - 1)
+
+def _index_updated_row(doc_id, title, date, tags):
+    with _row_index_lock:
+        entry = _row_index.get(doc_id)
+        if entry:
+            entry.update({'title': title, 'date': date, 'tags': tags})
+
+def _find_row_number(sheets_service, spreadsheet_id, doc_id):
+    """문서의 시트 행 번호를 찾습니다.
+
+    인덱스에 있으면 해당 행의 C열 한 칸만 읽어 확인하고, 없거나 어긋나면
+    A2:D를 다시 읽어 인덱스를 재구성한 뒤 찾습니다. 찾지 못하면 -1.
+    """
+    entry = get_indexed_row(doc_id)
+    if entry:
+        row_number = entry['row']
+        result = sheets_service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range=f'C{row_number}').execute()
+        cell = result.get('values', [])
+        if cell and cell[0] and cell[0][0] == doc_id:
+            return row_number
+        print("시트 행 인덱스가 실제 시트와 달라 다시 불러옵니다.")
+        invalidate_row_index()
+
+    result = sheets_service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id, range='A2:D').execute()
+    values = result.get('values', [])
+    _rebuild_row_index(spreadsheet_id, values)
+    entry = get_indexed_row(doc_id)
+    return entry['row'] if entry else -1
 
 
 IMAGE_FOLDER_NAME = "Akashic Records Images"
@@ -51,46 +237,236 @@ def _upload_image_to_drive(drive_service, image_path):
         unique_file_name = f"{uuid.uuid4()}_{file_name}"
 
         file_metadata = {'name': unique_file_name, 'parents': [image_folder_id]}
-        media = MediaFileUpload(image_path, mimetype='image/jpeg') # MimeType can be more dynamic
+        mimetype = mimetypes.guess_type(image_path)[0] or 'image/jpeg'
+        media = MediaFileUpload(image_path, mimetype=mimetype)
         
+        # webContentLink는 생성 응답에 바로 포함되므로 다시 조회하지 않음
         file = drive_service.files().create(body=file_metadata, media_body=media, fields='id, webContentLink').execute()
         
         # Make the file publicly readable
         permission = {'type': 'anyone', 'role': 'reader'}
         drive_service.permissions().create(fileId=file.get('id'), body=permission).execute()
         
-        # Re-fetch the file to get the updated webContentLink
-        updated_file = drive_service.files().get(fileId=file.get('id'), fields='webContentLink').execute()
-        return updated_file.get('webContentLink')
+        return file.get('webContentLink')
     except Exception as e:
         print(f"이미지 업로드 실패: {image_path}, 오류: {e}")
         return None
 
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# 로컬 이미지 내용 해시 -> 업로드된 URL. 같은 파일은 경로가 달라도 한 번만 업로드합니다.
+_uploaded_images = None
+_uploaded_images_lock = threading.Lock()
+
+def _upload_worker(image_path):
+    # 작업자 스레드마다 자신의 Drive 클라이언트를 사용 (httplib2는 스레드 간 공유 불가)
+    try:
+        _, _, drive_service = get_services()
+    except Exception as e:
+        print(f"이미지 업로드 실패: {image_path}, 오류: {e}")
+        return None
+    return _upload_image_to_drive(drive_service, image_path)
+
+def _resolve_local_image(local_path):
+    # 편집기는 'resources/images/파일'처럼 앱 폴더 기준 상대 경로를 넣으므로 작업 폴더가 아니라 앱 폴더에서 찾음
+    from core.utils import resource_path
+    local_path = local_path.strip()
+    if local_path.startswith('<') and local_path.endswith('>'):
+        local_path = local_path[1:-1]
+    return local_path if os.path.isabs(local_path) else resource_path(local_path)
+
 def _process_images_for_upload(drive_service, markdown_content):
     # Regex to find markdown image tags with local paths
-    # It should not match http/https links
-    pattern = re.compile(r'\!\\\[(.*?)\]\((?!https?://)(.*?)\)')
-    
-    new_content = markdown_content
-    matches = pattern.finditer(markdown_content)
-    
-    for match in matches:
-        alt_text = match.group(1)
+    # It should not match http/https links (파일 이름에 공백이 있어도 한 줄 안에서는 맞음)
+    pattern = re.compile(r'!\[([^\]\n]*)\]\((?!\s*<?https?://)([^)\n]+)\)')
+
+    # 업로드한 이미지는 링크를 아는 누구나 볼 수 있게 공개되므로, 설정에서 켠 경우에만 업로드함 (기본값: 끔)
+    if not _get_bool_setting('Google', 'upload_local_images', False):
+        return markdown_content
+
+    global _uploaded_images
+    local_paths = {} # 본문에 적힌 경로 -> 실제 파일 경로
+    for match in pattern.finditer(markdown_content):
         local_path = match.group(2)
-        
-        if os.path.exists(local_path):
-            print(f"로컬 이미지 발견: {local_path}")
-            image_url = _upload_image_to_drive(drive_service, local_path)
-            if image_url:
-                print(f"업로드 성공: {image_url}")
-                # Replace the local path with the new URL in the content
-                original_tag = f"![{alt_text}]({local_path})"
-                new_tag = f"![{alt_text}]({image_url})"
-                new_content = new_content.replace(original_tag, new_tag)
+        if local_path in local_paths:
+            continue
+        file_path = _resolve_local_image(local_path)
+        if os.path.exists(file_path):
+            print(f"로컬 이미지 발견: {file_path}")
+            local_paths[local_path] = file_path
         else:
-            print(f"이미지 경로를 찾을 수 없음: {local_path}")
-            
-    return new_content
+            print(f"이미지 경로를 찾을 수 없음: {file_path}")
+    if not local_paths:
+        return markdown_content
+
+    path_hashes = {}
+    for local_path, file_path in local_paths.items():
+        try:
+            path_hashes[local_path] = _file_hash(file_path)
+        except OSError as e:
+            print(f"이미지 파일을 읽을 수 없음: {local_path}, 오류: {e}")
+
+    with _uploaded_images_lock:
+        if _uploaded_images is None:
+            _uploaded_images = config_manager.load_uploaded_images()
+        known = dict(_uploaded_images)
+
+    # 처음 보는 내용만 업로드 (해시당 대표 경로 하나)
+    to_upload = {}
+    for local_path, file_hash in path_hashes.items():
+        if file_hash not in known and file_hash not in to_upload:
+            to_upload[file_hash] = local_paths[local_path]
+
+    if to_upload:
+        # 폴더 생성이 작업자끼리 겹치지 않도록 미리 확보
+        _get_or_create_image_folder(drive_service)
+        max_workers = min(len(to_upload), max(1, _get_int_setting('Google', 'upload_concurrency', 4)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-upload") as executor:
+            futures = {file_hash: executor.submit(_upload_worker, local_path) for file_hash, local_path in to_upload.items()}
+        uploaded = {file_hash: future.result() for file_hash, future in futures.items() if future.result()}
+        if uploaded:
+            with _uploaded_images_lock:
+                _uploaded_images.update(uploaded)
+                config_manager.save_uploaded_images(_uploaded_images)
+            known.update(uploaded)
+
+    path_urls = {local_path: known[file_hash] for local_path, file_hash in path_hashes.items() if file_hash in known}
+    print(f"이미지 {len(path_urls)}/{len(local_paths)}개 URL 확보 (새로 업로드 {len(to_upload)}개)")
+
+    def replace(match):
+        image_url = path_urls.get(match.group(2))
+        if not image_url:
+            return match.group(0)
+        return f"![{match.group(1)}]({image_url})"
+
+    return pattern.sub(replace, markdown_content)
+
+# ===================================================================
+# 문서 증분 업데이트 (마지막 동기화 텍스트와의 차이만 전송)
+# ===================================================================
+# 마지막으로 동기화한 텍스트는 .txt 콘텐츠 캐시에, 그때의 revisionId와 텍스트 해시는
+# {doc_id}.meta.json에 보관합니다. 원격 리비전이 그대로일 때만 차이를 계산해 보냅니다.
+# 같은 파일의 html_revision_id/html_key는 캐시된 .html이 어느 리비전(과 제목/태그, CSS, 링크 대상)으로 렌더링되었는지 기록합니다.
+CHAR_DIFF_LIMIT = 4000 # 이보다 작은 변경 블록은 글자 단위로 비교
+
+def load_doc_meta(doc_id):
+    return content_cache.get_content_cache().read_meta(doc_id)
+
+def save_doc_meta(doc_id, **fields):
+    if not content_cache.get_content_cache().update_meta(doc_id, **fields):
+        print(f"문서 메타 저장 실패 ({doc_id})")
+
+def _text_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def _record_synced_text(doc_id, text, revision_id):
+    """문서에 반영된 텍스트와 리비전을 기록해 다음 저장 때 차이 계산의 기준으로 씁니다."""
+    if write_content_cache(doc_id, text) and revision_id:
+        # synced_at: 동기화 시 Drive 변경 목록에서 이 앱이 직접 쓴 변경을 구분하는 기준
+        save_doc_meta(doc_id, revision_id=revision_id, text_hash=_text_hash(text), synced_at=time.time())
+
+def _utf16_len(text):
+    # Docs API의 인덱스는 UTF-16 코드 단위 기준
+    return len(text.encode('utf-16-le')) // 2
+
+def _split_lines(text):
+    parts = text.split('\n')
+    lines = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+def _range_requests(start_index, old_text, new_text):
+    requests = []
+    if old_text:
+        requests.append({'deleteContentRange': {'range': {
+            'startIndex': start_index, 'endIndex': start_index + _utf16_len(old_text)}}})
+    if new_text:
+        requests.append({'insertText': {'location': {'index': start_index}, 'text': new_text}})
+    return requests
+
+def _char_diff_requests(start_index, old_block, new_block):
+    matcher = difflib.SequenceMatcher(None, old_block, new_block, autojunk=False)
+    requests = []
+    # 뒤에서부터 적용해야 앞쪽 인덱스가 바뀌지 않음
+    for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+        if tag == 'equal':
+            continue
+        index = start_index + _utf16_len(old_block[:i1])
+        requests.extend(_range_requests(index, old_block[i1:i2], new_block[j1:j2]))
+    return requests
+
+def build_diff_requests(old_text, new_text):
+    """old_text를 new_text로 바꾸는 최소한의 deleteContentRange/insertText 요청 목록.
+
+    줄 단위로 비교한 뒤, 작은 변경 블록은 글자 단위로 다시 비교합니다.
+    요청은 문서 끝쪽부터 적용되도록 정렬되어 있습니다. 본문은 인덱스 1에서 시작합니다.
+    """
+    old_lines = _split_lines(old_text)
+    new_lines = _split_lines(new_text)
+    offsets = [0]
+    for line in old_lines:
+        offsets.append(offsets[-1] + _utf16_len(line))
+
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    requests = []
+    for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+        if tag == 'equal':
+            continue
+        start_index = 1 + offsets[i1]
+        old_block = "".join(old_lines[i1:i2])
+        new_block = "".join(new_lines[j1:j2])
+        if tag == 'replace' and len(old_block) + len(new_block) <= CHAR_DIFF_LIMIT:
+            requests.extend(_char_diff_requests(start_index, old_block, new_block))
+        else:
+            requests.extend(_range_requests(start_index, old_block, new_block))
+    return requests
+
+def _full_replace_requests(docs_service, doc_id, new_text):
+    doc = docs_service.documents().get(documentId=doc_id, fields='revisionId,body(content(endIndex))').execute()
+    end_index = doc.get('body').get('content')[-1].get('endIndex') - 1
+    requests_body = []
+    if end_index > 1:
+        requests_body.append({'deleteContentRange': {'range': {'startIndex': 1, 'endIndex': end_index}}})
+    if new_text:
+        requests_body.append({'insertText': {'location': {'index': 1}, 'text': new_text}})
+    return requests_body, doc.get('revisionId')
+
+def _apply_content_update(docs_service, doc_id, new_text):
+    """문서 본문을 new_text로 맞춥니다. 가능하면 차이만, 아니면 전체를 교체합니다."""
+    meta = load_doc_meta(doc_id)
+    base_text = read_content_cache(doc_id)
+    if meta.get('revision_id') and base_text is not None and _text_hash(base_text) == meta.get('text_hash'):
+        doc = docs_service.documents().get(documentId=doc_id, fields='revisionId').execute()
+        revision_id = doc.get('revisionId')
+        if revision_id == meta['revision_id']:
+            requests_body = build_diff_requests(base_text, new_text)
+            if not requests_body:
+                return
+            try:
+                response = docs_service.documents().batchUpdate(documentId=doc_id, body={
+                    'requests': requests_body,
+                    'writeControl': {'requiredRevisionId': revision_id}}).execute()
+                _record_synced_text(doc_id, new_text, response.get('writeControl', {}).get('requiredRevisionId'))
+                return
+            except HttpError as e:
+                # 그 사이 다른 곳에서 문서가 바뀌었으면 전체 교체로 전환
+                if e.resp.status != 400:
+                    raise
+                print(f"원격 리비전이 바뀌어 전체 교체로 저장합니다 ({doc_id}).")
+        else:
+            print(f"원격 리비전이 바뀌어 전체 교체로 저장합니다 ({doc_id}).")
+
+    requests_body, revision_id = _full_replace_requests(docs_service, doc_id, new_text)
+    if requests_body:
+        response = docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests_body}).execute()
+        revision_id = response.get('writeControl', {}).get('requiredRevisionId')
+    _record_synced_text(doc_id, new_text, revision_id)
 
 def save_memo(title, markdown_content, tags_text):
     docs_service, sheets_service, drive_service = get_services()
@@ -113,13 +489,15 @@ def save_memo(title, markdown_content, tags_text):
 
         requests_body = [{'insertText': {'location': {'index': 1}, 'text': processed_content}}]
         if processed_content:
-            docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests_body}).execute()
+            response = docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests_body}).execute()
+            _record_synced_text(doc_id, processed_content, response.get('writeControl', {}).get('requiredRevisionId'))
         
         now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         row_data = [title, now, doc_id, tags_text]
-        sheets_service.spreadsheets().values().append(
+        append_response = sheets_service.spreadsheets().values().append(
             spreadsheetId=SPREADSHEET_ID, range='A1', valueInputOption='USER_ENTERED',
             insertDataOption='INSERT_ROWS', body={'values': [row_data]}).execute()
+        _index_appended_row(SPREADSHEET_ID, row_data, append_response)
         return True, doc_id
     except HttpError as e:
         if e.resp.status == 403:
@@ -139,40 +517,36 @@ def save_memo(title, markdown_content, tags_text):
         print(f"메모 저장 중 오류 발생: {e}")
         return False, f"알 수 없는 오류: {str(e)}"
 
-def update_memo(doc_id, new_title, markdown_content, tags_text):
+def update_memo(doc_id, new_title, markdown_content, tags_text, rename=True, update_sheet=True):
+    """메모를 갱신합니다.
+
+    rename이 False이면 Drive 파일 이름 변경을, update_sheet가 False이면 시트의
+    제목/날짜/태그 기록을 건너뜁니다 (바뀐 것이 없을 때 호출자가 끔).
+    """
     docs_service, sheets_service, drive_service = get_services()
     SPREADSHEET_ID = config_manager.get_setting('Google', 'spreadsheet_id')
     try:
         # Process images before updating
         processed_content = _process_images_for_upload(drive_service, markdown_content)
 
-        doc = docs_service.documents().get(documentId=doc_id).execute()
-        end_index = doc.get('body').get('content')[-1].get('endIndex') - 1
-        
-        requests_body = []
-        if end_index > 1:
-            requests_body.append({'deleteContentRange': {'range': {'startIndex': 1, 'endIndex': end_index}}})
-        
-        if processed_content:
-            requests_body.append({'insertText': {'location': {'index': 1}, 'text': processed_content}})
-
-        if requests_body:
-            docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests_body}).execute()
+        _apply_content_update(docs_service, doc_id, processed_content)
         
-        drive_service.files().update(fileId=doc_id, body={'name': new_title}).execute()
+        if rename:
+            drive_service.files().update(fileId=doc_id, body={'name': new_title}).execute()
 
-        result = sheets_service.spreadsheets().values().get(spreadsheetId=SPREADSHEET_ID, range='C:D').execute()
-        values = result.get('values', []); row_number = -1
-        for i, row in enumerate(values):
-            if row and row[0] == doc_id: row_number = i + 1; break
+        if not update_sheet:
+            return True
+        row_number = _find_row_number(sheets_service, SPREADSHEET_ID, doc_id)
         if row_number != -1:
             now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            sheets_service.spreadsheets().values().update(
-                spreadsheetId=SPREADSHEET_ID, range=f'A{row_number}',
-                valueInputOption='USER_ENTERED', body={'values': [[new_title, now]]}).execute()
-            sheets_service.spreadsheets().values().update(
-                spreadsheetId=SPREADSHEET_ID, range=f'D{row_number}',
-                valueInputOption='USER_ENTERED', body={'values': [[tags_text]]}).execute()
+            # 제목/날짜(A:B)와 태그(D)를 한 번의 요청으로 기록
+            sheets_service.spreadsheets().values().batchUpdate(
+                spreadsheetId=SPREADSHEET_ID,
+                body={'valueInputOption': 'USER_ENTERED', 'data': [
+                    {'range': f'A{row_number}:B{row_number}', 'values': [[new_title, now]]},
+                    {'range': f'D{row_number}', 'values': [[tags_text]]},
+                ]}).execute()
+            _index_updated_row(doc_id, new_title, now, tags_text)
         return True
     except Exception as e:
         print(f"메모 업데이트 중 오류 발생: {e}")
@@ -183,43 +557,66 @@ import markdown
 # get_credentials, get_services 함수는 기존과 동일하다고 가정합니다.
 # from your_google_api_setup import get_credentials, get_services
 
-def load_doc_content(doc_id, as_html=True, body_only=False):
+def _lookup_tags(sheets_service, spreadsheet_id, doc_id):
+    """행 인덱스에서 태그를 찾고, 없을 때만 시트의 C:D 범위를 읽습니다."""
+    entry = get_indexed_row(doc_id)
+    if entry:
+        return entry['tags']
+    result = sheets_service.spreadsheets().values().get(spreadsheetId=spreadsheet_id, range='C:D').execute()
+    for row in result.get('values', []):
+        if row and row[0] == doc_id and len(row) > 1:
+            return row[1]
+    return ""
+
+def _fetch_doc_text(docs_service, doc_id, meta=None):
+    """문서를 읽어 (제목, 마크다운 평문)을 반환합니다. API 오류는 그대로 전달합니다.
+
+    meta에 dict를 넘기면 같은 요청으로 받은 revisionId를 'revision_id'로 채웁니다.
+    """
+    # Request inlineObjects to get image data
+    doc = docs_service.documents().get(documentId=doc_id, fields="title,revisionId,body(content),inlineObjects").execute()
+    if meta is not None:
+        meta['revision_id'] = doc.get('revisionId')
+    title = doc.get('title', '제목 없음')
+    
+    plain_text_parts = []
+    body_content = doc.get('body').get('content')
+    
+    # A map to hold image URLs by their object ID
+    image_urls = {}
+    if 'inlineObjects' in doc:
+        for obj_id, obj_data in doc['inlineObjects'].items():
+            img_props = obj_data.get('inlineObjectProperties', {}).get('embeddedObject', {}).get('imageProperties', {})
+            if 'contentUri' in img_props:
+                image_urls[obj_id] = img_props['contentUri']
+
+    for element in body_content:
+        if 'paragraph' in element:
+            for pe in element.get('paragraph').get('elements', []):
+                if 'textRun' in pe:
+                    plain_text_parts.append(pe.get('textRun').get('content', ''))
+                elif 'inlineObjectElement' in pe:
+                    obj_id = pe['inlineObjectElement']['inlineObjectId']
+                    if obj_id in image_urls:
+                        # In markdown format, we represent the image with its URL
+                        plain_text_parts.append(f'![image]({image_urls[obj_id]})')
+
+    return title, "".join(plain_text_parts)
+
+def load_doc_content(doc_id, as_html=True, body_only=False, tags_text=None, meta=None):
+    """문서 내용을 불러옵니다.
+
+    호출자가 이미 태그를 알고 있으면 tags_text로 넘겨 시트 조회를 생략할 수 있습니다.
+    None이면 행 인덱스를 먼저 보고, 없을 때만 시트에서 찾습니다.
+    meta에 dict를 넘기면 불러온 내용의 revisionId가 담깁니다.
+    """
     docs_service, sheets_service, _ = get_services()
     SPREADSHEET_ID = config_manager.get_setting('Google', 'spreadsheet_id')
     try:
-        # Request inlineObjects to get image data
-        doc = docs_service.documents().get(documentId=doc_id, fields="title,body(content),inlineObjects").execute()
-        title = doc.get('title', '제목 없음')
-        
-        plain_text_parts = []
-        body_content = doc.get('body').get('content')
-        
-        # A map to hold image URLs by their object ID
-        image_urls = {}
-        if 'inlineObjects' in doc:
-            for obj_id, obj_data in doc['inlineObjects'].items():
-                img_props = obj_data.get('inlineObjectProperties', {}).get('embeddedObject', {}).get('imageProperties', {})
-                if 'contentUri' in img_props:
-                    image_urls[obj_id] = img_props['contentUri']
-
-        for element in body_content:
-            if 'paragraph' in element:
-                for pe in element.get('paragraph').get('elements', []):
-                    if 'textRun' in pe:
-                        plain_text_parts.append(pe.get('textRun').get('content', ''))
-                    elif 'inlineObjectElement' in pe:
-                        obj_id = pe['inlineObjectElement']['inlineObjectId']
-                        if obj_id in image_urls:
-                            # In markdown format, we represent the image with its URL
-                            plain_text_parts.append(f'![image]({image_urls[obj_id]})')
+        title, plain_text = _fetch_doc_text(docs_service, doc_id, meta)
 
-        plain_text = "".join(plain_text_parts)
-
-        result = sheets_service.spreadsheets().values().get(spreadsheetId=SPREADSHEET_ID, range='C:D').execute()
-        values = result.get('values', []); tags_text = ""
-        for row in values:
-            if row and row[0] == doc_id and len(row) > 1:
-                tags_text = row[1]; break
+        if tags_text is None:
+            tags_text = _lookup_tags(sheets_service, SPREADSHEET_ID, doc_id)
 
         if not as_html:
             return title, plain_text.strip(), tags_text
@@ -239,6 +636,96 @@ def load_doc_content(doc_id, as_html=True, body_only=False):
         print(f"문서 내용 변환 중 알 수 없는 오류 발생: {e}")
         return "오류", f"<p>내용을 불러오는 중 알 수 없는 오류가 발생했습니다: {e}</p>", ""
 
+# ===================================================================
+# 여러 문서 일괄 로드 (캐시 워밍업용)
+# ===================================================================
+class _RateLimiter:
+    """초당 요청 수를 제한하는 간단한 토큰 버킷. rate가 0 이하이면 제한하지 않습니다."""
+
+    def __init__(self, rate_per_sec):
+        self.rate = rate_per_sec
+        self.tokens = 1.0
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+def _get_int_setting(section, key, default):
+    try:
+        return int(config_manager.get_setting(section, key))
+    except (ValueError, TypeError, KeyError, configparser.Error):
+        return default
+
+def _get_bool_setting(section, key, default):
+    try:
+        return config_manager.get_setting(section, key).strip().lower() in ('1', 'true', 'yes', 'on')
+    except (AttributeError, KeyError, configparser.Error):
+        return default
+
+def read_content_cache(doc_id):
+    """로컬 .txt 콘텐츠 캐시를 읽습니다. 없거나 읽을 수 없으면 None."""
+    return content_cache.get_content_cache().read_text(doc_id, 'txt')
+
+def write_content_cache(doc_id, content):
+    """.txt 콘텐츠 캐시를 원자적으로 저장합니다."""
+    return content_cache.get_content_cache().write_text(doc_id, 'txt', content)
+
+def fetch_doc_contents(doc_ids, max_workers=None, rate_per_sec=None, write_cache=True):
+    """여러 문서의 평문 내용을 제한된 작업자 풀로 동시에 불러옵니다.
+
+    완료되는 순서대로 (doc_id, title, content)를 내보내며, 불러오지 못한 문서는
+    title과 content가 None입니다. write_cache가 True이면 받은 내용을 .txt 캐시에 저장합니다.
+    동시 작업자 수와 초당 요청 수는 설정(Google/fetch_concurrency, fetch_rate_per_sec)을 따릅니다.
+    """
+    doc_ids = list(dict.fromkeys(doc_ids)) # 순서를 유지하며 중복 제거
+    if not doc_ids:
+        return
+    if max_workers is None:
+        max_workers = _get_int_setting('Google', 'fetch_concurrency', 4)
+    if rate_per_sec is None:
+        rate_per_sec = _get_int_setting('Google', 'fetch_rate_per_sec', 5)
+    limiter = _RateLimiter(rate_per_sec)
+
+    def fetch_one(doc_id):
+        limiter.acquire()
+        try:
+            docs_service, _, _ = get_services()
+            title, plain_text = _fetch_doc_text(docs_service, doc_id)
+        except HttpError as e:
+            if e.resp.status == 404:
+                print(f"문서(ID: {doc_id})를 찾을 수 없습니다 (404).")
+            else:
+                print(f"문서 일괄 로드 중 HttpError 발생 (ID: {doc_id}): {e}")
+            return doc_id, None, None
+        except Exception as e:
+            print(f"문서 일괄 로드 중 알 수 없는 오류 발생 (ID: {doc_id}): {e}")
+            return doc_id, None, None
+        content = plain_text.strip()
+        if write_cache:
+            write_content_cache(doc_id, content)
+        return doc_id, title, content
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="doc-fetch")
+    try:
+        futures = [executor.submit(fetch_one, doc_id) for doc_id in doc_ids]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # 소비자가 중간에 멈추면 아직 시작하지 않은 작업은 취소
+        executor.shutdown(wait=False, cancel_futures=True)
+
 
 
 def load_memo_list():
@@ -255,12 +742,13 @@ def load_memo_list():
             while len(row) < 4:
                 row.append("")
             processed_values.append(row)
+        _rebuild_row_index(SPREADSHEET_ID, processed_values)
 
         print(f"로컬 캐시용 전체 목록 로딩 성공! {len(processed_values)}개 항목.")
         return processed_values
     except Exception as e:
         print(f"전체 목록 로딩 중 오류 발생: {e}")
-        return []
+        return None
 
 def search_memos_by_content(query=None, page_token=None):
     docs_service, sheets_service, drive_service = get_services()
@@ -287,26 +775,14 @@ def search_memos_by_content(query=None, page_token=None):
         return [], None
 
 def delete_memo(doc_id, row_index=None):
-    creds = get_credentials()
+    _, sheets_service, drive_service = get_services()
     SPREADSHEET_ID = config_manager.get_setting('Google', 'spreadsheet_id')
     try:
-        sheets_service = build('sheets', 'v4', credentials=creds)
-        drive_service = build('drive', 'v3', credentials=creds)
 
         # 1. (필요 시) 문서 ID를 기반으로 시트의 행 번호 찾기
         if row_index is None:
             print(f"'{doc_id}'의 행 번호를 찾는 중...")
-            # C열(문서 ID가 있는 열)의 모든 값을 가져옵니다.
-            result = sheets_service.spreadsheets().values().get(
-                spreadsheetId=SPREADSHEET_ID, range='C:C').execute()
-            values = result.get('values', [])
-            
-            found_row = -1
-            for i, row in enumerate(values):
-                if row and row[0] == doc_id:
-                    # 인덱스는 0부터 시작하지만, 시트 API는 1부터 시작하므로 +1
-                    found_row = i + 1
-                    break
+            found_row = _find_row_number(sheets_service, SPREADSHEET_ID, doc_id)
             
             if found_row == -1:
                 print("경고: 시트에서 해당 문서 ID를 찾지 못했습니다. 드라이브 파일만 삭제합니다.")
@@ -316,7 +792,8 @@ def delete_memo(doc_id, row_index=None):
 
         # 2. 구글 시트에서 해당 행 삭제 (row_index가 있을 경우에만)
         if row_index is not None:
-            spreadsheet_metadata = sheets_service.spreadsheets().get(spreadsheetId=SPREADSHEET_ID).execute()
+            spreadsheet_metadata = sheets_service.spreadsheets().get(
+                spreadsheetId=SPREADSHEET_ID, fields='sheets.properties.sheetId').execute()
             sheet_id = spreadsheet_metadata['sheets'][0]['properties']['sheetId']
             
             request_body = {
@@ -332,6 +809,7 @@ def delete_memo(doc_id, row_index=None):
             }
             sheets_service.spreadsheets().batchUpdate(
                 spreadsheetId=SPREADSHEET_ID, body=request_body).execute()
+            _index_deleted_row(doc_id, row_index)
             print(f"시트의 {row_index}행 삭제 완료.")
 
         # 3. 구글 드라이브에서 실제 문서 파일 삭제
@@ -437,6 +915,70 @@ def check_doc_exists(doc_id):
         print(f"문서 존재 확인 중 알 수 없는 오류 발생 (ID: {doc_id}): {e}")
         return False
 
+def get_doc_revision(doc_id):
+    """본문 없이 문서의 현재 revisionId만 확인합니다.
+
+    (존재 여부, revisionId)를 반환합니다. 문서가 없으면 (False, None),
+    그 밖의 오류로 확인하지 못했으면 (True, None)입니다.
+    """
+    docs_service, _, _ = get_services()
+    try:
+        doc = docs_service.documents().get(documentId=doc_id, fields='revisionId').execute()
+        return True, doc.get('revisionId')
+    except HttpError as e:
+        if e.resp.status == 404:
+            return False, None
+        print(f"문서 리비전 확인 중 오류 발생 (ID: {doc_id}): {e}")
+        return True, None
+    except Exception as e:
+        print(f"문서 리비전 확인 중 알 수 없는 오류 발생 (ID: {doc_id}): {e}")
+        return True, None
+
+# ===================================================================
+# Drive 변경 목록 (증분 동기화용)
+# ===================================================================
+CHANGE_FIELDS = 'nextPageToken,newStartPageToken,changes(fileId,removed,file(name,trashed,parents,modifiedTime))'
+
+def get_changes_start_token():
+    """현재 시점의 Drive 변경 목록 시작 토큰. 실패 시 None."""
+    _, _, drive_service = get_services()
+    try:
+        return drive_service.changes().getStartPageToken().execute().get('startPageToken')
+    except Exception as e:
+        print(f"Drive 변경 토큰 조회 중 오류 발생: {e}")
+        return None
+
+def list_drive_changes(page_token):
+    """page_token 이후의 변경 목록과 다음 동기화에 쓸 토큰을 돌려줍니다.
+
+    각 변경은 {'file_id', 'removed', 'name', 'parents', 'modified_time'} 형식이며,
+    토큰이 만료되었거나 오류가 나면 (None, None)을 돌려줍니다.
+    """
+    _, _, drive_service = get_services()
+    changes = []
+    try:
+        while page_token:
+            response = drive_service.changes().list(
+                pageToken=page_token, spaces='drive', includeRemoved=True,
+                pageSize=1000, fields=CHANGE_FIELDS).execute()
+            for change in response.get('changes', []):
+                file_info = change.get('file') or {}
+                changes.append({
+                    'file_id': change.get('fileId'),
+                    'removed': change.get('removed', False) or file_info.get('trashed', False),
+                    'name': file_info.get('name'),
+                    'parents': file_info.get('parents', []),
+                    'modified_time': file_info.get('modifiedTime'),
+                })
+            if 'newStartPageToken' in response:
+                return changes, response['newStartPageToken']
+            page_token = response.get('nextPageToken')
+    except HttpError as e:
+        print(f"Drive 변경 목록 조회 중 오류 발생 (토큰 재발급 필요): {e}")
+    except Exception as e:
+        print(f"Drive 변경 목록 조회 중 알 수 없는 오류 발생: {e}")
+    return None, None
+
 def append_text_to_doc(doc_id, text_to_append):
     """지정된 문서의 맨 끝에 텍스트를 추가합니다."""
     docs_service, _, _ = get_services()
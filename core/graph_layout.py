@@ -0,0 +1,286 @@
+import json
+import math
+import os
+import random
+import tempfile
+import threading
+
+from core import config_manager
+
+# 배치 매개변수 (좌표 단위는 vis-network의 px)
+IDEAL_LENGTH = 80.0 # 링크로 이어진 노드 사이의 목표 거리
+REPULSION_RANGE = 1.5 * IDEAL_LENGTH # 이보다 먼 노드끼리는 밀어내지 않음 (원점 쪽 인력이 전체 모양을 잡음)
+FULL_ITERATIONS = 40 # 처음 배치할 때의 반복 수 (노드가 많으면 절반)
+INCREMENTAL_ITERATIONS = 25 # 새 노드/바뀐 링크 주변만 다시 배치할 때의 반복 수
+GRAVITY = 0.02 # 떨어진 덩어리가 멀리 흩어지지 않도록 원점으로 당기는 힘
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+# 태그 묶음 보기에서 이보다 큰 태그는 하나의 노드로 접음
+CLUSTER_MIN_SIZE = 20
+# 이웃 보기에서 보여 줄 최대 노드 수
+NEIGHBORHOOD_MAX_NODES = 400
+
+
+def _undirected(edges):
+    pairs = set()
+    for source_id, target_id in edges:
+        if source_id != target_id:
+            pairs.add((source_id, target_id) if source_id < target_id else (target_id, source_id))
+    return pairs
+
+
+class GraphLayout:
+    """지식 그래프 노드 좌표를 Python에서 미리 계산해 두는 배치 캐시.
+
+    격자로 가까운 노드끼리만 밀어내는 힘 기반 배치(Fruchterman-Reingold)를 쓰며, 좌표와 마지막 배치 때의
+    링크 목록을 디스크(GRAPH_LAYOUT_FILE)에 보관합니다. 다음에 그래프를 열 때는 새로 생긴 노드를 이웃 근처에
+    놓고, 새 노드와 링크가 바뀐 노드만 움직여 다시 배치합니다. 나머지 노드는 그대로라 화면 모양이 유지됩니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or config_manager.GRAPH_LAYOUT_FILE
+        self._lock = threading.Lock()
+        self._positions = {} # doc_id -> [x, y]
+        self._edges = set() # 마지막 배치 때의 링크 (방향 없음)
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"그래프 배치 캐시 로드 실패: {e}")
+            return
+        if not isinstance(data, dict):
+            return
+        self._positions = {doc_id: [float(pos[0]), float(pos[1])] for doc_id, pos in data.get('positions', {}).items()
+                           if isinstance(pos, list) and len(pos) == 2}
+        self._edges = {tuple(edge) for edge in data.get('edges', []) if isinstance(edge, list) and len(edge) == 2}
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps({'positions': {doc_id: [round(x, 1), round(y, 1)] for doc_id, (x, y) in self._positions.items()},
+                               'edges': sorted(self._edges)}, ensure_ascii=False)
+            self._dirty = False
+        directory = os.path.dirname(self.path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".graph_layout.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"그래프 배치 캐시 저장 실패: {e}")
+
+    def positions(self):
+        with self._lock:
+            return {doc_id: (pos[0], pos[1]) for doc_id, pos in self._positions.items()}
+
+    def update(self, node_ids, edges):
+        """노드/링크 목록에 맞춰 좌표를 갱신하고 {doc_id: (x, y)}를 돌려줌. 바뀐 것이 없으면 그대로."""
+        node_ids = list(dict.fromkeys(node_ids))
+        node_set = set(node_ids)
+        pairs = {pair for pair in _undirected(edges) if pair[0] in node_set and pair[1] in node_set}
+        with self._lock:
+            positions = self._positions
+            removed = [doc_id for doc_id in positions if doc_id not in node_set]
+            new_nodes = [doc_id for doc_id in node_ids if doc_id not in positions]
+            changed_pairs = pairs ^ self._edges
+            if removed or new_nodes or changed_pairs:
+                for doc_id in removed:
+                    del positions[doc_id]
+                adjacency = {doc_id: [] for doc_id in node_ids}
+                for a, b in pairs:
+                    adjacency[a].append(b)
+                    adjacency[b].append(a)
+                if len(new_nodes) > len(node_ids) // 2:
+                    # 처음이거나 대부분이 새 노드면 전체를 다시 배치
+                    positions.clear()
+                    self._place_initial(node_ids, adjacency)
+                    self._relax(node_ids, adjacency, FULL_ITERATIONS if len(node_ids) <= 2000 else FULL_ITERATIONS // 2)
+                else:
+                    self._place_new(new_nodes, adjacency)
+                    movable = set(new_nodes)
+                    for a, b in changed_pairs:
+                        movable.update(doc_id for doc_id in (a, b) if doc_id in node_set)
+                    if movable:
+                        self._relax(list(movable), adjacency, INCREMENTAL_ITERATIONS)
+                self._edges = pairs
+                self._dirty = True
+            return {doc_id: (pos[0], pos[1]) for doc_id, pos in positions.items()}
+
+    # ------------------------------------------------------------------
+    # 배치
+    # ------------------------------------------------------------------
+    def _place_initial(self, node_ids, adjacency):
+        # 링크가 많은 노드부터 너비 우선으로 번호를 매겨 해바라기 나선에 놓음 (이어진 노드가 가까이에서 시작)
+        order = []
+        seen = set()
+        for start in sorted(node_ids, key=lambda doc_id: -len(adjacency[doc_id])):
+            if start in seen:
+                continue
+            seen.add(start)
+            queue = [start]
+            for doc_id in queue:
+                order.append(doc_id)
+                for neighbor in adjacency[doc_id]:
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        queue.append(neighbor)
+        for i, doc_id in enumerate(order):
+            radius = IDEAL_LENGTH * 0.7 * math.sqrt(i)
+            angle = i * GOLDEN_ANGLE
+            self._positions[doc_id] = [radius * math.cos(angle), radius * math.sin(angle)]
+
+    def _place_new(self, new_nodes, adjacency):
+        # 이미 놓인 이웃이 있으면 그 가운데 근처, 없으면 현재 그림의 바깥 둘레에
+        rng = random.Random(len(self._positions))
+        outer = max((math.hypot(x, y) for x, y in self._positions.values()), default=0.0) + IDEAL_LENGTH
+        pending = []
+        for doc_id in new_nodes:
+            placed = [self._positions[n] for n in adjacency[doc_id] if n in self._positions]
+            if placed:
+                x = sum(pos[0] for pos in placed) / len(placed)
+                y = sum(pos[1] for pos in placed) / len(placed)
+                self._positions[doc_id] = [x + rng.uniform(-0.5, 0.5) * IDEAL_LENGTH, y + rng.uniform(-0.5, 0.5) * IDEAL_LENGTH]
+            else:
+                pending.append(doc_id)
+        for i, doc_id in enumerate(pending):
+            angle = i * GOLDEN_ANGLE
+            radius = outer + IDEAL_LENGTH * 0.5 * math.sqrt(i)
+            self._positions[doc_id] = [radius * math.cos(angle), radius * math.sin(angle)]
+
+    def _relax(self, movable, adjacency, iterations):
+        """movable 노드만 움직이는 힘 기반 배치. 밀어내는 힘은 격자로 가까운(REPULSION_RANGE 이내) 노드끼리만 계산."""
+        positions = self._positions
+        k = IDEAL_LENGTH
+        k2 = k * k
+        cell = REPULSION_RANGE
+        cutoff2 = cell * cell
+        temperature = k * 2
+        cooling = temperature / (iterations + 1)
+        sqrt = math.sqrt
+        for _ in range(iterations):
+            grid = {}
+            for doc_id, pos in positions.items():
+                grid.setdefault((int(pos[0] // cell), int(pos[1] // cell)), []).append((doc_id, pos[0], pos[1]))
+            moves = []
+            for doc_id in movable:
+                x, y = positions[doc_id]
+                fx = -x * GRAVITY
+                fy = -y * GRAVITY
+                cx = int(x // cell)
+                cy = int(y // cell)
+                for gx in (cx - 1, cx, cx + 1):
+                    for gy in (cy - 1, cy, cy + 1):
+                        for other, ox, oy in grid.get((gx, gy), ()):
+                            dx = x - ox
+                            dy = y - oy
+                            d2 = dx * dx + dy * dy
+                            if d2 >= cutoff2 or other == doc_id:
+                                continue
+                            if d2 < 0.01:
+                                dx, dy, d2 = 0.1, 0.1, 0.02
+                            f = k2 / d2
+                            fx += dx * f
+                            fy += dy * f
+                for neighbor in adjacency.get(doc_id, ()):
+                    ox, oy = positions[neighbor]
+                    dx = ox - x
+                    dy = oy - y
+                    f = sqrt(dx * dx + dy * dy) / k
+                    fx += dx * f
+                    fy += dy * f
+                length = sqrt(fx * fx + fy * fy)
+                if length > temperature:
+                    fx *= temperature / length
+                    fy *= temperature / length
+                moves.append((doc_id, x + fx, y + fy))
+            for doc_id, x, y in moves:
+                positions[doc_id] = [x, y]
+            temperature -= cooling
+
+
+# ----------------------------------------------------------------------
+# 보기 (전체 / 이웃만 / 태그 묶음)
+# ----------------------------------------------------------------------
+def neighborhood(center_id, edges, depth=2, max_nodes=NEIGHBORHOOD_MAX_NODES):
+    """center_id에서 링크 방향과 관계없이 depth 단계 안에 있는 노드 집합 (최대 max_nodes개)"""
+    adjacency = {}
+    for source_id, target_id in edges:
+        adjacency.setdefault(source_id, []).append(target_id)
+        adjacency.setdefault(target_id, []).append(source_id)
+    selected = {center_id}
+    frontier = [center_id]
+    for _ in range(depth):
+        next_frontier = []
+        for doc_id in frontier:
+            for neighbor in adjacency.get(doc_id, ()):
+                if neighbor in selected:
+                    continue
+                if len(selected) >= max_nodes:
+                    return selected
+                selected.add(neighbor)
+                next_frontier.append(neighbor)
+        frontier = next_frontier
+    return selected
+
+
+def cluster_by_tag(nodes, edges, tag_colors, min_size=CLUSTER_MIN_SIZE, expanded=()):
+    """첫 번째 태그가 같은 노드가 min_size개 이상이면 'tag:<태그>' 노드 하나로 접은 (노드, 링크) 목록.
+
+    접힌 노드의 좌표는 구성원 좌표의 가운데, 크기는 구성원 수에 따라 커지며, 링크는 양 끝을 접힌 노드로
+    바꾼 뒤 같은 쌍끼리 합쳐 개수를 value로 둡니다. expanded에 든 태그는 접지 않습니다.
+    """
+    members = {}
+    for node in nodes:
+        if node['tags']:
+            members.setdefault(node['tags'][0], []).append(node)
+    collapsed = {tag: group for tag, group in members.items() if len(group) >= min_size and tag not in expanded}
+    owner = {}
+    view_nodes = []
+    for tag, group in collapsed.items():
+        cluster_id = f"tag:{tag}"
+        xs = [node['x'] for node in group if 'x' in node]
+        ys = [node['y'] for node in group if 'y' in node]
+        cluster = {
+            "id": cluster_id,
+            "label": f"#{tag} ({len(group)})",
+            "title": f"#{tag} 메모 {len(group)}개 (클릭하면 펼침)",
+            "size": 16 + 4 * math.sqrt(len(group)),
+            "color": tag_colors.get(tag, '#9E9E9E'),
+            "tags": [tag],
+            "cluster": True,
+            "count": len(group),
+        }
+        if xs:
+            cluster["x"] = sum(xs) / len(xs)
+            cluster["y"] = sum(ys) / len(ys)
+        view_nodes.append(cluster)
+        for node in group:
+            owner[node['id']] = cluster_id
+    view_nodes.extend(node for node in nodes if node['id'] not in owner)
+
+    counts = {}
+    for edge in edges:
+        source_id = owner.get(edge['from'], edge['from'])
+        target_id = owner.get(edge['to'], edge['to'])
+        if source_id != target_id:
+            counts[(source_id, target_id)] = counts.get((source_id, target_id), 0) + 1
+    view_edges = []
+    for (source_id, target_id), count in counts.items():
+        edge = {"from": source_id, "to": target_id}
+        if count > 1:
+            edge["value"] = count
+            edge["title"] = f"링크 {count}개"
+        view_edges.append(edge)
+    return view_nodes, view_edges
@@ -0,0 +1,149 @@
+import os
+import re
+
+from core import config_manager
+
+# 기본 CSS
+DEFAULT_CSS = """
+        <style>
+            body { font-family: "Segoe UI", "Malgun Gothic", sans-serif; line-height: 1.7; padding: 35px; background-color: #ffffff; color: #333333; }
+            h1, h2, h3, h4, h5, h6 { font-weight: 600; color: #111111; margin-top: 1.5em; margin-bottom: 0.5em; line-height: 1.25; }
+            h1 { font-size: 2em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }
+            h2 { font-size: 1.5em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }
+            p { margin: 0 0 16px 0; }
+            a { color: #0366d6; text-decoration: none; } a:hover { text-decoration: underline; }
+            .broken-link { color: #dc3545; text-decoration: line-through; cursor: help; }
+            pre { background-color: #f6f8fa; border-radius: 4px; padding: 16px; overflow: auto; font-size: 85%; }
+            code { font-family: "D2Coding", "Consolas", monospace; background-color: rgba(27,31,35,0.05); border-radius: 3px; padding: .2em .4em; font-size: 90%; }
+            pre > code { padding: 0; background-color: transparent; }
+            blockquote { margin: 0 0 16px 0; padding: 0 1.2em; color: #6a737d; border-left: 0.25em solid #dfe2e5; }
+            ul, ol { padding-left: 2em; margin-bottom: 16px; }
+            table { border-collapse: collapse; margin-bottom: 16px; display: block; width: 100%; overflow: auto; }
+            th, td { border: 1px solid #dfe2e5; padding: 8px 13px; }
+            tr { border-top: 1px solid #c6cbd1; background-color: #fff; }
+            tr:nth-child(2n) { background-color: #f6f8fa; }
+            hr { height: .25em; padding: 0; margin: 24px 0; background-color: #e1e4e8; border: 0; }
+            .tags-container { margin-bottom: 20px; border-bottom: 1px solid #eaecef; padding-bottom: 10px; }
+            .tag-link { background-color: #f1f8ff; color: #0366d6; padding: 3px 8px; border-radius: 12px; font-size: 0.9em; margin-right: 5px; }
+            .tag-link:hover { background-color: #ddeeff; }
+        </style>
+        """
+
+# 본문 후처리 패턴을 하나로 합쳐 한 번만 훑음. 앞의 대안이 우선하므로 순서가 중요함:
+#   체크박스 <li>[ ] / <li>[x]  ->  위키 링크 [[제목]]  ->  그 밖의 태그(<...>, 속성 안은 건드리지 않음)
+#   ->  !p1~5 우선순위  ->  " @날짜 시간:분"  ->  " @날짜"
+# 날짜 태그는 다음 HTML 태그 앞에서 끝나도록 해 </li> 등을 감싸지 않게 함.
+_POSTPROCESS_PATTERN = re.compile(
+    r'<li>\[(?P<check>[ x])\]'
+    r'|\[\[(?P<wiki>.*?)\]\]'
+    r'|(?P<tag><[^>]*>)'
+    r'|!p(?P<rank>[1-5])'
+    r'|\s(?P<datetime>@[^\s<]+\s[^\s<]*:[^\s<]+)'
+    r'|\s(?P<date>@[^\s<]+)'
+)
+# 상대 경로 이미지가 있는지만 빠르게 확인 (있을 때만 HTML 파서를 사용)
+_RELATIVE_IMG_PATTERN = re.compile(r'<img\b[^>]*\bsrc\s*=\s*["\']?(?!https?://|file://)[^"\'\s>]', re.IGNORECASE)
+
+_css_cache = {'path': None, 'mtime': None, 'css': None}
+
+
+def convert_local_images(html):
+    """로컬 이미지 경로를 절대 경로로 변환 (상대 경로 <img>가 있을 때만 파싱)"""
+    if not _RELATIVE_IMG_PATTERN.search(html):
+        return html
+    from bs4 import BeautifulSoup
+    from core.utils import resource_path
+    soup = BeautifulSoup(html, 'html.parser')
+    for img in soup.find_all('img'):
+        src = img.get('src')
+        if src and not src.startswith(('http://', 'https://', 'file://')):
+            # 상대 경로인 경우 절대 경로로 변환
+            if src.startswith('resources/'):
+                abs_path = os.path.abspath(resource_path(src))
+                img['src'] = f"file:///{abs_path.replace(os.sep, '/')}"
+            elif src.startswith('./') or src.startswith('../'):
+                abs_path = os.path.abspath(os.path.join(os.getcwd(), src))
+                img['src'] = f"file:///{abs_path.replace(os.sep, '/')}"
+    return str(soup)
+
+
+def postprocess_body(html_body, resolve_title):
+    """위키 링크, 체크박스, 우선순위, 날짜 태그를 한 번의 정규식 순회로 변환.
+
+    resolve_title(제목)은 문서 ID 또는 None을 돌려주는 함수입니다.
+    """
+    def replace(match):
+        kind = match.lastgroup
+        if kind == 'tag':
+            return match.group(0)
+        if kind == 'check':
+            css_class = "task-checkbox-done" if match.group('check') == 'x' else "task-checkbox-empty"
+            return f'<li><span class="{css_class}"></span>'
+        if kind == 'wiki':
+            linked_title = match.group('wiki')
+            doc_id = resolve_title(linked_title)
+            if doc_id:
+                return f'<a href="memo://{doc_id}" title="메모 열기: {linked_title}">{linked_title}</a>'
+            return f'<span class="broken-link" title="존재하지 않는 메모: {linked_title}">[[{linked_title}]]</span>'
+        if kind == 'rank':
+            return f'<span class="rank-{match.group("rank")}"></span>'
+        if kind == 'datetime':
+            return f'<span class="datetime-tag">{match.group("datetime")}</span>'
+        return f'<span class="date-tag">{match.group("date")}</span>'
+
+    return _POSTPROCESS_PATTERN.sub(replace, convert_local_images(html_body))
+
+
+def build_tags_html(tags_text):
+    # 태그를 표시하고 클릭 가능하게 만듦
+    if not tags_text:
+        return ""
+    tags = [t.strip() for t in tags_text.replace(',', ' ').split() if t.strip()]
+    parts = ['<div class="tags-container">']
+    for tag in tags:
+        clean_tag = tag.lstrip('#')
+        parts.append(f'<a href="tag://{clean_tag}" class="tag-link">#{clean_tag}</a> ')
+    parts.append('</div>')
+    return "".join(parts)
+
+
+def css_fingerprint():
+    """사용자 CSS 경로와 수정 시각 (캐시된 HTML이 지금 CSS로 렌더링되었는지 확인용). 없으면 빈 문자열."""
+    custom_css_path = config_manager.get_setting('Display', 'custom_css_path')
+    if not custom_css_path:
+        return ""
+    try:
+        return f"{custom_css_path}:{os.path.getmtime(custom_css_path)}"
+    except OSError:
+        return ""
+
+
+def get_css():
+    """사용자 CSS가 설정되어 있으면 그 내용을, 아니면 기본 CSS. 파일 수정 시각이 같으면 다시 읽지 않음."""
+    custom_css_path = config_manager.get_setting('Display', 'custom_css_path')
+    if not custom_css_path:
+        return DEFAULT_CSS
+    try:
+        mtime = os.path.getmtime(custom_css_path)
+    except OSError:
+        return DEFAULT_CSS
+    if _css_cache['path'] == custom_css_path and _css_cache['mtime'] == mtime:
+        return _css_cache['css']
+    try:
+        with open(custom_css_path, 'r', encoding='utf-8') as f:
+            css = f"<style>{f.read()}</style>"
+    except Exception:
+        return DEFAULT_CSS
+    _css_cache.update(path=custom_css_path, mtime=mtime, css=css)
+    return css
+
+
+def wrap_page(title, body_html, head_extra=""):
+    # 이미 후처리된 본문을 CSS와 함께 완성된 HTML 문서로 감쌈
+    return f'<html><head><meta charset="UTF-8"><title>{title}</title>{get_css()}{head_extra}</head><body>{body_html}</body></html>'
+
+
+def render_page(title, html_body, tags_text, resolve_title):
+    parsed_body = postprocess_body(html_body, resolve_title)
+    tags_html = build_tags_html(tags_text)
+    return wrap_page(title, f"{tags_html}{parsed_body}")
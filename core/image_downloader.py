@@ -0,0 +1,75 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core import config_manager, content_cache
+
+DEFAULT_CONCURRENCY = 6
+DOWNLOAD_TIMEOUT_SECONDS = 10
+
+# 다운로드가 끝나기 전까지 보여 줄 회색 상자 (실제 URL은 data-remote-src에 보관)
+PLACEHOLDER_SRC = ("data:image/svg+xml;charset=utf-8,"
+                   "%3Csvg xmlns='http://www.w3.org/2000/svg' width='320' height='180'%3E"
+                   "%3Crect width='100%25' height='100%25' fill='%23f1f3f5'/%3E%3C/svg%3E")
+
+
+def _get_concurrency():
+    try:
+        return max(1, int(config_manager.get_setting('Cache', 'image_download_concurrency')))
+    except Exception:
+        return DEFAULT_CONCURRENCY
+
+
+class ImageDownloader:
+    """메모 본문 이미지를 콘텐츠 캐시로 내려받는 공용 다운로더.
+
+    연결을 재사용하는 requests.Session 하나와 크기가 정해진 작업자 풀을 쓰고,
+    같은 URL을 동시에 여러 번 요청하면 진행 중인 다운로드 하나를 함께 기다립니다.
+    fetch()는 로컬 파일 경로(실패 시 None)를 결과로 하는 Future를 돌려줍니다.
+    """
+
+    def __init__(self, cache=None, max_workers=None, timeout=DOWNLOAD_TIMEOUT_SECONDS):
+        self.cache = cache or content_cache.get_content_cache()
+        self.max_workers = max_workers or _get_concurrency()
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-fetch")
+        self._lock = threading.Lock()
+        self._in_flight = {} # URL -> Future
+
+    def cached_path(self, url):
+        return self.cache.image_path(url)
+
+    def fetch(self, url):
+        path = self.cache.image_path(url)
+        if path is not None:
+            future = Future()
+            future.set_result(path)
+            return future
+        with self._lock:
+            future = self._in_flight.get(url)
+            if future is None:
+                future = self._executor.submit(self._download, url)
+                self._in_flight[url] = future
+            return future
+
+    def _download(self, url):
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return self.cache.store_image(url, response.content)
+        except requests.exceptions.RequestException as e:
+            print(f"Error downloading image {url}: {e}")
+            return None
+        finally:
+            with self._lock:
+                self._in_flight.pop(url, None)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
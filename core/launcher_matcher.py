@@ -0,0 +1,353 @@
+import bisect
+import heapq
+import re
+
+# 빠른 실행 창에 한 번에 보여 줄 최대 결과 수
+DEFAULT_LIMIT = 50
+# 흩어진 일치 단계에서 점수를 매길 최대 후보 수 (우선순위 높은 제목부터).
+# 단어 첫머리/연속 일치 후보는 개수 제한 없이 보되, 남은 후보가 점수 상한으로도 결과에 들 수 없으면 멈춤
+MAX_CANDIDATES = 300
+# 지연 생성한 n-gram 비트마스크를 최대 몇 개까지 보관할지
+GRAM_CACHE_SIZE = 4096
+
+# 점수 (fzf와 같은 방식: 글자 일치 + 경계/연속 보너스 - 틈 벌점)
+SCORE_MATCH = 16
+SCORE_GAP_START = -3
+SCORE_GAP_EXTENSION = -1
+BONUS_BOUNDARY = 8 # 제목 처음, 공백/기호 다음
+BONUS_CAMEL = 7 # 소문자 -> 대문자, 글자 <-> 숫자 전환
+BONUS_SYLLABLE = 3 # 한글 음절의 첫 자모
+BONUS_CONSECUTIVE = 4
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+BONUS_EXACT = 48 # 제목 전체가 검색어와 같음 (즐겨찾기 + 최근 보너스보다 커서 우선순위와 관계없이 맨 위)
+# 제목 자체의 우선순위
+FAVORITE_BONUS = 24
+RECENCY_BONUS = 16 # 가장 최근 메모가 받는 보너스 (오래될수록 0에 가까워짐)
+# 글자 하나가 받을 수 있는 가장 큰 경계/연속 보너스 (점수 상한 계산용)
+_MAX_CHAR_BONUS = max(BONUS_BOUNDARY, BONUS_CAMEL, BONUS_SYLLABLE, BONUS_CONSECUTIVE)
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ", "ㅗㅣ", "ㅛ", "ㅜ",
+              "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"]
+_JONGSEONG = ["", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+              "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 겹모음/겹받침 호환 자모도 키 입력 순서대로 풀어 씀 (입력 중인 'ㄳ', 'ㅘ' 등)
+_COMPOUND_JAMO = {"ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+                  "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ",
+                  "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ"}
+
+
+def _build_tables():
+    jamo = {ord(k): v for k, v in _COMPOUND_JAMO.items()}
+    choseong = {}
+    code = 0xAC00
+    for cho in _CHOSEONG:
+        for jung in _JUNGSEONG:
+            for jong in _JONGSEONG:
+                jamo[code] = cho + jung + jong
+                choseong[code] = cho
+                code += 1
+    return jamo, choseong
+
+
+# str.translate용 표: 한글 음절 -> 자모열 / 초성
+_JAMO_TABLE, _CHOSEONG_TABLE = _build_tables()
+_JAMO_WIDTH = {chr(code): len(jamo) for code, jamo in _JAMO_TABLE.items()}
+_CONSONANTS = set(_CHOSEONG)
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+_BIT_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+
+def to_jamo(text):
+    """소문자로 바꾸고 한글 음절을 자모열로 풀어 씀. 입력 중인 음절('각' -> '가게')도 앞부분이 맞게 됨."""
+    return text.lower().translate(_JAMO_TABLE)
+
+
+def to_choseong(text):
+    """한글 음절을 초성으로 바꿈 ('한글 메모' -> 'ㅎㄱ ㅁㅁ')."""
+    return text.lower().translate(_CHOSEONG_TABLE)
+
+
+def _char_bonuses(title, cho):
+    """to_jamo(title) (cho면 to_choseong(title))의 위치별 경계 보너스."""
+    bonuses = bytearray()
+    prev = 'sep'
+    for ch in title:
+        if '가' <= ch <= '힣':
+            kind = 'hangul'
+            bonus = BONUS_BOUNDARY if prev == 'sep' else BONUS_SYLLABLE
+        elif not ch.isalnum():
+            kind = 'sep'
+            bonus = 0
+        else:
+            kind = 'digit' if ch.isdigit() else ('upper' if ch.isupper() else 'lower')
+            if prev == 'sep':
+                bonus = BONUS_BOUNDARY
+            elif (prev == 'lower' and kind == 'upper') or (prev != 'hangul' and (prev == 'digit') != (kind == 'digit')):
+                bonus = BONUS_CAMEL
+            else:
+                bonus = 0
+        bonuses.append(bonus)
+        width = 1 if cho else _JAMO_WIDTH.get(ch, 1)
+        if width > 1:
+            bonuses.extend(bytes(width - 1))
+        prev = kind
+    return bonuses
+
+
+def _fuzzy_positions(text, pattern):
+    """pattern 글자들이 순서대로 나타나는 가장 짧은 구간의 일치 위치 (없으면 None)."""
+    pos = text.find(pattern[0])
+    if pos < 0:
+        return None
+    first = pos
+    for ch in pattern[1:]:
+        pos = text.find(ch, pos + 1)
+        if pos < 0:
+            return None
+    # 끝에서부터 거꾸로 맞춰 시작 위치를 최대한 뒤로 당김
+    end = pos
+    for ch in reversed(pattern[:-1]):
+        pos = text.rfind(ch, first, pos)
+    positions = [pos]
+    for ch in pattern[1:]:
+        pos = text.find(ch, pos + 1, end + 1)
+        positions.append(pos)
+    return positions
+
+
+def _score_substring(bonuses, pos, length):
+    # _score_positions의 연속 일치 전용 간이판 (덩어리 중간의 경계 보너스는 무시)
+    bonus = bonuses[pos] if pos < len(bonuses) else 0
+    return SCORE_MATCH * length + bonus * BONUS_FIRST_CHAR_MULTIPLIER + (length - 1) * max(bonus, BONUS_CONSECUTIVE)
+
+
+def _score_positions(bonuses, positions):
+    score = 0
+    prev = -2
+    chunk_bonus = 0
+    for k, pos in enumerate(positions):
+        bonus = bonuses[pos] if pos < len(bonuses) else 0
+        if k == 0:
+            score += SCORE_MATCH + bonus * BONUS_FIRST_CHAR_MULTIPLIER
+            chunk_bonus = bonus
+        elif pos == prev + 1:
+            # 연속 일치는 덩어리 첫 글자의 경계 보너스를 이어받음
+            chunk_bonus = max(chunk_bonus, bonus, BONUS_CONSECUTIVE)
+            score += SCORE_MATCH + chunk_bonus
+        else:
+            gap = pos - prev - 1
+            score += SCORE_MATCH + bonus + SCORE_GAP_START + SCORE_GAP_EXTENSION * (gap - 1)
+            chunk_bonus = bonus
+        prev = pos
+    return score
+
+
+def _max_term_score(length):
+    # 길이가 length인 조각이 (정확히 같은 제목이 아닐 때) 얻을 수 있는 가장 높은 점수
+    return SCORE_MATCH * length + _MAX_CHAR_BONUS * BONUS_FIRST_CHAR_MULTIPLIER + (length - 1) * _MAX_CHAR_BONUS
+
+
+def _iter_mask_ids(mask):
+    """비트마스크의 id를 작은 것(우선순위 높은 것)부터 차례로"""
+    bits = bin(mask)[:1:-1]
+    pos = bits.find('1')
+    while pos >= 0:
+        yield pos
+        pos = bits.find('1', pos + 1)
+
+
+def _mask_ids(mask, cap, skip):
+    """비트마스크의 id를 작은 것(우선순위 높은 것)부터 최대 cap개 (skip에 있는 id는 제외)"""
+    bits = bin(mask)[:1:-1]
+    ids = []
+    pos = bits.find('1')
+    while pos >= 0 and len(ids) < cap:
+        if pos not in skip:
+            ids.append(pos)
+        pos = bits.find('1', pos + 1)
+    return ids
+
+
+class LauncherMatcher:
+    """빠른 실행 창의 메모 제목 검색기 (Qt와 무관).
+
+    제목마다 소문자 자모열과 초성열, 단어 첫머리 접두어 색인을 미리 만들어 두고,
+    1-gram/2-gram 비트마스크(처음 쓰일 때 만들어 보관)로 후보를 좁힌 뒤 fzf 방식으로 점수를 매깁니다.
+    제목 id는 우선순위(즐겨찾기, 최근 수정) 순서로 매기므로, 후보를 우선순위 높은 것부터 보다가
+    남은 후보가 점수 상한에 우선순위를 더해도 현재 limit번째 결과보다 낮으면 멈춥니다. 제목 전체가 검색어와
+    같은 제목은 따로 색인해 우선순위와 관계없이 항상 점수를 매깁니다. 흩어진 일치만 후보가 많으므로
+    MAX_CANDIDATES개까지만 봅니다. 단어 첫머리 일치만으로 결과가 차면 단어 중간/흩어진 일치는 보지 않습니다.
+    검색어를 공백으로 나누면 모든 조각이 맞아야 하며, 자음만 입력한 조각은 초성으로 찾습니다.
+    """
+
+    def __init__(self, rows=(), favorites=()):
+        self.build(rows, favorites)
+
+    def build(self, rows, favorites=()):
+        favorites = set(favorites)
+        rows = [row for row in rows if len(row) > 2 and row[2]]
+        count = len(rows)
+        recency = sorted(range(count), key=lambda k: rows[k][1] or "", reverse=True)
+        priors = [0.0] * count
+        for rank, k in enumerate(recency):
+            priors[k] = RECENCY_BONUS * (1 - rank / count) + (FAVORITE_BONUS if rows[k][2] in favorites else 0)
+        order = sorted(range(count), key=lambda k: -priors[k])
+
+        self._rows = [tuple(rows[k][:3]) for k in order]
+        self._priors = [priors[k] for k in order]
+        self._texts = ([to_jamo(row[0]) for row in self._rows], [to_choseong(row[0]) for row in self._rows])
+        self._word_index = tuple(self._build_word_index(texts) for texts in self._texts)
+        self._exact_index = tuple(self._build_exact_index(texts) for texts in self._texts)
+        self._bonus_cache = ({}, {}) # (자모열용, 초성열용) id -> 경계 보너스 (점수를 매길 때 만듦)
+        self._gram_masks = {} # (초성 여부, n-gram) -> 그 n-gram을 가진 제목 id 비트마스크
+
+    @staticmethod
+    def _build_exact_index(texts):
+        """제목 전체 -> 제목 id 목록"""
+        exact_ids = {}
+        for i, text in enumerate(texts):
+            exact_ids.setdefault(text, []).append(i)
+        return exact_ids
+
+    @staticmethod
+    def _build_word_index(texts):
+        """(정렬된 단어 목록, 단어 -> 그 단어가 든 제목 id 목록)"""
+        word_ids = {}
+        for i, text in enumerate(texts):
+            for word in _WORD_PATTERN.findall(text):
+                ids = word_ids.get(word)
+                if ids is None:
+                    word_ids[word] = [i]
+                elif ids[-1] != i:
+                    ids.append(i)
+        return sorted(word_ids), word_ids
+
+    def __len__(self):
+        return len(self._rows)
+
+    # ------------------------------------------------------------------
+    # 점수
+    # ------------------------------------------------------------------
+    def _bonuses(self, i, cho):
+        cache = self._bonus_cache[cho]
+        bonuses = cache.get(i)
+        if bonuses is None:
+            bonuses = cache[i] = _char_bonuses(self._rows[i][0], cho)
+        return bonuses
+
+    def _score(self, i, terms):
+        """모든 조각이 맞으면 점수 합, 하나라도 안 맞으면 None"""
+        total = 0
+        for pattern, cho in terms:
+            text = self._texts[cho][i]
+            pos = text.find(pattern)
+            if pos >= 0:
+                total += _score_substring(self._bonuses(i, cho), pos, len(pattern))
+                if pos == 0 and len(pattern) == len(text):
+                    total += BONUS_EXACT
+                continue
+            positions = _fuzzy_positions(text, pattern)
+            if positions is None:
+                return None
+            total += _score_positions(self._bonuses(i, cho), positions)
+        return total
+
+    # ------------------------------------------------------------------
+    # 후보
+    # ------------------------------------------------------------------
+    def _gram_mask(self, gram, cho):
+        key = (cho, gram)
+        mask = self._gram_masks.get(key)
+        if mask is None:
+            flags = bytes([gram in text for text in self._texts[cho]])
+            mask = int(flags[::-1].translate(_BIT_DIGITS), 2) if flags else 0
+            if len(self._gram_masks) >= GRAM_CACHE_SIZE:
+                self._gram_masks.clear()
+            self._gram_masks[key] = mask
+        return mask
+
+    def _terms_mask(self, terms, n):
+        """모든 조각의 n-gram을 가진 제목 (조각이 n보다 짧으면 그 조각 전체).
+
+        후보를 거르는 용도이므로 조각마다 처음과 끝 쪽 n-gram 몇 개만 씁니다. 한 글자씩 입력할 때
+        앞서 만든 비트마스크를 다시 쓰게 되고, 빠진 n-gram은 점수를 매길 때 어차피 확인됩니다.
+        """
+        mask = -1
+        for pattern, cho in terms:
+            size = min(n, len(pattern))
+            grams = [pattern[k:k + size] for k in range(len(pattern) - size + 1)]
+            for gram in set(grams[:1] + grams[-2:]):
+                mask &= self._gram_mask(gram, cho)
+                if not mask:
+                    return 0
+        return mask
+
+    def _word_prefix_ids(self, pattern, cho):
+        """pattern으로 시작하는 단어가 있는 제목 id 집합"""
+        words, word_ids = self._word_index[cho]
+        start = bisect.bisect_left(words, pattern)
+        end = bisect.bisect_left(words, pattern + "\uffff", start)
+        ids = set()
+        for word in words[start:end]:
+            ids.update(word_ids[word])
+        return ids
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """(제목, 날짜, doc_id) 목록을 점수 높은 순으로 최대 limit개. 빈 검색어는 우선순위 순."""
+        terms = []
+        for term in query.split():
+            pattern = to_jamo(term)
+            terms.append((pattern, all(ch in _CONSONANTS for ch in pattern)))
+        if not terms:
+            return self._rows[:limit]
+        # 가장 긴(보통 가장 드문) 조각을 먼저 확인
+        terms.sort(key=lambda term: -len(term[0]))
+
+        scores = {}
+        best = [] # 지금까지 가장 높은 (점수 + 우선순위) limit개의 최소 힙
+        bound = sum(_max_term_score(len(pattern)) for pattern, _ in terms)
+
+        def score_ids(ids):
+            # ids는 우선순위 순서. 점수 상한으로도 limit번째 결과를 넘을 수 없는 후보부터는 보지 않음
+            for i in ids:
+                if i in scores:
+                    continue
+                if len(best) >= limit and bound + self._priors[i] < best[0]:
+                    break
+                score = self._score(i, terms)
+                if score is None:
+                    continue
+                scores[i] = score
+                if len(best) < limit:
+                    heapq.heappush(best, score + self._priors[i])
+                else:
+                    heapq.heappushpop(best, score + self._priors[i])
+
+        # 0) 제목 전체가 검색어와 같은 제목 (BONUS_EXACT는 상한에 넣지 않으므로 먼저 확인)
+        for pattern, cho in terms:
+            score_ids(self._exact_index[cho].get(pattern, ()))
+        # 1) 모든 조각이 단어 첫머리와 맞는 제목, 부족하면 첫 조각만 단어 첫머리와 맞는 제목
+        first_ids = self._word_prefix_ids(*terms[0])
+        candidate_sets = [first_ids]
+        if len(terms) > 1:
+            all_ids = first_ids.intersection(*(self._word_prefix_ids(pattern, cho) for pattern, cho in terms[1:]))
+            candidate_sets.insert(0, all_ids)
+        for ids in candidate_sets:
+            score_ids(sorted(ids.difference(scores)))
+            if len(scores) >= limit:
+                break
+        if len(scores) < limit:
+            # 2) 모든 조각을 연속으로 포함할 수 있는 제목 (2-gram을 모두 가짐)
+            exact_mask = self._terms_mask(terms, 2)
+            score_ids(_iter_mask_ids(exact_mask))
+            if len(scores) < limit:
+                # 3) 글자가 흩어져 있는 제목
+                loose_mask = self._terms_mask(terms, 1) & ~exact_mask
+                score_ids(_mask_ids(loose_mask, MAX_CANDIDATES, scores))
+
+        top = heapq.nlargest(limit, scores, key=lambda i: (scores[i] + self._priors[i], -i))
+        return [self._rows[i] for i in top]
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+
+from core import config_manager
+
+# 본문의 위키 링크 ([[문서 제목]])
+LINK_PATTERN = re.compile(r'\[\[(.*?)\]\]')
+
+
+def parse_links(text):
+    """본문에 나오는 위키 링크 제목 목록 (처음 나온 순서, 중복 제거)"""
+    return [title for title in dict.fromkeys(LINK_PATTERN.findall(text or "")) if title]
+
+
+class LinkIndex:
+    """문서 간 위키 링크 색인 (정방향 + 역링크).
+
+    문서마다 본문 해시와 링크한 제목 목록을 디스크(LINK_INDEX_FILE)에 보관하고, 제목 -> 링크한 문서 집합(역링크)은
+    불러올 때 메모리에서 만듭니다. 링크 대상은 제목으로 저장하므로 대상 문서의 이름이 바뀌거나 새로 생겨도
+    다시 파싱할 필요 없이 조회할 때 제목 -> doc_id로 찾습니다.
+    본문이 바뀐 문서만 다시 파싱하며, .txt 캐시가 지워져도(정리/무효화) 마지막으로 알던 링크는 남겨 두고
+    stale로 표시해 다음에 본문을 읽을 때 확인합니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or config_manager.LINK_INDEX_FILE
+        self._lock = threading.Lock()
+        self._docs = {} # doc_id -> {'hash', 'links': [제목, ...], 'stale'}
+        self._backlinks = {} # 제목 -> {링크한 doc_id, ...}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"링크 인덱스 로드 실패: {e}")
+            return
+        if not isinstance(data, dict):
+            return
+        for doc_id, entry in data.items():
+            if isinstance(entry, dict) and isinstance(entry.get('links'), list):
+                self._add_locked(doc_id, entry)
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._docs, ensure_ascii=False)
+            self._dirty = False
+        directory = os.path.dirname(self.path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".link_index.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"링크 인덱스 저장 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+    def _add_locked(self, doc_id, entry):
+        self._docs[doc_id] = entry
+        for title in entry['links']:
+            self._backlinks.setdefault(title, set()).add(doc_id)
+
+    def _remove_locked(self, doc_id):
+        entry = self._docs.pop(doc_id, None)
+        if entry is None:
+            return False
+        for title in entry['links']:
+            sources = self._backlinks.get(title)
+            if sources is None:
+                continue
+            sources.discard(doc_id)
+            if not sources:
+                del self._backlinks[title]
+        return True
+
+    def has(self, doc_id):
+        return doc_id in self._docs
+
+    def needs_update(self, doc_id):
+        """한 번도 색인하지 않았거나, 마지막 색인 이후 본문 캐시가 지워진 문서"""
+        entry = self._docs.get(doc_id)
+        return entry is None or entry.get('stale', False)
+
+    def update(self, doc_id, text):
+        """본문이 바뀐 경우에만 링크를 다시 파싱. 링크 목록이 바뀌었으면 True."""
+        content_hash = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        with self._lock:
+            entry = self._docs.get(doc_id)
+            if entry and entry['hash'] == content_hash:
+                if entry.get('stale'):
+                    entry['stale'] = False
+                    self._dirty = True
+                return False
+        links = parse_links(text)
+        with self._lock:
+            entry = self._docs.get(doc_id)
+            changed = entry is None or entry['links'] != links
+            self._remove_locked(doc_id)
+            self._add_locked(doc_id, {'hash': content_hash, 'links': links, 'stale': False})
+            self._dirty = True
+        return changed
+
+    def mark_stale(self, doc_id):
+        with self._lock:
+            entry = self._docs.get(doc_id)
+            if entry and not entry.get('stale'):
+                entry['stale'] = True
+                self._dirty = True
+
+    def remove(self, doc_id):
+        with self._lock:
+            if self._remove_locked(doc_id):
+                self._dirty = True
+
+    def prune(self, valid_ids):
+        with self._lock:
+            for doc_id in [doc_id for doc_id in self._docs if doc_id not in valid_ids]:
+                self._remove_locked(doc_id)
+                self._dirty = True
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def links_of(self, doc_id):
+        """문서가 링크한 제목 목록"""
+        entry = self._docs.get(doc_id)
+        return list(entry['links']) if entry else []
+
+    def targets(self, doc_id, resolve_id):
+        """문서가 링크한 문서 doc_id 목록 (resolve_id: 제목 -> doc_id 또는 None)"""
+        targets = []
+        for title in self.links_of(doc_id):
+            target_id = resolve_id(title)
+            if target_id and target_id != doc_id and target_id not in targets:
+                targets.append(target_id)
+        return targets
+
+    def backlinks(self, title, doc_id=None):
+        """이 제목을 링크한 문서 doc_id 집합 (doc_id를 주면 자기 자신은 뺌)"""
+        with self._lock:
+            sources = set(self._backlinks.get(title, ()))
+        sources.discard(doc_id)
+        return sources
+
+    def edges(self, resolve_id, valid_ids=None):
+        """(출발 doc_id, 대상 doc_id) 목록. valid_ids를 주면 양쪽이 모두 그 안에 있는 링크만."""
+        with self._lock:
+            adjacency = [(doc_id, entry['links']) for doc_id, entry in self._docs.items()]
+        resolved = {}
+        edges = []
+        for source_id, titles in adjacency:
+            if valid_ids is not None and source_id not in valid_ids:
+                continue
+            seen = set()
+            for title in titles:
+                if title not in resolved:
+                    resolved[title] = resolve_id(title)
+                target_id = resolved[title]
+                if not target_id or target_id == source_id or target_id in seen:
+                    continue
+                if valid_ids is not None and target_id not in valid_ids:
+                    continue
+                seen.add(target_id)
+                edges.append((source_id, target_id))
+        return edges
@@ -0,0 +1,186 @@
+import threading
+
+
+def parse_tags(tags_text):
+    # "#태그1, #태그2" 형식에서 '#'을 뗀 태그 목록을 돌려줌 (순서 유지, 중복 제거)
+    tags = []
+    for token in (tags_text or "").replace(',', ' ').split():
+        token = token.strip()
+        if token.startswith('#'):
+            tag = token.lstrip('#')
+            if tag and tag not in tags:
+                tags.append(tag)
+    return tags
+
+
+class MemoIndex:
+    """local_cache 행 목록과 그 위의 조회용 인덱스를 함께 관리.
+
+    rows는 UI가 쓰는 [title, date, doc_id, tags] 리스트이고, 그 위에
+    doc_id -> 행, 제목 -> doc_id 목록, 태그 -> doc_id 집합 인덱스를 유지합니다.
+    태그 문자열은 행이 바뀔 때 한 번만 파싱하며, 태그별 문서 수는 집합 크기로 바로 얻습니다.
+    모든 변경은 이 클래스의 메서드를 거쳐야 인덱스가 어긋나지 않습니다.
+    lock은 AppController.cache_lock을 함께 사용합니다 (재진입 가능해야 함).
+    """
+
+    def __init__(self, lock=None):
+        self.lock = lock or threading.RLock()
+        self.rows = []
+        self._by_id = {}
+        self._title_to_ids = {}
+        self._tag_to_ids = {}
+        self._row_tags = {} # doc_id -> 마지막으로 색인한 태그 목록
+        self._order = {} # doc_id -> 목록 내 순서 키 (작을수록 위)
+        self._min_order = 0
+        self._max_order = -1
+        self.version = 0 # 행 내용이 바뀔 때마다 증가 (파생 색인의 재구성 여부 판단용)
+
+    # --- 내부 색인 ---
+
+    def _index_row(self, row):
+        doc_id = row[2]
+        self._by_id[doc_id] = row
+        self._title_to_ids.setdefault(row[0], []).append(doc_id)
+        tags = parse_tags(row[3] if len(row) > 3 else "")
+        self._row_tags[doc_id] = tags
+        for tag in tags:
+            self._tag_to_ids.setdefault(tag, set()).add(doc_id)
+
+    def _unindex_row(self, row):
+        doc_id = row[2]
+        self._by_id.pop(doc_id, None)
+        ids = self._title_to_ids.get(row[0])
+        if ids and doc_id in ids:
+            ids.remove(doc_id)
+            if not ids:
+                del self._title_to_ids[row[0]]
+        for tag in self._row_tags.pop(doc_id, []):
+            ids = self._tag_to_ids.get(tag)
+            if ids is not None:
+                ids.discard(doc_id)
+                if not ids:
+                    del self._tag_to_ids[tag]
+
+    # --- 변경 ---
+
+    def reset(self, rows):
+        with self.lock:
+            self.rows = rows if rows is not None else []
+            self._by_id = {}
+            self._title_to_ids = {}
+            self._tag_to_ids = {}
+            self._row_tags = {}
+            self._order = {}
+            for position, row in enumerate(self.rows):
+                if len(row) > 2 and row[2] and row[2] not in self._by_id:
+                    self._index_row(row)
+                    self._order[row[2]] = position
+            self._min_order = 0
+            self._max_order = len(self.rows) - 1
+            self.version += 1
+
+    def insert(self, row, at_top=True):
+        """새 행 추가. 같은 doc_id가 이미 있으면 추가하지 않고 False를 돌려줌."""
+        with self.lock:
+            if len(row) < 3 or not row[2] or row[2] in self._by_id:
+                return False
+            while len(row) < 4:
+                row.append("")
+            if at_top:
+                self.rows.insert(0, row)
+                self._min_order -= 1
+                self._order[row[2]] = self._min_order
+            else:
+                self.rows.append(row)
+                self._max_order += 1
+                self._order[row[2]] = self._max_order
+            self._index_row(row)
+            self.version += 1
+            return True
+
+    def update(self, doc_id, title=None, date=None, tags=None):
+        """기존 행을 그 자리에서 갱신하고 행을 돌려줌. 없으면 None.
+
+        값이 실제로 바뀐 경우에만 다시 색인하고 version을 올립니다 (같은 내용의 자동 저장은 파생 색인을 건드리지 않음).
+        """
+        with self.lock:
+            row = self._by_id.get(doc_id)
+            if row is None:
+                return None
+            while len(row) < 4:
+                row.append("")
+            if (title is None or title == row[0]) and (date is None or date == row[1]) and (tags is None or tags == row[3]):
+                return row
+            self._unindex_row(row)
+            if title is not None:
+                row[0] = title
+            if date is not None:
+                row[1] = date
+            if tags is not None:
+                row[3] = tags
+            self._index_row(row)
+            self.version += 1
+            return row
+
+    def remove(self, doc_id):
+        """행 삭제 후 삭제된 행을 돌려줌. 없으면 None."""
+        with self.lock:
+            row = self._by_id.get(doc_id)
+            if row is None:
+                return None
+            self._unindex_row(row)
+            self._order.pop(doc_id, None)
+            self.rows = [r for r in self.rows if not (len(r) > 2 and r[2] == doc_id)]
+            self.version += 1
+            return row
+
+    # --- 조회 ---
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._by_id
+
+    def get(self, doc_id):
+        return self._by_id.get(doc_id)
+
+    def all_ids(self):
+        with self.lock:
+            return list(self._by_id)
+
+    def get_title(self, doc_id, default=None):
+        row = self._by_id.get(doc_id)
+        return row[0] if row else default
+
+    def get_tags(self, doc_id, default=None):
+        row = self._by_id.get(doc_id)
+        if row is None:
+            return default
+        return row[3] if len(row) > 3 else ""
+
+    def id_for_title(self, title):
+        # 같은 제목이 여러 개면 목록에서 가장 먼저 색인된 문서
+        ids = self._title_to_ids.get(title)
+        return ids[0] if ids else None
+
+    def ids_for_tag(self, tag):
+        with self.lock:
+            return set(self._tag_to_ids.get(tag.lstrip('#'), ()))
+
+    def rows_for_tag(self, tag):
+        # 태그가 붙은 행만 목록 순서대로 돌려줌 (전체 목록을 훑지 않음)
+        with self.lock:
+            ids = self._tag_to_ids.get(tag.lstrip('#'), ())
+            return [self._by_id[doc_id] for doc_id in sorted(ids, key=self._order.get)]
+
+    def tag_counts(self):
+        with self.lock:
+            return {tag: len(ids) for tag, ids in self._tag_to_ids.items()}
+
+    def all_tags(self):
+        with self.lock:
+            return set(self._tag_to_ids)
+
+    def tags_of(self, doc_id):
+        return list(self._row_tags.get(doc_id, []))
@@ -0,0 +1,175 @@
+import json
+import os
+import sqlite3
+import threading
+
+from core import config_manager
+
+
+def _parse_tags(tags_text):
+    return {t.strip().lstrip('#') for t in (tags_text or "").replace(',', ' ').split() if t.strip().startswith('#')}
+
+
+class MemoStore:
+    """메모 메타데이터(제목, 날짜, 문서 ID, 태그)를 보관하는 SQLite 저장소.
+
+    행은 기존 캐시와 같은 [title, date, doc_id, tags] 리스트 형식으로 주고받습니다.
+    position 열이 목록 순서를 유지하며, 값이 작을수록 위에 표시됩니다.
+    모든 변경은 단일 트랜잭션으로 해당 행만 기록합니다.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or config_manager.MEMO_DB_FILE
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS memos (
+                    doc_id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL DEFAULT '',
+                    date TEXT NOT NULL DEFAULT '',
+                    tags TEXT NOT NULL DEFAULT '',
+                    position INTEGER NOT NULL
+                )""")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS memo_tags (
+                    doc_id TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (doc_id, tag)
+                )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_memos_title ON memos(title)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_memos_position ON memos(position)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_memo_tags_tag ON memo_tags(tag)")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --- 조회 ---
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM memos").fetchone()[0]
+
+    def load_rows(self, limit=None, offset=0):
+        # 목록 순서대로 행을 돌려줌. limit를 주면 첫 화면에 필요한 만큼만 읽음
+        query = "SELECT title, date, doc_id, tags FROM memos ORDER BY position"
+        params = ()
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params = (limit, offset)
+        with self._lock:
+            return [list(row) for row in self._conn.execute(query, params)]
+
+    def get(self, doc_id):
+        with self._lock:
+            row = self._conn.execute("SELECT title, date, doc_id, tags FROM memos WHERE doc_id = ?", (doc_id,)).fetchone()
+        return list(row) if row else None
+
+    def find_by_title(self, title):
+        with self._lock:
+            return [list(row) for row in self._conn.execute(
+                "SELECT title, date, doc_id, tags FROM memos WHERE title = ? ORDER BY position", (title,))]
+
+    def find_by_tag(self, tag):
+        tag = tag.strip().lstrip('#')
+        with self._lock:
+            return [list(row) for row in self._conn.execute(
+                "SELECT m.title, m.date, m.doc_id, m.tags FROM memos m JOIN memo_tags t ON t.doc_id = m.doc_id "
+                "WHERE t.tag = ? ORDER BY m.position", (tag,))]
+
+    # --- 변경 ---
+
+    def _write_row(self, row, position):
+        title = row[0] if len(row) > 0 else ""
+        date = row[1] if len(row) > 1 else ""
+        doc_id = row[2]
+        tags = row[3] if len(row) > 3 else ""
+        self._conn.execute(
+            "INSERT INTO memos (doc_id, title, date, tags, position) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(doc_id) DO UPDATE SET title = excluded.title, date = excluded.date, "
+            "tags = excluded.tags, position = excluded.position",
+            (doc_id, title or "", date or "", tags or "", position))
+        self._conn.execute("DELETE FROM memo_tags WHERE doc_id = ?", (doc_id,))
+        self._conn.executemany("INSERT INTO memo_tags (doc_id, tag) VALUES (?, ?)",
+                               [(doc_id, tag) for tag in _parse_tags(tags)])
+
+    def upsert(self, row, at_top=False):
+        """행 하나를 추가하거나 갱신. 새 행은 at_top이면 맨 위, 아니면 맨 아래에 둠."""
+        if len(row) < 3 or not row[2]:
+            return False
+        try:
+            with self._lock, self._conn:
+                existing = self._conn.execute("SELECT position FROM memos WHERE doc_id = ?", (row[2],)).fetchone()
+                if existing:
+                    position = existing[0]
+                else:
+                    bound = self._conn.execute(
+                        "SELECT MIN(position) - 1 FROM memos" if at_top else "SELECT MAX(position) + 1 FROM memos").fetchone()[0]
+                    position = bound if bound is not None else 0
+                self._write_row(row, position)
+            return True
+        except sqlite3.Error as e:
+            print(f"메모 저장소 쓰기 오류: {e}")
+            return False
+
+    def delete(self, doc_id):
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM memos WHERE doc_id = ?", (doc_id,))
+                self._conn.execute("DELETE FROM memo_tags WHERE doc_id = ?", (doc_id,))
+            return True
+        except sqlite3.Error as e:
+            print(f"메모 저장소 삭제 오류: {e}")
+            return False
+
+    def replace_all(self, rows):
+        """동기화 결과로 전체 목록을 맞춤. 바뀐 행만 기록하고 사라진 행은 삭제."""
+        try:
+            with self._lock, self._conn:
+                current = {r[2]: (list(r[:2]) + [r[2], r[3]], r[4]) for r in self._conn.execute(
+                    "SELECT title, date, doc_id, tags, position FROM memos")}
+                seen = set()
+                for position, row in enumerate(rows):
+                    if len(row) < 3 or not row[2] or row[2] in seen:
+                        continue
+                    seen.add(row[2])
+                    normalized = [row[0] if len(row) > 0 else "", row[1] if len(row) > 1 else "", row[2],
+                                  row[3] if len(row) > 3 else ""]
+                    old = current.get(row[2])
+                    if old and old[0] == normalized and old[1] == position:
+                        continue
+                    self._write_row(normalized, position)
+                removed = [(doc_id,) for doc_id in current if doc_id not in seen]
+                if removed:
+                    self._conn.executemany("DELETE FROM memos WHERE doc_id = ?", removed)
+                    self._conn.executemany("DELETE FROM memo_tags WHERE doc_id = ?", removed)
+            return True
+        except sqlite3.Error as e:
+            print(f"메모 저장소 동기화 오류: {e}")
+            return False
+
+    def migrate_from_json(self, json_path=None):
+        """이전 cache.json 목록을 DB로 옮김. DB가 비어 있을 때만 수행."""
+        json_path = json_path or config_manager.CACHE_FILE
+        if not os.path.exists(json_path) or self.count() > 0:
+            return False
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                rows = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"이전 캐시 파일 읽기 실패: {e}")
+            return False
+        if not self.replace_all(rows):
+            return False
+        try:
+            os.replace(json_path, json_path + ".migrated")
+        except OSError as e:
+            print(f"이전 캐시 파일 정리 실패: {e}")
+        print(f"cache.json에서 메모 {len(rows)}개를 DB로 이전했습니다.")
+        return True
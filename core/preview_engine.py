@@ -0,0 +1,193 @@
+import json
+import re
+import time
+from collections import OrderedDict
+
+import markdown
+
+from core import html_renderer
+
+MARKDOWN_EXTENSIONS = ['fenced_code', 'codehilite', 'tables', 'nl2br']
+
+# 미리보기 갱신 간격 (ms). 한 프레임(약 16ms)보다 자주 그리지 않고,
+# 직전 갱신이 오래 걸렸으면 그만큼 간격을 늘림.
+FRAME_BUDGET_MS = 16
+MAX_INTERVAL_MS = 500
+
+# 목록 항목 (- 항목, * 항목, + 항목, 1. 항목, 1) 항목)
+_LIST_ITEM_PATTERN = re.compile(r'^ {0,3}(?:[-*+]|\d+[.)])\s')
+# 참조 링크 정의 ([id]: url "제목")
+_REFERENCE_PATTERN = re.compile(r'^ {0,3}\[[^\[\]]+\]:\s*\S')
+
+# 미리보기 페이지에 한 번만 넣어 두는 패치 함수.
+# order: 화면에 보일 블록 ID 순서, blocks: 새로 그릴 블록 ID -> HTML, tagsHtml: 태그 영역 (바뀌지 않았으면 null)
+_PATCH_SCRIPT = """
+<script>
+function applyPreviewPatch(order, blocks, tagsHtml) {
+    if (tagsHtml !== null) { document.getElementById('preview-tags').innerHTML = tagsHtml; }
+    var root = document.getElementById('preview-root');
+    var existing = {};
+    for (var i = 0; i < root.children.length; i++) { existing[root.children[i].id] = root.children[i]; }
+    var ref = root.firstElementChild;
+    for (var j = 0; j < order.length; j++) {
+        var id = order[j];
+        var el = existing[id];
+        if (el) { delete existing[id]; }
+        else { el = document.createElement('div'); el.id = id; el.className = 'preview-block'; el.innerHTML = blocks[id]; }
+        if (el === ref) { ref = ref.nextElementSibling; } else { root.insertBefore(el, ref); }
+    }
+    for (var key in existing) { root.removeChild(existing[key]); }
+}
+</script>
+"""
+
+
+def split_blocks(markdown_text):
+    """문서를 최상위 블록(빈 줄로 구분)으로 나눔.
+
+    코드 펜스 안의 빈 줄과, 빈 줄 다음에 들여쓴 줄(목록 항목의 이어지는 문단 등)은 블록을 나누지 않습니다.
+    목록으로 시작한 블록은 빈 줄 다음에 오는 항목도 같은 블록에 둡니다 (느슨한 목록이 번호가 새로 매겨진
+    여러 목록으로 나뉘지 않도록).
+    """
+    blocks = []
+    current = []
+    pending_blank = 0
+    fence = None
+    in_list = False
+    for line in markdown_text.split('\n'):
+        stripped = line.strip()
+        if fence is not None:
+            current.append(line)
+            if stripped.startswith(fence):
+                fence = None
+            continue
+        if not stripped:
+            if current:
+                pending_blank += 1
+            continue
+        if pending_blank:
+            if line[:1] in (' ', '\t') or (in_list and _LIST_ITEM_PATTERN.match(line)):
+                current.extend([''] * pending_blank)
+            else:
+                blocks.append('\n'.join(current))
+                current = []
+            pending_blank = 0
+        if not current:
+            in_list = bool(_LIST_ITEM_PATTERN.match(line))
+        if stripped.startswith(('```', '~~~')):
+            fence = stripped[:3]
+        current.append(line)
+    if current:
+        blocks.append('\n'.join(current))
+    return blocks
+
+
+def reference_definitions(markdown_text):
+    """코드 펜스 밖의 참조 링크 정의 줄을 모은 문자열 (없으면 빈 문자열).
+
+    블록마다 따로 변환하면 다른 블록에 있는 정의를 찾지 못하므로, 이 줄들을 각 블록 뒤에 붙여 변환합니다.
+    """
+    definitions = []
+    fence = None
+    for line in markdown_text.split('\n'):
+        stripped = line.strip()
+        if fence is not None:
+            if stripped.startswith(fence):
+                fence = None
+            continue
+        if stripped.startswith(('```', '~~~')):
+            fence = stripped[:3]
+        elif _REFERENCE_PATTERN.match(line):
+            definitions.append(line.strip())
+    return '\n'.join(definitions)
+
+
+class PreviewEngine:
+    """편집기 미리보기를 블록 단위로 갱신하는 엔진 (Qt와 무관).
+
+    첫 렌더링(또는 CSS가 바뀐 경우)에는 전체 HTML을 만들고, 그 뒤로는 바뀐 블록만 다시 변환해
+    페이지의 DOM을 고치는 자바스크립트를 돌려줍니다. 블록 변환 결과는 블록 원문을 키로 기억해 둡니다.
+    참조 링크 정의가 바뀌면 모든 블록의 결과가 달라질 수 있으므로 전체를 다시 그립니다.
+    """
+
+    CACHE_SIZE = 4096
+
+    def __init__(self, resolve_title):
+        self.resolve_title = resolve_title
+        self._md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+        self._block_html = OrderedDict()
+        self.last_elapsed_ms = 0.0
+        self.reset()
+
+    def reset(self):
+        """페이지가 비워졌거나 다른 문서를 열 때 호출. 다음 update는 전체 렌더링."""
+        self._rendered = False
+        self._css = None
+        self._tags_html = None
+        self._definitions = ""
+        self._ids = {} # (블록 원문, 같은 원문 중 몇 번째인지) -> 블록 ID
+        self._next_id = 0
+        # 위키 링크 대상이 바뀌었을 수 있으므로 변환 결과도 새로 만듦
+        self._block_html.clear()
+
+    def next_interval_ms(self):
+        return int(min(MAX_INTERVAL_MS, max(FRAME_BUDGET_MS, self.last_elapsed_ms * 4)))
+
+    def _render_block(self, block, definitions):
+        key = (block, definitions)
+        html = self._block_html.get(key)
+        if html is not None:
+            self._block_html.move_to_end(key)
+            return html
+        source = f"{block}\n\n{definitions}" if definitions else block
+        html = html_renderer.postprocess_body(self._md.reset().convert(source), self.resolve_title)
+        self._block_html[key] = html
+        if len(self._block_html) > self.CACHE_SIZE:
+            self._block_html.popitem(last=False)
+        return html
+
+    def update(self, markdown_text, tags_text):
+        """('full', 전체 HTML) / ('patch', 자바스크립트) / (None, None: 바뀐 것 없음)"""
+        started = time.perf_counter()
+        css = html_renderer.get_css()
+        tags_html = html_renderer.build_tags_html(tags_text)
+        definitions = reference_definitions(markdown_text)
+        full = not self._rendered or css != self._css or definitions != self._definitions
+        if full:
+            self._ids = {}
+
+        order = []
+        new_blocks = {}
+        ids = {}
+        seen = {}
+        for block in split_blocks(markdown_text):
+            occurrence = seen.get(block, 0)
+            seen[block] = occurrence + 1
+            key = (block, occurrence)
+            block_id = self._ids.get(key)
+            if block_id is None:
+                block_id = f"b{self._next_id}"
+                self._next_id += 1
+                new_blocks[block_id] = self._render_block(block, definitions)
+            ids[key] = block_id
+            order.append(block_id)
+        # ids는 블록 순서대로 채워지므로 이전 ids의 값 순서가 곧 이전 화면의 블록 순서
+        unchanged = not new_blocks and order == list(self._ids.values()) and tags_html == self._tags_html
+        self._ids = ids
+
+        if full:
+            body = "".join(f'<div id="{block_id}" class="preview-block">{new_blocks[block_id]}</div>' for block_id in order)
+            result = ('full', html_renderer.wrap_page(
+                "미리보기", f'<div id="preview-tags">{tags_html}</div><div id="preview-root">{body}</div>', _PATCH_SCRIPT))
+        elif unchanged:
+            result = (None, None)
+        else:
+            tags_arg = json.dumps(tags_html) if tags_html != self._tags_html else "null"
+            result = ('patch', f"applyPreviewPatch({json.dumps(order)}, {json.dumps(new_blocks)}, {tags_arg});")
+
+        self._rendered = True
+        self._css = css
+        self._tags_html = tags_html
+        self._definitions = definitions
+        self.last_elapsed_ms = (time.perf_counter() - started) * 1000
+        return result
@@ -0,0 +1,89 @@
+import collections
+import threading
+import time
+
+
+class SaveQueue:
+    """문서별 쓰기 지연(write-behind) 저장 큐.
+
+    같은 문서에 대해서는 동시에 하나의 저장만 실행하고, 실행 중에 들어온 요청은
+    가장 마지막 것 하나만 남겨 두었다가 이어서 저장합니다 (이전 대기 요청은 버림).
+
+    save_func(job)은 작업자 스레드에서 호출되며 저장된 문서 ID(실패 시 None)를 반환해야 합니다.
+    아직 ID가 없는 새 메모는 임시 키로 넣고, 첫 저장이 끝나 ID가 생기면 대기 중인 요청과
+    이후 그 ID로 들어오는 요청이 같은 슬롯으로 이어지도록 연결합니다.
+    """
+
+    def __init__(self, save_func, on_stats_changed=None, history_size=20):
+        self._save_func = save_func
+        self._on_stats_changed = on_stats_changed
+        self._lock = threading.Lock()
+        self._slots = {} # key -> {'pending': job 또는 None, 'in_flight': bool}
+        self._aliases = {} # 새로 생성된 doc_id -> 처음 사용한 임시 키
+        self._latencies = collections.deque(maxlen=history_size)
+
+    def submit(self, key, job):
+        with self._lock:
+            key = self._aliases.get(key, key)
+            slot = self._slots.setdefault(key, {'pending': None, 'in_flight': False})
+            slot['pending'] = job # 대기 중이던 이전 요청은 새 요청으로 대체
+            start_worker = not slot['in_flight']
+            if start_worker:
+                slot['in_flight'] = True
+        if start_worker:
+            threading.Thread(target=self._worker, args=(key,), daemon=True).start()
+        self._notify()
+
+    def _worker(self, key):
+        while True:
+            with self._lock:
+                slot = self._slots[key]
+                job = slot['pending']
+                slot['pending'] = None
+                if job is None:
+                    del self._slots[key]
+                    for doc_id in [d for d, k in self._aliases.items() if k == key]:
+                        del self._aliases[doc_id]
+                    break
+            self._notify()
+
+            started = time.monotonic()
+            try:
+                doc_id = self._save_func(job)
+            except Exception as e:
+                print(f"저장 작업 중 오류 발생: {e}")
+                doc_id = None
+            with self._lock:
+                self._latencies.append(time.monotonic() - started)
+                if doc_id and doc_id != key:
+                    self._aliases[doc_id] = key
+                    # 새 메모가 생성되었으면 대기 중인 요청은 그 문서를 갱신하도록 연결
+                    pending = self._slots[key]['pending']
+                    if pending is not None and not pending.get('doc_id'):
+                        pending['doc_id'] = doc_id
+            self._notify()
+
+    def depth(self):
+        """실행 중이거나 대기 중인 저장 작업 수."""
+        with self._lock:
+            return sum(int(slot['in_flight']) + int(slot['pending'] is not None)
+                       for slot in self._slots.values())
+
+    def is_busy(self, key):
+        with self._lock:
+            key = self._aliases.get(key, key)
+            return key in self._slots
+
+    def last_latency(self):
+        with self._lock:
+            return self._latencies[-1] if self._latencies else None
+
+    def average_latency(self):
+        with self._lock:
+            if not self._latencies:
+                return None
+            return sum(self._latencies) / len(self._latencies)
+
+    def _notify(self):
+        if self._on_stats_changed:
+            self._on_stats_changed(self.depth(), self.last_latency())
@@ -0,0 +1,207 @@
+import bisect
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+
+from core import config_manager
+
+# 한글 음절 / 한글 자모 / 그 밖의 글자(영문, 숫자 등) 덩어리
+_TOKEN_PATTERN = re.compile(r'[가-힣]+|[ㄱ-ㆎ]+|[^\W_]+')
+_HANGUL_SYLLABLE = re.compile(r'[가-힣]')
+
+# BM25 매개변수
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text):
+    """검색용 토큰 목록.
+
+    한글은 띄어쓰기와 조사 때문에 단어 단위로는 잘 맞지 않으므로 음절 2-gram으로 나누고
+    (한 글자 덩어리는 그대로), 영문/숫자는 소문자 단어 그대로 씁니다.
+    """
+    tokens = []
+    for run in _TOKEN_PATTERN.findall(text.lower()):
+        if _HANGUL_SYLLABLE.match(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def _term_frequencies(text):
+    counts = {}
+    for token in tokenize(text):
+        counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+class SearchIndex:
+    """.txt 콘텐츠 캐시로 만든 본문 검색용 역색인 (BM25 순위).
+
+    문서별 용어 빈도만 디스크(SEARCH_INDEX_FILE)에 보관하고, 역색인은 불러올 때 메모리에서 만듭니다.
+    문서가 저장/로드/삭제될 때마다 해당 문서만 다시 색인합니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or config_manager.SEARCH_INDEX_FILE
+        self._lock = threading.Lock()
+        self._docs = {} # doc_id -> {'hash', 'sig', 'len', 'tf': {용어: 빈도}}
+        self._postings = {} # 용어 -> {doc_id: 빈도}
+        self._total_len = 0
+        self._sorted_terms = None # 접두어 검색용 정렬된 용어 목록 (용어가 바뀌면 다시 만듦)
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"검색 인덱스 로드 실패: {e}")
+            return
+        if not isinstance(data, dict):
+            return
+        for doc_id, entry in data.items():
+            self._add_locked(doc_id, entry)
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._docs, ensure_ascii=False)
+            self._dirty = False
+        directory = os.path.dirname(self.path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".search_index.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"검색 인덱스 저장 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+    def _add_locked(self, doc_id, entry):
+        self._docs[doc_id] = entry
+        self._total_len += entry['len']
+        for term, count in entry['tf'].items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._sorted_terms = None
+            postings[doc_id] = count
+
+    def _remove_locked(self, doc_id):
+        entry = self._docs.pop(doc_id, None)
+        if entry is None:
+            return False
+        self._total_len -= entry['len']
+        for term in entry['tf']:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+        return True
+
+    def has(self, doc_id):
+        return doc_id in self._docs
+
+    def is_fresh(self, doc_id, signature):
+        entry = self._docs.get(doc_id)
+        return entry is not None and signature is not None and entry.get('sig') == signature
+
+    def update(self, doc_id, text, signature=None):
+        """본문이 바뀐 경우에만 다시 색인. 색인했으면 True."""
+        content_hash = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        with self._lock:
+            entry = self._docs.get(doc_id)
+            if entry and entry['hash'] == content_hash:
+                if entry.get('sig') != signature:
+                    entry['sig'] = signature
+                    self._dirty = True
+                return False
+        tf = _term_frequencies(text)
+        new_entry = {'hash': content_hash, 'sig': signature, 'len': sum(tf.values()), 'tf': tf}
+        with self._lock:
+            self._remove_locked(doc_id)
+            self._add_locked(doc_id, new_entry)
+            self._dirty = True
+        return True
+
+    def remove(self, doc_id):
+        with self._lock:
+            if self._remove_locked(doc_id):
+                self._dirty = True
+
+    def prune(self, valid_ids):
+        with self._lock:
+            for doc_id in [doc_id for doc_id in self._docs if doc_id not in valid_ids]:
+                self._remove_locked(doc_id)
+                self._dirty = True
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def _expand_prefix_locked(self, term):
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        start = bisect.bisect_left(self._sorted_terms, term)
+        expanded = []
+        for candidate in self._sorted_terms[start:]:
+            if not candidate.startswith(term):
+                break
+            expanded.append(candidate)
+        return expanded
+
+    def search(self, query, limit=None):
+        """(doc_id, 점수) 목록을 점수 높은 순으로. 검색어의 모든 토큰을 포함한 문서만."""
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        if not query_terms:
+            return []
+        with self._lock:
+            doc_count = len(self._docs)
+            if not doc_count:
+                return []
+            avg_len = self._total_len / doc_count
+            scores = None
+            for term in query_terms:
+                if _HANGUL_SYLLABLE.match(term) and len(term) > 1:
+                    variants = [term] if term in self._postings else []
+                else:
+                    # 영문 단어와 한 글자 한글 검색어는 그 글자로 시작하는 용어까지 포함
+                    variants = self._expand_prefix_locked(term)
+                term_scores = {}
+                for variant in variants:
+                    postings = self._postings[variant]
+                    idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for doc_id, tf in postings.items():
+                        doc_len = self._docs[doc_id]['len']
+                        score = idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * doc_len / avg_len))
+                        term_scores[doc_id] = max(term_scores.get(doc_id, 0.0), score)
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {doc_id: score + term_scores[doc_id] for doc_id, score in scores.items() if doc_id in term_scores}
+                if not scores:
+                    return []
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit else ranked
@@ -0,0 +1,251 @@
+import hashlib
+import re
+
+# MOC 본문의 회차 링크 ([[회차 제목]])
+LINK_PATTERN = re.compile(r'\[\[(.*?)\]\]')
+# series_cache.json에서 MOC별 파싱 상태를 담는 키 (회차 doc_id와 겹치지 않음)
+MOC_STATE_KEY = '_mocs'
+
+
+def is_moc_row(row):
+    """목록에서 MOC(회차를 묶는 문서)로 보여 줄 행인지 (#moc 태그)"""
+    return len(row) > 3 and bool(row[3]) and '#moc' in row[3].lower()
+
+
+class SeriesIndex:
+    """시리즈(MOC -> 회차) 관계 색인.
+
+    회차 doc_id -> {'parent_moc_id', 'parent_moc_title', 'prev_chapter_id', 'next_chapter_id'} 정보와 함께
+    MOC doc_id -> 순서대로 정렬된 회차 목록을 유지합니다. series_cache.json에는 회차 정보만 저장하고
+    (to_dict), MOC별 목록은 불러올 때 prev/next 연결을 따라 다시 만듭니다.
+    MOC마다 마지막으로 파싱한 본문 해시와 링크 제목 목록도 함께 저장해, 본문이 바뀐 MOC만 다시 파싱하고
+    제목이 바뀐 문서는 저장된 링크만 다시 매핑합니다 (update_moc, relink_titles).
+    읽기는 dict처럼 (in, get, items, len) 할 수 있지만, 변경은 반드시 메서드를 거쳐야 순서와 연결이 맞습니다.
+    """
+
+    def __init__(self, data=None):
+        self._chapters = {} # 회차 doc_id -> 정보
+        self._children = {} # MOC doc_id -> [회차 doc_id, ...]
+        self._lower_ids = None # 소문자 doc_id -> doc_id (대소문자 무시 조회용, 처음 쓸 때 만듦)
+        self._mocs = {} # MOC doc_id -> {'title', 'hash', 'links': [회차 제목, ...]}
+        if data:
+            self._load(data)
+
+    def _load(self, data):
+        mocs = data.get(MOC_STATE_KEY)
+        if isinstance(mocs, dict):
+            self._mocs = {moc_id: dict(state) for moc_id, state in mocs.items() if isinstance(state, dict)}
+        groups = {}
+        for chapter_id, info in data.items():
+            if isinstance(info, dict) and info.get('parent_moc_id'):
+                groups.setdefault(info['parent_moc_id'], []).append(chapter_id)
+                self._chapters[chapter_id] = dict(info)
+        for moc_id, chapter_ids in groups.items():
+            members = set(chapter_ids)
+            ordered = []
+            seen = set()
+            # 이전 회차가 없는(또는 같은 MOC 밖인) 회차에서 시작해 다음 회차를 따라감
+            for start in chapter_ids:
+                if self._chapters[start].get('prev_chapter_id') in members:
+                    continue
+                current = start
+                while current in members and current not in seen:
+                    seen.add(current)
+                    ordered.append(current)
+                    current = self._chapters[current].get('next_chapter_id')
+            # 연결이 끊기거나 순환하는 항목은 원래 순서대로 뒤에 붙임
+            ordered.extend(chapter_id for chapter_id in chapter_ids if chapter_id not in seen)
+            self._children[moc_id] = ordered
+
+    # ------------------------------------------------------------------
+    # 조회 (dict 호환)
+    # ------------------------------------------------------------------
+    def __contains__(self, doc_id):
+        return doc_id in self._chapters
+
+    def __len__(self):
+        return len(self._chapters)
+
+    def __iter__(self):
+        return iter(self._chapters)
+
+    def get(self, doc_id, default=None):
+        return self._chapters.get(doc_id, default)
+
+    def keys(self):
+        return self._chapters.keys()
+
+    def items(self):
+        return self._chapters.items()
+
+    def find(self, doc_id):
+        """get과 같지만, 없으면 대소문자를 무시하고 다시 찾음"""
+        info = self._chapters.get(doc_id)
+        if info is None and doc_id:
+            if self._lower_ids is None:
+                self._lower_ids = {chapter_id.lower(): chapter_id for chapter_id in self._chapters}
+            chapter_id = self._lower_ids.get(doc_id.lower())
+            if chapter_id is not None:
+                info = self._chapters.get(chapter_id)
+        return info
+
+    def parent_of(self, doc_id):
+        info = self._chapters.get(doc_id)
+        return info.get('parent_moc_id') if info else None
+
+    def children(self, moc_id):
+        """MOC의 회차 doc_id 목록 (MOC에 적힌 순서)"""
+        return tuple(self._children.get(moc_id, ()))
+
+    def moc_ids(self):
+        return list(self._children)
+
+    def moc_hash(self, moc_id):
+        state = self._mocs.get(moc_id)
+        return state.get('hash') if state else None
+
+    def to_dict(self):
+        data = {chapter_id: dict(info) for chapter_id, info in self._chapters.items()}
+        data[MOC_STATE_KEY] = {moc_id: dict(state) for moc_id, state in self._mocs.items()}
+        return data
+
+    # ------------------------------------------------------------------
+    # 변경
+    # ------------------------------------------------------------------
+    def _relink(self, moc_id, moc_title=None):
+        chapter_ids = self._children.get(moc_id)
+        if not chapter_ids:
+            self._children.pop(moc_id, None)
+            return
+        for i, chapter_id in enumerate(chapter_ids):
+            info = self._chapters.setdefault(chapter_id, {})
+            info['parent_moc_id'] = moc_id
+            if moc_title is not None or 'parent_moc_title' not in info:
+                info['parent_moc_title'] = moc_title
+            info['prev_chapter_id'] = chapter_ids[i - 1] if i > 0 else None
+            info['next_chapter_id'] = chapter_ids[i + 1] if i < len(chapter_ids) - 1 else None
+
+    def _detach(self, chapter_id):
+        """회차를 현재 MOC 목록에서 빼고 그 MOC의 연결을 다시 맞춤. 정보 dict는 남겨 둠."""
+        parent_id = self.parent_of(chapter_id)
+        siblings = self._children.get(parent_id)
+        if siblings and chapter_id in siblings:
+            siblings.remove(chapter_id)
+            self._relink(parent_id)
+        return parent_id
+
+    def set_series(self, moc_id, moc_title, chapter_ids):
+        """MOC 하나의 회차 목록을 통째로 바꿈. 다른 MOC에 있던 회차는 이 MOC로 옮겨짐."""
+        ordered = list(dict.fromkeys(chapter_id for chapter_id in chapter_ids if chapter_id and chapter_id != moc_id))
+        keep = set(ordered)
+        for chapter_id in self._children.pop(moc_id, []):
+            if chapter_id not in keep:
+                self._chapters.pop(chapter_id, None)
+                self._lower_ids = None
+        for chapter_id in ordered:
+            if chapter_id not in self._chapters:
+                self._lower_ids = None
+            elif self.parent_of(chapter_id) != moc_id:
+                self._detach(chapter_id)
+        if ordered:
+            self._children[moc_id] = ordered
+        self._relink(moc_id, moc_title)
+
+    def add_chapter(self, moc_id, moc_title, chapter_id, at_front=True, **extra):
+        """회차 하나를 MOC 목록 맨 앞(또는 맨 뒤)에 추가"""
+        chapter_ids = [existing for existing in self._children.get(moc_id, []) if existing != chapter_id]
+        if at_front:
+            chapter_ids.insert(0, chapter_id)
+        else:
+            chapter_ids.append(chapter_id)
+        self.set_series(moc_id, moc_title, chapter_ids)
+        self._chapters[chapter_id].update(extra)
+
+    def remove_chapter(self, chapter_id):
+        """회차를 빼고 앞뒤 회차를 서로 잇게 함. 빠진 회차의 정보를 돌려줌 (없으면 None)."""
+        if chapter_id not in self._chapters:
+            return None
+        self._detach(chapter_id)
+        self._lower_ids = None
+        return self._chapters.pop(chapter_id)
+
+    def remove_moc(self, moc_id):
+        self._mocs.pop(moc_id, None)
+        for chapter_id in self._children.pop(moc_id, []):
+            self._chapters.pop(chapter_id, None)
+        self._lower_ids = None
+
+    def rename_moc(self, moc_id, moc_title):
+        """MOC 제목만 바뀐 경우 회차들의 parent_moc_title만 고침. 바뀌었으면 True."""
+        state = self._mocs.get(moc_id)
+        if state is None or state.get('title') == moc_title:
+            return False
+        state['title'] = moc_title
+        self._relink(moc_id, moc_title)
+        return True
+
+    def _apply_links(self, moc_id, moc_title, resolve_id):
+        chapter_ids = [resolve_id(title) for title in self._mocs[moc_id]['links']]
+        # 다른 MOC에 이미 속한 회차는 그대로 둠 (여러 MOC가 같은 문서를 링크해도 결과가 번갈아 바뀌지 않도록)
+        chapter_ids = [chapter_id for chapter_id in dict.fromkeys(chapter_ids)
+                       if chapter_id and chapter_id != moc_id and self.parent_of(chapter_id) in (None, moc_id)]
+        if chapter_ids == list(self._children.get(moc_id, ())):
+            return False
+        self.set_series(moc_id, moc_title, chapter_ids)
+        return True
+
+    def update_moc(self, moc_id, moc_title, content, resolve_id):
+        """MOC 본문이 지난번 파싱 때와 다르면 회차 링크를 다시 파싱해 이 MOC의 회차만 갱신.
+
+        resolve_id는 제목 -> doc_id (없으면 None). 회차 구성이나 MOC 제목이 바뀌었으면 True.
+        """
+        content_hash = hashlib.sha1((content or "").encode('utf-8')).hexdigest()
+        state = self._mocs.get(moc_id)
+        if state and state.get('hash') == content_hash:
+            return self.rename_moc(moc_id, moc_title)
+        self._mocs[moc_id] = {'title': moc_title, 'hash': content_hash, 'links': LINK_PATTERN.findall(content or "")}
+        changed = self._apply_links(moc_id, moc_title, resolve_id)
+        return changed or state is None or state.get('title') != moc_title
+
+    def relink_titles(self, resolve_id, moc_ids=None):
+        """본문은 그대로지만 문서 제목이 추가/변경/삭제되었을 때, 저장된 링크 제목만 다시 매핑.
+        회차 구성이 바뀐 MOC doc_id 목록을 돌려줌."""
+        changed = []
+        for moc_id in list(self._mocs if moc_ids is None else moc_ids):
+            state = self._mocs.get(moc_id)
+            if state and self._apply_links(moc_id, state.get('title'), resolve_id):
+                changed.append(moc_id)
+        return changed
+
+
+def group_rows(rows, series, row_lookup=None):
+    """목록 표시용 [(행, 회차 행 목록 또는 None), ...].
+
+    MOC 행을 먼저 두고 각 MOC 아래에 회차 행을 MOC에 적힌 순서대로 붙이며, 시리즈에 속한 회차는
+    최상위에서 뺍니다. 회차 행은 rows에 없으면 row_lookup(doc_id)로 찾습니다.
+    시간은 rows 수와 붙이는 회차 수에 비례합니다.
+    """
+    rows_by_id = None
+    mocs = []
+    docs = []
+    for row in rows:
+        if len(row) < 3:
+            continue
+        if is_moc_row(row):
+            mocs.append(row)
+        elif series is None or series.parent_of(row[2]) is None:
+            docs.append((row, None))
+    grouped = []
+    for row in mocs:
+        chapter_rows = []
+        for chapter_id in (series.children(row[2]) if series is not None else ()):
+            chapter_row = row_lookup(chapter_id) if row_lookup else None
+            if chapter_row is None:
+                if rows_by_id is None:
+                    rows_by_id = {r[2]: r for r in rows if len(r) > 2}
+                chapter_row = rows_by_id.get(chapter_id)
+            if chapter_row:
+                chapter_rows.append(chapter_row)
+        grouped.append((row, chapter_rows))
+    grouped.extend(docs)
+    return grouped
@@ -0,0 +1,158 @@
+from core import config_manager
+
+
+class SyncEngine:
+    """Drive 변경 목록을 이용한 메모 목록 증분 동기화.
+
+    마지막 동기화 시점의 Drive changes 토큰을 기억해 두고, 그 이후 바뀐 파일만 확인합니다.
+    스프레드시트 자체가 바뀐 경우에만 A2:D를 다시 읽고, 알고 있던 목록과 비교해
+    바뀐 행만 변경 이벤트로 돌려줍니다. 토큰이 없거나 만료되면 전체 동기화로 돌아갑니다.
+
+    이 앱이 직접 시트에 쓴 뒤에도 시트 변경이 보이면 항상 A2:D를 다시 읽습니다. Drive 변경 목록은 파일의
+    마지막 상태만 알려 주므로, 다른 기기의 편집 직후에 이 앱이 쓰면 그 편집이 이 앱의 변경에 가려집니다.
+    시각 비교로는 이를 구분할 수 없고(시계 차이 포함), A2:D 읽기는 작은 요청 한 번이므로 매번 다시 읽어 비교합니다.
+
+    이벤트 형식:
+        ('added', row) / ('updated', row) / ('deleted', doc_id)
+        ('content_changed', doc_id, modified_time)  # 본문만 바뀐 문서 (Drive 기준)
+
+    Google API와 상태 파일 접근은 모두 생성자 인자로 바꿔 끼울 수 있어서,
+    로컬에서 만든 가짜 변경 목록으로도 동작을 확인할 수 있습니다.
+    """
+
+    def __init__(self, spreadsheet_id=None, folder_id=None, get_start_token=None, list_changes=None,
+                 load_rows=None, doc_exists=None, load_state=None, save_state=None):
+        if None in (get_start_token, list_changes, load_rows, doc_exists):
+            from core import google_api_handler
+            get_start_token = get_start_token or google_api_handler.get_changes_start_token
+            list_changes = list_changes or google_api_handler.list_drive_changes
+            load_rows = load_rows or google_api_handler.load_memo_list
+            doc_exists = doc_exists or google_api_handler.check_doc_exists
+        self._spreadsheet_id = spreadsheet_id
+        self._folder_id = folder_id
+        self._get_start_token = get_start_token
+        self._list_changes = list_changes
+        self._load_rows = load_rows
+        self._doc_exists = doc_exists
+        self._load_state = load_state or config_manager.load_sync_state
+        self._save_state = save_state or config_manager.save_sync_state
+
+    @property
+    def spreadsheet_id(self):
+        # 설정 창에서 바뀔 수 있으므로 매번 설정을 읽음
+        return self._spreadsheet_id or config_manager.get_setting('Google', 'spreadsheet_id')
+
+    @property
+    def folder_id(self):
+        return self._folder_id or config_manager.get_setting('Google', 'folder_id')
+
+    def _stored_token(self):
+        state = self._load_state() or {}
+        # 스프레드시트가 바뀌었으면 이전 토큰은 쓸 수 없음
+        if state.get('spreadsheet_id') != self.spreadsheet_id:
+            return None
+        return state.get('page_token')
+
+    def _store_token(self, token):
+        if token:
+            self._save_state({'spreadsheet_id': self.spreadsheet_id, 'page_token': token})
+
+    def reset(self):
+        # 다음 동기화를 전체 동기화로 강제
+        self._save_state({})
+
+    def sync(self, known_rows):
+        """known_rows(doc_id -> 행)와 비교한 동기화 결과를 돌려줌. 실패 시 None.
+
+        결과: {'full': 전체 동기화 여부, 'rows': 전체 동기화 시 검증된 행 목록, 'events': 이벤트 목록}
+        """
+        token = self._stored_token()
+        if not token:
+            return self.full_sync(known_rows)
+
+        changes, new_token = self._list_changes(token)
+        if changes is None:
+            print("[Sync] 변경 토큰을 사용할 수 없어 전체 동기화로 전환합니다.")
+            return self.full_sync(known_rows)
+
+        sheet_changed = False
+        removed = set()
+        modified = {}
+        for change in changes:
+            file_id = change.get('file_id')
+            if not file_id:
+                continue
+            if file_id == self.spreadsheet_id:
+                sheet_changed = True
+            elif change.get('removed'):
+                if file_id in known_rows:
+                    removed.add(file_id)
+            elif file_id in known_rows or self.folder_id in (change.get('parents') or []):
+                modified[file_id] = change.get('modified_time')
+
+        events = []
+        if sheet_changed:
+            rows = self._load_rows()
+            if rows is None:
+                return None # 토큰을 저장하지 않으므로 다음 동기화에서 다시 시도
+            for event in self._diff_rows(known_rows, rows, removed):
+                # 새로 보이는 행만 실제 문서가 있는지 확인 (전체 행을 다시 확인하지 않음)
+                if event[0] == 'added' and not self._doc_exists(event[1][2]):
+                    print(f"[Sync] 구글 시트의 문서 ID({event[1][2]})가 실제 구글 드라이브에 존재하지 않아 목록에서 제외합니다: {event[1][0]}")
+                    continue
+                events.append(event)
+        deleted_ids = {event[1] for event in events if event[0] == 'deleted'}
+        for doc_id in removed:
+            if doc_id not in deleted_ids:
+                events.append(('deleted', doc_id))
+        for doc_id, modified_time in modified.items():
+            if doc_id not in removed:
+                events.append(('content_changed', doc_id, modified_time))
+
+        self._store_token(new_token)
+        print(f"[Sync] 변경 {len(changes)}건 확인, 이벤트 {len(events)}건 (시트 재로딩: {sheet_changed})")
+        return {'full': False, 'rows': None, 'events': events}
+
+    def full_sync(self, known_rows):
+        # 목록을 읽기 전에 토큰을 받아 두어야 그 사이의 변경을 놓치지 않음
+        token = self._get_start_token()
+        rows = self._load_rows()
+        if rows is None:
+            return None
+
+        # 시트에 있는 ID가 실제 Drive에 존재하는지 확인
+        validated_rows = []
+        for row in rows:
+            if len(row) > 2 and row[2]:
+                if self._doc_exists(row[2]):
+                    validated_rows.append(row)
+                else:
+                    print(f"[Sync] 구글 시트의 문서 ID({row[2]})가 실제 구글 드라이브에 존재하지 않아 목록에서 제외합니다: {row[0]}")
+            else:
+                print(f"[Sync] 구글 시트의 행에 문서 ID가 없어 제외합니다: {row}")
+
+        events = self._diff_rows(known_rows, validated_rows, set())
+        self._store_token(token)
+        return {'full': True, 'rows': validated_rows, 'events': events}
+
+    def _diff_rows(self, known_rows, rows, removed):
+        events = []
+        seen = set()
+        for row in rows:
+            if len(row) < 3 or not row[2]:
+                continue
+            doc_id = row[2]
+            if doc_id in seen or doc_id in removed:
+                continue
+            seen.add(doc_id)
+            row = list(row[:4]) + [""] * (4 - len(row[:4]))
+            old_row = known_rows.get(doc_id)
+            if old_row is None:
+                events.append(('added', row))
+            elif list(old_row[:4]) != row:
+                events.append(('updated', row))
+        # 동기화 시작 시점에 알고 있던 행만 삭제 대상 (그 사이 새로 저장된 메모는 유지)
+        for doc_id in known_rows:
+            if doc_id not in seen:
+                events.append(('deleted', doc_id))
+        return events
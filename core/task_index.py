@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime
+
+from core import config_manager, content_cache
+
+# 마감일 패턴: @YYYY-MM-DD 또는 @YYYY-MM-DD HH:MM
+DEADLINE_PATTERN = re.compile(r'@(\d{4}-\d{2}-\d{2}(?:\s\d{2}:\d{2})?)')
+# 우선순위 패턴: !p1, !p2, !p3 등
+PRIORITY_PATTERN = re.compile(r'!p([1-5])')
+
+
+def parse_deadline(deadline_str):
+    """마감일 문자열을 타임스탬프로. 시간이 없으면 그날 23:59:59. 형식 오류면 None."""
+    if not deadline_str:
+        return None
+    try:
+        if ':' in deadline_str:
+            return datetime.strptime(deadline_str, "%Y-%m-%d %H:%M").timestamp()
+        return datetime.strptime(deadline_str, "%Y-%m-%d").replace(hour=23, minute=59, second=59).timestamp()
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def extract_tasks(content):
+    """본문에서 체크리스트 항목을 추출. 각 항목은 줄 번호(line_no)를 포함."""
+    tasks = []
+    for line_no, line in enumerate(content.split('\n')):
+        stripped_line = line.strip()
+        if not stripped_line.startswith(("- [ ] ", "- [x] ")):
+            continue
+        is_checked = stripped_line.startswith("- [x] ")
+        task_text = stripped_line[5:].strip()
+
+        deadline_str = None
+        priority_val = None
+
+        deadline_match = DEADLINE_PATTERN.search(task_text)
+        if deadline_match:
+            deadline_str = deadline_match.group(1)
+            task_text = task_text.replace(deadline_match.group(0), '').strip()
+
+        priority_match = PRIORITY_PATTERN.search(task_text)
+        if priority_match:
+            priority_val = int(priority_match.group(1))
+            task_text = task_text.replace(priority_match.group(0), '').strip()
+
+        tasks.append({
+            'line_text': task_text,          # 순수 할 일 텍스트
+            'original_line': stripped_line,
+            'is_checked': is_checked,
+            'deadline': deadline_str,        # @ 파싱 결과 (문자열)
+            'deadline_ts': parse_deadline(deadline_str),
+            'priority': priority_val,        # !p 파싱 결과 (숫자)
+            'line_no': line_no,
+        })
+    return tasks
+
+
+class TaskIndex:
+    """문서별로 추출한 할 일 목록을 디스크에 보관하는 인덱스.
+
+    항목은 doc_id -> {'hash': 본문 해시, 'sig': .txt 캐시의 (mtime, 크기), 'source_memo', 'tasks'}.
+    .txt 캐시의 mtime/크기가 그대로면 파일을 읽지 않고, 읽더라도 해시가 같으면 다시 파싱하지 않습니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or config_manager.TASK_INDEX_FILE
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = data
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"할 일 인덱스 로드 실패: {e}")
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._entries, ensure_ascii=False)
+            self._dirty = False
+        directory = os.path.dirname(self.path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".task_index.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"할 일 인덱스 저장 실패: {e}")
+
+    @staticmethod
+    def cache_signature(doc_id):
+        cache_path = content_cache.get_content_cache().path(doc_id, 'txt')
+        try:
+            stat = os.stat(cache_path)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def is_fresh(self, doc_id, signature):
+        """인덱스 항목을 그대로 써도 되는지. .txt 캐시가 없으면(삭제/정리) 기존 항목을 신뢰."""
+        entry = self._entries.get(doc_id)
+        if entry is None:
+            return False
+        return signature is None or entry.get('sig') == signature
+
+    def update(self, doc_id, content, source_memo, signature=None):
+        """본문 해시가 바뀐 경우에만 다시 파싱. 파싱했으면 True."""
+        content_hash = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        with self._lock:
+            entry = self._entries.get(doc_id)
+            if entry and entry.get('hash') == content_hash:
+                if entry.get('sig') != signature or entry.get('source_memo') != source_memo:
+                    entry['sig'] = signature
+                    entry['source_memo'] = source_memo
+                    self._dirty = True
+                return False
+            self._entries[doc_id] = {'hash': content_hash, 'sig': signature,
+                                     'source_memo': source_memo, 'tasks': extract_tasks(content)}
+            self._dirty = True
+            return True
+
+    def set_source_memo(self, doc_id, source_memo):
+        with self._lock:
+            entry = self._entries.get(doc_id)
+            if entry and entry.get('source_memo') != source_memo:
+                entry['source_memo'] = source_memo
+                self._dirty = True
+
+    def invalidate(self, doc_id):
+        # 본문이 바뀐 것이 확실할 때 (원격 수정 등) 항목을 버림
+        with self._lock:
+            if self._entries.pop(doc_id, None) is not None:
+                self._dirty = True
+
+    def prune(self, valid_ids):
+        with self._lock:
+            stale = [doc_id for doc_id in self._entries if doc_id not in valid_ids]
+            for doc_id in stale:
+                del self._entries[doc_id]
+            if stale:
+                self._dirty = True
+
+    def all_tasks(self, doc_ids=None):
+        """대시보드용 할 일 목록. doc_ids를 주면 그 순서대로."""
+        with self._lock:
+            order = doc_ids if doc_ids is not None else list(self._entries)
+            tasks = []
+            for doc_id in order:
+                entry = self._entries.get(doc_id)
+                if not entry:
+                    continue
+                for task in entry['tasks']:
+                    task = dict(task)
+                    task['doc_id'] = doc_id
+                    task['source_memo'] = entry['source_memo']
+                    tasks.append(task)
+            return tasks